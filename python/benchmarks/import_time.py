@@ -0,0 +1,70 @@
+"""Measures the time taken to import `rmt` on a fresh interpreter.
+
+Each statement below is run on a new process, so that nothing is cached in
+`sys.modules`. Exits with a non-zero status if importing model types loads
+any of `HEAVY_MODULES`, so it may be used to guard against regressions. Run
+from the `python` directory with:
+
+    python -m benchmarks.import_time
+"""
+
+import json
+import subprocess
+import sys
+
+STATEMENTS = [
+    'import rmt',
+    'from rmt import Tick, Bar, Order, Instrument',
+    'from rmt import Exchange, Strategy',
+    'from rmt.exchanges import MetaTrader4'
+]
+
+HEAVY_MODULES = ['zmq', 'PyQt5']
+
+# Statements which must not import any of `HEAVY_MODULES`.
+LIGHT_STATEMENTS = STATEMENTS[:3]
+
+REPEAT = 5
+
+PROBE = '''
+import json, sys, time
+start = time.perf_counter()
+%s
+elapsed = time.perf_counter() - start
+print(json.dumps([elapsed, [m for m in %r if m in sys.modules]]))
+'''
+
+def measure(statement: str):
+    """Returns the best time, in milliseconds, and the heavy modules loaded by `statement`."""
+
+    best_time = float('inf')
+    loaded    = []
+
+    for _ in range(REPEAT):
+        output = subprocess.check_output([sys.executable, '-c', PROBE % (statement, HEAVY_MODULES)])
+        elapsed, loaded = json.loads(output)
+        best_time = min(best_time, elapsed * 1000)
+
+    return best_time, loaded
+
+def main() -> int:
+    failed = False
+
+    print('%-46s  %9s  %s' % ('statement', 'time (ms)', 'heavy modules loaded'))
+
+    for statement in STATEMENTS:
+        elapsed, loaded = measure(statement)
+
+        print('%-46s  %9.2f  %s' % (statement, elapsed, ', '.join(loaded) or '-'))
+
+        if statement in LIGHT_STATEMENTS and len(loaded) > 0:
+            failed = True
+
+    if failed:
+        print('error: model types must not import %s' % ', '.join(HEAVY_MODULES))
+        return 1
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
\ No newline at end of file
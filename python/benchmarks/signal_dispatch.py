@@ -0,0 +1,65 @@
+"""Measures the cost of dispatching a tick to 1, 10, and 100 subscribers.
+
+Compares `rmt.Signal` against `pyqtSignal`, if PyQt5 is installed. Run from
+the `python` directory with:
+
+    python -m benchmarks.signal_dispatch
+"""
+
+import timeit
+from datetime import datetime
+from rmt      import Signal, Tick
+
+SUBSCRIBER_COUNTS = [1, 10, 100]
+EMISSIONS         = 100000
+
+class PlainEmitter:
+    tick_received = Signal(str, Tick)
+
+def make_qt_emitter():
+    try:
+        from PyQt5.QtCore import QObject, pyqtSignal
+    except ImportError:
+        return None
+
+    class QtEmitter(QObject):
+        tick_received = pyqtSignal(str, Tick)
+
+    return QtEmitter()
+
+def measure(emitter, subscribers: int) -> float:
+    """Returns the time, in microseconds, taken by each emission."""
+
+    received = [0]
+
+    def on_tick(symbol: str, tick: Tick):
+        received[0] += 1
+
+    for _ in range(subscribers):
+        emitter.tick_received.connect(on_tick)
+
+    tick = Tick(datetime.now(), 1.1000, 1.1002)
+    emit = emitter.tick_received.emit
+
+    seconds = min(timeit.repeat(lambda: emit('EURUSD', tick), number=EMISSIONS, repeat=3))
+
+    assert received[0] == subscribers * EMISSIONS * 3
+
+    return seconds / EMISSIONS * 1e6
+
+def main():
+    print('%-11s  %12s  %12s' % ('subscribers', 'rmt (us)', 'PyQt5 (us)'))
+
+    for subscribers in SUBSCRIBER_COUNTS:
+        plain_cost = measure(PlainEmitter(), subscribers)
+        qt_emitter = make_qt_emitter()
+
+        if qt_emitter is None:
+            qt_cost = 'n/a'
+        else:
+            qt_cost = '%.3f' % measure(qt_emitter, subscribers)
+
+        print('%-11d  %12.3f  %12s' % (subscribers, plain_cost, qt_cost))
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
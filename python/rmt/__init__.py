@@ -1,10 +1,76 @@
-from .           import error
-from .           import jsonutil
-from .tick       import Tick
-from .instrument import Instrument
-from .order      import Side, OrderType, OrderStatus, Order
-from .bar        import Bar
-from .timeframe  import Timeframe
-from .exchange   import Exchange
-from .strategy   import Strategy
-from .           import exchanges
\ No newline at end of file
+from typing    import TYPE_CHECKING
+from .lazyutil import lazy_attributes
+
+################################################################################
+# Attributes of this package are imported on first access, so that importing
+# model types such as `Tick` or `Bar` doesn't import every module in `rmt`,
+# let alone dependencies such as ZMQ.
+#
+# The imports below are only seen by type checkers and IDEs.
+################################################################################
+if TYPE_CHECKING:
+    from .                    import error
+    from .                    import jsonutil
+    from .signal              import Signal, BoundSignal
+    from .tick                import Tick
+    from .instrument          import Instrument
+    from .order               import Side, OrderType, OrderStatus, Order
+    from .order_cache         import OrderCache
+    from .tick_router         import TickRouter
+    from .bar                 import Bar
+    from .bar_array           import BarArray
+    from .timeframe           import Timeframe
+    from .resampler           import Resampler
+    from .tick_aggregator     import TickAggregator, TickPrice
+    from .exchange            import Exchange
+    from .strategy            import Strategy
+    from .tick_ring           import TickRing
+    from .runner              import StrategyRunner, WorkerExchange
+    from .multi_exchange      import MultiExchange
+    from .consolidated_quotes import ConsolidatedQuotes
+    from .rate_limiter        import TokenBucket, RateLimiter
+    from .backtest            import BacktestExchange
+    from .optimizer           import Optimizer
+    from .profiler            import Profiler
+    from .                    import profiler
+    from .metrics             import Registry
+    from .                    import indicators
+    from .                    import exchanges
+
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    'error':              ('.error',               None),
+    'jsonutil':           ('.jsonutil',            None),
+    'Signal':             ('.signal',              'Signal'),
+    'BoundSignal':        ('.signal',              'BoundSignal'),
+    'Tick':               ('.tick',                'Tick'),
+    'Instrument':         ('.instrument',          'Instrument'),
+    'Side':               ('.order',               'Side'),
+    'OrderType':          ('.order',               'OrderType'),
+    'OrderStatus':        ('.order',               'OrderStatus'),
+    'Order':              ('.order',               'Order'),
+    'OrderCache':         ('.order_cache',         'OrderCache'),
+    'TickRouter':         ('.tick_router',         'TickRouter'),
+    'Bar':                ('.bar',                 'Bar'),
+    'BarArray':           ('.bar_array',           'BarArray'),
+    'Timeframe':          ('.timeframe',           'Timeframe'),
+    'Resampler':          ('.resampler',           'Resampler'),
+    'TickAggregator':     ('.tick_aggregator',     'TickAggregator'),
+    'TickPrice':          ('.tick_aggregator',     'TickPrice'),
+    'Exchange':           ('.exchange',            'Exchange'),
+    'Strategy':           ('.strategy',            'Strategy'),
+    'TickRing':           ('.tick_ring',           'TickRing'),
+    'StrategyRunner':     ('.runner',              'StrategyRunner'),
+    'WorkerExchange':     ('.runner',              'WorkerExchange'),
+    'MultiExchange':      ('.multi_exchange',      'MultiExchange'),
+    'ConsolidatedQuotes': ('.consolidated_quotes', 'ConsolidatedQuotes'),
+    'TokenBucket':        ('.rate_limiter',        'TokenBucket'),
+    'RateLimiter':        ('.rate_limiter',        'RateLimiter'),
+    'BacktestExchange':   ('.backtest',            'BacktestExchange'),
+    'Optimizer':          ('.optimizer',           'Optimizer'),
+    'Profiler':           ('.profiler',            'Profiler'),
+    'profiler':           ('.profiler',            None),
+    'Registry':           ('.metrics',             'Registry'),
+    'metrics':            ('.metrics',             None),
+    'indicators':         ('.indicators',          None),
+    'exchanges':          ('.exchanges',           None)
+})
\ No newline at end of file
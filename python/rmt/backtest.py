@@ -0,0 +1,621 @@
+import numpy as np
+from datetime     import datetime, timezone
+from typing       import Callable, Dict, Iterable, List, Optional, Set, Union
+from rmt          import (error, Bar, BarArray, Exchange, Order, OrderCache,
+                          OrderStatus, OrderType, Side, Tick, Timeframe)
+from .order_cache import FINAL_STATUSES
+from .resampler   import nests_in, resample
+
+Metrics = Dict[str, float]
+"""Statistics of a backtest, by name (see `BacktestExchange.metrics()`)."""
+
+_REPLAY_CHUNK_SIZE = 1 << 16
+"""Number of bars whose prices are converted to Python floats at once by `BacktestExchange.run()`."""
+
+class BacktestExchange(Exchange):
+    """Exchange which replays history bars as ticks, and simulates orders against them.
+
+    The class `BacktestExchange` lets a `Strategy` run over history bars of timeframe
+    `timeframe` without a terminal. Calling `run()` replays bars of subscribed symbols
+    in chronological order, emitting `tick_received` for each of them. If `ohlc_ticks`
+    is `False`, a single tick is emitted per bar, at its open time and open price.
+    Otherwise, four ticks are emitted at the bar's open, high, low and close prices,
+    visiting the high before the low on bearish bars and after it on bullish ones,
+    spaced by a quarter of the bar's duration.
+
+    A tick's bid is the price of the bar, and its ask is the bid plus `spread`. While
+    a bar is being replayed, only previous bars are returned by `get_history_bars()`,
+    so a strategy can't look ahead.
+
+    Bars of other timeframes, as returned by `get_history_bars()` and `get_current_bar()`,
+    are resampled from bars of `timeframe`, so only timeframes within which bars of
+    `timeframe` nest may be requested (see `resampler.nests_in()`); requesting a finer
+    timeframe raises a `ValueError`. Since `Strategy` requests its closed bars as M1
+    bars, strategies must be backtested over bars of timeframe M1.
+
+    Orders are simulated as follows:
+
+      - Market orders are filled at once, at the ask for buys and the bid for sells.
+        Their `price` and `slippage` are ignored.
+      - Pending orders require a `price`, and are filled at market price once the
+        market reaches it, or expire at their expiration time.
+      - Filled orders are closed at market price once the market reaches their stop
+        loss or take profit level, or by `close_order()`.
+
+    The profit of an order is its price difference times its lots times `contract_size`.
+    Commissions and swaps are not simulated.
+    """
+
+    def __init__(self,
+                 bars:          Dict[str, BarArray],
+                 timeframe:     Timeframe = Timeframe.M1,
+                 spread:        float     = 0.0,
+                 contract_size: float     = 1.0,
+                 ohlc_ticks:    bool      = False
+    ):
+        super().__init__()
+
+        self._bars          = bars
+        self._timeframe     = timeframe
+        self._spread        = spread
+        self._contract_size = contract_size
+        self._ohlc_ticks    = ohlc_ticks
+
+        self._subscribed_symbols: Set[str] = set()
+        self._now: Optional[datetime] = None
+
+        # Index of the bar being replayed of each symbol. Bars before it are closed.
+        self._bar_indices: Dict[str, int] = {}
+
+        # Last tick of each symbol, and its current bar made of the ticks replayed so far.
+        self._ticks:        Dict[str, Tick] = {}
+        self._current_bars: Dict[str, Bar]  = {}
+
+        self._orders      = OrderCache()
+        self._next_ticket = 1
+
+        # Pending and filled orders of each symbol, which ticks may fill or close.
+        self._active_orders: Dict[str, Dict[int, Order]] = {}
+
+        self._balance      = 0.0
+        self._equity_peak  = 0.0
+        self._max_drawdown = 0.0
+        self._trade_count  = 0
+        self._win_count    = 0
+        self._gross_profit = 0.0
+        self._gross_loss   = 0.0
+        self._bar_count    = 0
+
+    @property
+    def now(self) -> Optional[datetime]:
+        """Time of the last tick replayed, or `None` if no tick was replayed yet."""
+
+        return self._now
+
+    def run(self,
+            start_time:     Optional[datetime]                  = None,
+            end_time:       Optional[datetime]                  = None,
+            stop_condition: Optional[Callable[[Metrics], bool]] = None,
+            check_every:    int                                 = 1000
+    ) -> bool:
+        """Replays bars of subscribed symbols whose open time is between `start_time` and `end_time`.
+
+        If `stop_condition` is given, it's called with `metrics()` once every
+        `check_every` bars, and the replay stops as soon as it returns `True`.
+        Returns whether the replay was stopped by `stop_condition`.
+        """
+
+        symbols = sorted(self._subscribed_symbols)
+
+        if len(symbols) == 0:
+            return False
+
+        times:      List[np.ndarray] = []
+        symbol_ids: List[np.ndarray] = []
+        indices:    List[np.ndarray] = []
+
+        for symbol_id, symbol in enumerate(symbols):
+            bar_times = self._bars[symbol].time
+            first     = 0 if start_time is None else np.searchsorted(bar_times, _to_datetime64(start_time), 'left')
+            last      = len(bar_times) if end_time is None else np.searchsorted(bar_times, _to_datetime64(end_time), 'right')
+
+            times.append(bar_times[first:last].astype(np.int64))
+            symbol_ids.append(np.full(last - first, symbol_id))
+            indices.append(np.arange(first, last))
+
+        all_times      = np.concatenate(times)
+        all_symbol_ids = np.concatenate(symbol_ids)
+        all_indices    = np.concatenate(indices)
+
+        # A stable sort keeps bars of the same time in the order of `symbols`.
+        order = np.argsort(all_times, kind='stable')
+
+        for chunk_start in range(0, len(order), _REPLAY_CHUNK_SIZE):
+            chunk         = order[chunk_start:chunk_start + _REPLAY_CHUNK_SIZE]
+            chunk_indices = all_indices[chunk]
+            chunk_symbols = all_symbol_ids[chunk]
+            prices        = np.empty((len(chunk), 4))
+
+            for symbol_id, symbol in enumerate(symbols):
+                mask = chunk_symbols == symbol_id
+                bars = self._bars[symbol]
+                rows = chunk_indices[mask]
+
+                prices[mask, 0] = bars.open[rows]
+                prices[mask, 1] = bars.high[rows]
+                prices[mask, 2] = bars.low[rows]
+                prices[mask, 3] = bars.close[rows]
+
+            for time, symbol_id, index, bar_prices in zip(all_times[chunk].tolist(),
+                                                          chunk_symbols.tolist(),
+                                                          chunk_indices.tolist(),
+                                                          prices.tolist()):
+                self._replay_bar(symbols[symbol_id], index, time, *bar_prices)
+
+                if (stop_condition is not None
+                    and self._bar_count % check_every == 0
+                    and stop_condition(self.metrics())
+                ):
+                    return True
+
+        return False
+
+    def metrics(self) -> Metrics:
+        """Returns statistics of the orders closed and the bars replayed so far.
+
+        The statistics are:
+
+            net_profit:    total profit of closed orders
+            equity:        net profit plus the profit of filled orders if closed now
+            max_drawdown:  largest drop of equity from a previous peak, after any bar
+            trades:        number of closed orders
+            win_rate:      fraction of closed orders with a positive profit
+            profit_factor: total profit of winning orders over total loss of losing ones
+            bars:          number of bars replayed
+        """
+
+        if self._gross_loss > 0:
+            profit_factor = self._gross_profit / self._gross_loss
+        else:
+            profit_factor = float('inf') if self._gross_profit > 0 else 0.0
+
+        return {
+            'net_profit':    self._balance,
+            'equity':        self._equity(),
+            'max_drawdown':  self._max_drawdown,
+            'trades':        self._trade_count,
+            'win_rate':      self._win_count / self._trade_count if self._trade_count > 0 else 0.0,
+            'profit_factor': profit_factor,
+            'bars':          self._bar_count
+        }
+
+    def get_tick(self, symbol: str) -> Tick:
+        tick = self._ticks.get(symbol)
+
+        if tick is None:
+            raise error.ExecutionError("no ticks of symbol '%s' were replayed" % symbol)
+
+        return tick
+
+    def get_history_bars(self,
+                         symbol:     str,
+                         start_time: Optional[datetime] = None,
+                         end_time:   Optional[datetime] = None,
+                         timeframe:  Timeframe = Timeframe.M1
+    ) -> List[Bar]:
+        self._check_timeframe(timeframe)
+
+        bars = self._closed_bars_of(symbol)
+
+        if timeframe != self._timeframe:
+            bars = resample(bars, timeframe)
+
+        first = 0         if start_time is None else np.searchsorted(bars.time, _to_datetime64(start_time), 'left')
+        last  = len(bars) if end_time   is None else np.searchsorted(bars.time, _to_datetime64(end_time),   'right')
+
+        return bars[first:last].to_bars()
+
+    def get_current_bar(self,
+                        symbol:    str,
+                        timeframe: Timeframe = Timeframe.M1
+    ) -> Bar:
+        self._check_timeframe(timeframe)
+
+        current = self._current_bars.get(symbol)
+
+        if current is None:
+            raise error.ExecutionError("no ticks of symbol '%s' were replayed" % symbol)
+
+        if timeframe == self._timeframe:
+            return current
+
+        # Merge the closed bars within the current bar of `timeframe` into the current bar.
+        bar_time = timeframe.bar_time(current.time)
+        bars     = self._closed_bars_of(symbol)
+        first    = np.searchsorted(bars.time, _to_datetime64(bar_time), 'left')
+        bars     = bars[first:]
+
+        if len(bars) == 0:
+            return Bar(bar_time, current.open, current.high, current.low, current.close, current.volume)
+
+        return Bar(
+            bar_time,
+            bars.open[0],
+            max(bars.high.max(), current.high),
+            min(bars.low.min(),  current.low),
+            current.close,
+            int(bars.volume.sum()) + current.volume
+        )
+
+    def subscribe(self, symbol: str):
+        if symbol not in self._bars:
+            raise error.ExecutionError("no bars of symbol '%s'" % symbol)
+
+        self._subscribed_symbols.add(symbol)
+
+    def subscribe_all(self):
+        self._subscribed_symbols.update(self._bars)
+
+    def unsubscribe(self, symbol: str):
+        self._subscribed_symbols.discard(symbol)
+
+    def unsubscribe_all(self):
+        self._subscribed_symbols.clear()
+
+    def subscriptions(self) -> Set[str]:
+        return self._subscribed_symbols.copy()
+
+    def place_order(self,
+                    symbol:       str,
+                    side:         Side,
+                    order_type:   OrderType,
+                    lots:         float,
+                    price:        Optional[float] = None,
+                    slippage:     Optional[int]   = None,
+                    stop_loss:    Optional[float] = None,
+                    take_profit:  Optional[float] = None,
+                    comment:      str = '',
+                    magic_number: int = 0,
+                    expiration:   Optional[datetime] = None
+    ) -> int:
+        if lots <= 0:
+            raise ValueError('lots must be positive (got: %s)' % lots)
+
+        tick = self.get_tick(symbol)
+
+        if order_type == OrderType.MARKET_ORDER:
+            status     = OrderStatus.FILLED
+            open_price = tick.ask if side == Side.BUY else tick.bid
+        elif price is None:
+            raise ValueError('price of pending orders must be given')
+        else:
+            status     = OrderStatus.PENDING
+            open_price = price
+
+        order = Order(
+            symbol       = symbol,
+            side         = side,
+            type         = order_type,
+            lots         = lots,
+            status       = status,
+            open_price   = open_price,
+            open_time    = self._now,
+            stop_loss    = stop_loss,
+            take_profit  = take_profit,
+            expiration   = expiration,
+            magic_number = magic_number,
+            comment      = comment
+        )
+
+        ticket = self._new_ticket()
+        self._set_order(ticket, order)
+
+        if status == OrderStatus.FILLED:
+            self.order_filled.emit(order)
+        else:
+            self.order_placed.emit(order)
+
+        return ticket
+
+    def modify_order(self,
+                     ticket:      int,
+                     stop_loss:   Optional[float]    = None,
+                     take_profit: Optional[float]    = None,
+                     price:       Optional[float]    = None,
+                     expiration:  Optional[datetime] = None
+    ):
+        order = self.get_order(ticket)
+
+        if order.status() not in (OrderStatus.PENDING, OrderStatus.FILLED):
+            raise error.ExecutionError('order %s is %s, and may not be modified' % (ticket, order.status().name))
+
+        if price is not None and order.status() != OrderStatus.PENDING:
+            raise error.ExecutionError('price of order %s may not be modified, since it was filled' % ticket)
+
+        changes = {}
+
+        if stop_loss is not None:
+            changes['stop_loss'] = stop_loss
+
+        if take_profit is not None:
+            changes['take_profit'] = take_profit
+
+        if price is not None:
+            changes['open_price'] = price
+
+        if expiration is not None:
+            changes['expiration'] = expiration
+
+        self._set_order(ticket, _updated_order(order, **changes))
+
+    def close_order(self,
+                    ticket:   int,
+                    price:    Optional[float] = None,
+                    slippage: int             = 0,
+                    lots:     Optional[float] = None
+    ) -> int:
+        order  = self.get_order(ticket)
+        status = order.status()
+
+        if status in FINAL_STATUSES:
+            return ticket
+
+        if status == OrderStatus.PENDING:
+            raise error.ExecutionError('order %s is pending, and may not be closed' % ticket)
+
+        tick = self.get_tick(order.symbol())
+
+        return self._close(ticket, order, tick.bid if order.side() == Side.BUY else tick.ask, lots)
+
+    def get_order(self, ticket: int) -> Order:
+        order = self._orders.get(ticket)
+
+        if order is None:
+            raise error.ExecutionError('order %s not found' % ticket)
+
+        return order
+
+    def get_orders(self,
+                   symbol:       Optional[str]      = None,
+                   magic_number: Optional[int]      = None,
+                   start_time:   Optional[datetime] = None,
+                   end_time:     Optional[datetime] = None,
+                   history:      bool               = False
+    ) -> Dict[int, Order]:
+        orders = {}
+
+        for ticket, order in self._orders.items():
+            if (order.status() in FINAL_STATUSES) != history:
+                continue
+
+            if symbol is not None and order.symbol() != symbol:
+                continue
+
+            if magic_number is not None and order.magic_number() != magic_number:
+                continue
+
+            time = order.close_time() if history else order.open_time()
+
+            if start_time is not None and time < start_time:
+                continue
+
+            if end_time is not None and time > end_time:
+                continue
+
+            orders[ticket] = order
+
+        return orders
+
+    def orders(self) -> Dict[int, Order]:
+        return self._orders.to_dict()
+
+    def find_orders(self,
+                    symbol:       Optional[str]  = None,
+                    side:         Optional[Side] = None,
+                    magic_number: Optional[int]  = None,
+                    status:       Union[None, OrderStatus, Iterable[OrderStatus]] = None
+    ) -> Dict[int, Order]:
+        return self._orders.find(symbol, side, magic_number, status)
+
+    def process_events(self):
+        # Ticks are emitted by `run()`.
+        pass
+
+    #===============================================================================
+    # Internals
+    #===============================================================================
+    def _replay_bar(self, symbol: str, index: int, time: int, open: float, high: float, low: float, close: float):
+        self._bar_indices[symbol] = index
+
+        bar_time = datetime.fromtimestamp(time, timezone.utc)
+
+        if not self._ohlc_ticks:
+            self._current_bars[symbol] = Bar(bar_time, open, open, open, open, 1)
+            self._replay_tick(symbol, bar_time, open)
+        else:
+            quarter = self._timeframe.duration / 4
+            prices  = (open, low, high, close) if close >= open else (open, high, low, close)
+
+            self._current_bars[symbol] = Bar(bar_time, open, open, open, open, 1)
+            self._replay_tick(symbol, bar_time, open)
+
+            for i, price in enumerate(prices[1:], 1):
+                current = self._current_bars[symbol]
+
+                self._current_bars[symbol] = Bar(
+                    bar_time,
+                    open,
+                    max(current.high, price),
+                    min(current.low,  price),
+                    price,
+                    current.volume + 1
+                )
+                self._replay_tick(symbol, bar_time + i * quarter, price)
+
+        self._bar_count += 1
+
+        equity = self._equity()
+
+        self._equity_peak  = max(self._equity_peak, equity)
+        self._max_drawdown = max(self._max_drawdown, self._equity_peak - equity)
+
+    def _replay_tick(self, symbol: str, time: datetime, bid: float):
+        tick = Tick(time, bid, bid + self._spread)
+
+        self._now           = time
+        self._ticks[symbol] = tick
+
+        self._execute_orders(symbol, tick)
+        self.tick_received.emit(symbol, tick)
+
+    def _execute_orders(self, symbol: str, tick: Tick):
+        active_orders = self._active_orders.get(symbol)
+
+        if not active_orders:
+            return
+
+        for ticket, order in list(active_orders.items()):
+            if order.status() == OrderStatus.PENDING:
+                self._execute_pending_order(ticket, order, tick)
+            else:
+                self._execute_filled_order(ticket, order, tick)
+
+    def _execute_pending_order(self, ticket: int, order: Order, tick: Tick):
+        if order.expiration() is not None and tick.server_time >= order.expiration():
+            expired_order = _updated_order(order, status=OrderStatus.EXPIRED, close_time=tick.server_time)
+
+            self._set_order(ticket, expired_order)
+            self.order_expired.emit(expired_order)
+            return
+
+        price = order.open_price()
+
+        if order.side() == Side.BUY:
+            market_price = tick.ask
+            reached      = market_price <= price if order.type() == OrderType.LIMIT_ORDER else market_price >= price
+        else:
+            market_price = tick.bid
+            reached      = market_price >= price if order.type() == OrderType.LIMIT_ORDER else market_price <= price
+
+        if reached:
+            filled_order = _updated_order(
+                order,
+                status     = OrderStatus.FILLED,
+                open_price = market_price,
+                open_time  = tick.server_time
+            )
+
+            self._set_order(ticket, filled_order)
+            self.order_filled.emit(filled_order)
+
+    def _execute_filled_order(self, ticket: int, order: Order, tick: Tick):
+        stop_loss   = order.stop_loss()
+        take_profit = order.take_profit()
+
+        if order.side() == Side.BUY:
+            price = tick.bid
+            hit   = (stop_loss is not None and price <= stop_loss) or (take_profit is not None and price >= take_profit)
+        else:
+            price = tick.ask
+            hit   = (stop_loss is not None and price >= stop_loss) or (take_profit is not None and price <= take_profit)
+
+        if hit:
+            self._close(ticket, order, price)
+
+    def _close(self, ticket: int, order: Order, price: float, lots: Optional[float] = None) -> int:
+        """Closes `lots` of a filled order at `price`, and returns the ticket of the order left open, if any."""
+
+        if lots is None or lots >= order.lots():
+            lots = order.lots()
+
+        profit = self._profit(order, price, lots)
+
+        closed_order = _updated_order(
+            order,
+            status      = OrderStatus.CLOSED,
+            lots        = lots,
+            close_price = price,
+            close_time  = self._now,
+            profit      = profit
+        )
+
+        self._set_order(ticket, closed_order)
+
+        self._balance     += profit
+        self._trade_count += 1
+
+        if profit > 0:
+            self._win_count    += 1
+            self._gross_profit += profit
+        else:
+            self._gross_loss -= profit
+
+        # A partial close leaves the remaining lots in a new order.
+        if lots < order.lots():
+            ticket = self._new_ticket()
+            self._set_order(ticket, _updated_order(order, lots=order.lots() - lots))
+
+        self.order_closed.emit(closed_order)
+
+        return ticket
+
+    def _profit(self, order: Order, close_price: float, lots: float) -> float:
+        difference = close_price - order.open_price()
+
+        if order.side() == Side.SELL:
+            difference = -difference
+
+        return difference * lots * self._contract_size
+
+    def _equity(self) -> float:
+        equity = self._balance
+
+        for symbol, active_orders in self._active_orders.items():
+            tick = self._ticks[symbol]
+
+            for order in active_orders.values():
+                if order.status() == OrderStatus.FILLED:
+                    equity += self._profit(order, tick.bid if order.side() == Side.BUY else tick.ask, order.lots())
+
+        return equity
+
+    def _new_ticket(self) -> int:
+        ticket = self._next_ticket
+        self._next_ticket += 1
+
+        return ticket
+
+    def _set_order(self, ticket: int, order: Order):
+        self._orders.set(ticket, order)
+
+        active_orders = self._active_orders.setdefault(order.symbol(), {})
+
+        if order.status() in (OrderStatus.PENDING, OrderStatus.FILLED):
+            active_orders[ticket] = order
+        else:
+            active_orders.pop(ticket, None)
+
+    def _check_timeframe(self, timeframe: Timeframe):
+        if not nests_in(self._timeframe, timeframe):
+            raise ValueError(
+                'bars of timeframe %s cannot be made of bars of timeframe %s' % (timeframe.name, self._timeframe.name)
+            )
+
+    def _closed_bars_of(self, symbol: str) -> BarArray:
+        bars = self._bars.get(symbol)
+
+        if bars is None:
+            raise error.ExecutionError("no bars of symbol '%s'" % symbol)
+
+        return bars[:self._bar_indices.get(symbol, 0)]
+
+def _updated_order(order: Order, **changes) -> Order:
+    """Returns a copy of `order` with the properties in `changes` replaced."""
+
+    properties = {name[1:]: value for name, value in vars(order).items()}
+    properties.update(changes)
+
+    return Order(**properties)
+
+def _to_datetime64(time: datetime) -> np.datetime64:
+    return np.datetime64(int(time.timestamp()), 's')
\ No newline at end of file
@@ -0,0 +1,131 @@
+import numpy as np
+from datetime import datetime, timezone
+from typing   import Iterable, List, Optional, Union
+from rmt      import Bar
+
+class BarArray:
+    """Bars stored column-wise in NumPy arrays, for vectorized computations.
+
+    Times are stored as `datetime64[s]` values in UTC, and prices and volumes as
+    `float64` and `int64` values. Indexing a bar array with a slice or a mask
+    returns another bar array, and indexing it with an integer returns a `Bar`.
+    """
+
+    __slots__ = ('_time', '_open', '_high', '_low', '_close', '_volume')
+
+    def __init__(self,
+                 time:   np.ndarray,
+                 open:   np.ndarray,
+                 high:   np.ndarray,
+                 low:    np.ndarray,
+                 close:  np.ndarray,
+                 volume: Optional[np.ndarray] = None
+    ):
+        self._time  = np.asarray(time,  dtype='datetime64[s]')
+        self._open  = np.asarray(open,  dtype=np.float64)
+        self._high  = np.asarray(high,  dtype=np.float64)
+        self._low   = np.asarray(low,   dtype=np.float64)
+        self._close = np.asarray(close, dtype=np.float64)
+
+        if volume is None:
+            self._volume = np.zeros(len(self._time), dtype=np.int64)
+        else:
+            self._volume = np.asarray(volume, dtype=np.int64)
+
+        length = len(self._time)
+
+        if any(len(a) != length for a in (self._open, self._high, self._low, self._close, self._volume)):
+            raise ValueError('arrays of bar times, prices and volumes must have the same length')
+
+    @staticmethod
+    def from_bars(bars: Iterable[Bar]) -> 'BarArray':
+        """Returns an array of `bars`, such as those returned by `Exchange.get_history_bars()`."""
+
+        bars = list(bars)
+
+        return BarArray(
+            time   = np.array([int(bar.time.timestamp()) for bar in bars], dtype=np.int64).astype('datetime64[s]'),
+            open   = np.array([bar.open   for bar in bars], dtype=np.float64),
+            high   = np.array([bar.high   for bar in bars], dtype=np.float64),
+            low    = np.array([bar.low    for bar in bars], dtype=np.float64),
+            close  = np.array([bar.close  for bar in bars], dtype=np.float64),
+            volume = np.array([bar.volume for bar in bars], dtype=np.int64)
+        )
+
+    @staticmethod
+    def empty() -> 'BarArray':
+        return BarArray(np.empty(0, dtype='datetime64[s]'), [], [], [], [], [])
+
+    @staticmethod
+    def concatenate(arrays: Iterable['BarArray']) -> 'BarArray':
+        arrays = list(arrays)
+
+        if len(arrays) == 0:
+            return BarArray.empty()
+
+        return BarArray(
+            time   = np.concatenate([a.time   for a in arrays]),
+            open   = np.concatenate([a.open   for a in arrays]),
+            high   = np.concatenate([a.high   for a in arrays]),
+            low    = np.concatenate([a.low    for a in arrays]),
+            close  = np.concatenate([a.close  for a in arrays]),
+            volume = np.concatenate([a.volume for a in arrays])
+        )
+
+    @property
+    def time(self) -> np.ndarray:
+        return self._time
+
+    @property
+    def open(self) -> np.ndarray:
+        return self._open
+
+    @property
+    def high(self) -> np.ndarray:
+        return self._high
+
+    @property
+    def low(self) -> np.ndarray:
+        return self._low
+
+    @property
+    def close(self) -> np.ndarray:
+        return self._close
+
+    @property
+    def volume(self) -> np.ndarray:
+        return self._volume
+
+    def to_bars(self) -> List[Bar]:
+        """Returns the bars of the array as `Bar` objects."""
+
+        return [self._bar(i) for i in range(len(self))]
+
+    def __len__(self) -> int:
+        return len(self._time)
+
+    def __getitem__(self, index: Union[int, slice, np.ndarray]) -> Union[Bar, 'BarArray']:
+        if isinstance(index, (int, np.integer)):
+            return self._bar(int(index))
+
+        return BarArray(
+            self._time[index],
+            self._open[index],
+            self._high[index],
+            self._low[index],
+            self._close[index],
+            self._volume[index]
+        )
+
+    #===============================================================================
+    # Internals
+    #===============================================================================
+    def _bar(self, i: int) -> Bar:
+        return Bar(
+            time   = datetime.fromtimestamp(int(self._time[i].astype(np.int64)), timezone.utc),
+            open   = self._open[i],
+            high   = self._high[i],
+            low    = self._low[i],
+            close  = self._close[i],
+            volume = self._volume[i]
+        )
\ No newline at end of file
@@ -0,0 +1,225 @@
+import threading
+from time   import monotonic
+from typing import Callable, Dict, List, Optional, Tuple
+from rmt    import Exchange, Side, Tick
+
+class _SymbolBook:
+    """Quotes of a symbol from all sources, along with the sources of the best quotes."""
+
+    __slots__ = ('ticks', 'receive_times', 'best_bid_source', 'best_ask_source', 'dirty')
+
+    def __init__(self):
+        self.ticks:         Dict[str, Tick]  = {}
+        self.receive_times: Dict[str, float] = {}
+
+        self.best_bid_source: Optional[str] = None
+        self.best_ask_source: Optional[str] = None
+
+        # Whether a best source's quote got worse, in which case another source
+        # may now have the best quote.
+        self.dirty = False
+
+class ConsolidatedQuotes:
+    """Keeps the best bid and ask of symbols quoted by several exchanges.
+
+    The class `ConsolidatedQuotes` merges ticks received from several sources,
+    usually `MetaTrader4` objects connected to different terminals or brokers,
+    into a book which holds, for each symbol, the last tick of each source and
+    which sources have the highest bid and the lowest ask.
+
+    Updating the book with a tick takes constant time: the tick is stored and,
+    if it improves on the best bid or ask, its source becomes the best one. If
+    the tick of a best source gets worse, the book is only marked for a rescan
+    of the symbol's sources, which is done on the next query.
+
+    Ticks are timestamped with the local time at which they were received, since
+    clocks of different servers may differ. If `max_age` is not `None`, a source
+    whose last tick of a symbol was received more than `max_age` seconds ago is
+    stale, and its quotes are ignored by queries until it receives another tick.
+
+    Sources may emit ticks on different threads, as the exchanges wrapped by
+    `MultiExchange` do, so the book is guarded by a lock.
+    """
+
+    def __init__(self,
+                 sources: Optional[Dict[str, Exchange]] = None,
+                 max_age: Optional[float]               = None,
+                 clock:   Callable[[], float]           = monotonic
+    ):
+        self._max_age = max_age
+        self._clock   = clock
+        self._lock    = threading.Lock()
+        self._books:  Dict[str, _SymbolBook] = {}
+        self._slots:  Dict[str, Tuple[Exchange, Callable[[str, Tick], None]]] = {}
+
+        for name, exchange in (sources or {}).items():
+            self.add_source(name, exchange)
+
+    def add_source(self, name: str, exchange: Exchange):
+        """Begins to update the book with ticks received by `exchange`."""
+
+        if name in self._slots:
+            raise ValueError("source '%s' already exists" % name)
+
+        slot = lambda symbol, tick: self.update(name, symbol, tick)
+
+        exchange.tick_received.connect(slot)
+        self._slots[name] = (exchange, slot)
+
+    def remove_source(self, name: str):
+        """Stops updating the book with ticks of a source, and removes its quotes."""
+
+        exchange, slot = self._slots.pop(name)
+        exchange.tick_received.disconnect(slot)
+
+        with self._lock:
+            now = self._clock()
+
+            for book in self._books.values():
+                if name in book.ticks:
+                    del book.ticks[name]
+                    del book.receive_times[name]
+                    self._rescan(book, now)
+
+    def update(self, source: str, symbol: str, tick: Tick):
+        """Stores the last tick of `symbol` received from `source`."""
+
+        now = self._clock()
+
+        with self._lock:
+            book = self._books.get(symbol)
+
+            if book is None:
+                book = self._books[symbol] = _SymbolBook()
+
+            # Compare the tick against the best quotes before storing it, since it may
+            # replace the tick of a best source.
+            bid_source = book.best_bid_source
+
+            if bid_source is None or tick.bid >= book.ticks[bid_source].bid:
+                book.best_bid_source = source
+            elif bid_source == source:
+                book.dirty = True
+
+            ask_source = book.best_ask_source
+
+            if ask_source is None or tick.ask <= book.ticks[ask_source].ask:
+                book.best_ask_source = source
+            elif ask_source == source:
+                book.dirty = True
+
+            book.ticks[source]         = tick
+            book.receive_times[source] = now
+
+    def get_best_tick(self, symbol: str) -> Optional[Tick]:
+        """Returns a tick made of the best bid and the best ask of a symbol among fresh sources.
+
+        The tick's server time is the most recent of the server times of the best
+        bid and ask. Returns `None` if no fresh source quotes `symbol`.
+        """
+
+        with self._lock:
+            best = self._best_sources(symbol)
+
+            if best is None:
+                return None
+
+            book = self._books[symbol]
+            bid_tick = book.ticks[best[0]]
+            ask_tick = book.ticks[best[1]]
+
+        return Tick(max(bid_tick.server_time, ask_tick.server_time), bid_tick.bid, ask_tick.ask)
+
+    def best_bid(self, symbol: str) -> Optional[Tuple[str, float]]:
+        """Returns the source with the highest bid of a symbol, and that bid."""
+
+        with self._lock:
+            best = self._best_sources(symbol)
+
+            if best is None:
+                return None
+
+            return best[0], self._books[symbol].ticks[best[0]].bid
+
+    def best_ask(self, symbol: str) -> Optional[Tuple[str, float]]:
+        """Returns the source with the lowest ask of a symbol, and that ask."""
+
+        with self._lock:
+            best = self._best_sources(symbol)
+
+            if best is None:
+                return None
+
+            return best[1], self._books[symbol].ticks[best[1]].ask
+
+    def best_source(self, symbol: str, side: Side) -> Optional[str]:
+        """Returns the source with the best price to trade a symbol on `side`.
+
+        That is, the source with the lowest ask for buying, and the source with
+        the highest bid for selling. Returns `None` if no fresh source quotes
+        `symbol`.
+        """
+
+        best = self.best_ask(symbol) if side == Side.BUY else self.best_bid(symbol)
+
+        return None if best is None else best[0]
+
+    def quotes(self, symbol: str) -> Dict[str, Tick]:
+        """Returns the last tick of a symbol received from each source, including stale ones."""
+
+        with self._lock:
+            book = self._books.get(symbol)
+
+            return {} if book is None else book.ticks.copy()
+
+    def is_stale(self, source: str, symbol: str) -> bool:
+        """Returns whether the quotes of `symbol` from `source` are stale or missing."""
+
+        with self._lock:
+            book = self._books.get(symbol)
+
+            if book is None or source not in book.receive_times:
+                return True
+
+            return self._is_stale(book, source, self._clock())
+
+    #===============================================================================
+    # Internals
+    #===============================================================================
+    def _is_stale(self, book: _SymbolBook, source: str, now: float) -> bool:
+        return self._max_age is not None and now - book.receive_times[source] > self._max_age
+
+    def _best_sources(self, symbol: str) -> Optional[Tuple[str, str]]:
+        """Returns the sources of the best bid and ask of a symbol, rescanning them if needed."""
+
+        book = self._books.get(symbol)
+
+        if book is None or book.best_bid_source is None:
+            return None
+
+        now = self._clock()
+
+        if (book.dirty
+            or self._is_stale(book, book.best_bid_source, now)
+            or self._is_stale(book, book.best_ask_source, now)
+        ):
+            self._rescan(book, now)
+
+        if book.best_bid_source is None:
+            return None
+
+        return book.best_bid_source, book.best_ask_source
+
+    def _rescan(self, book: _SymbolBook, now: float):
+        fresh_sources: List[str] = [s for s in book.ticks if not self._is_stale(book, s, now)]
+
+        if len(fresh_sources) == 0:
+            book.best_bid_source = None
+            book.best_ask_source = None
+        else:
+            book.best_bid_source = max(fresh_sources, key=lambda s: book.ticks[s].bid)
+            book.best_ask_source = min(fresh_sources, key=lambda s: book.ticks[s].ask)
+
+        # Stale sources are only excluded until they receive another tick, which
+        # `update()` compares against the best quotes found here.
+        book.dirty = False
\ No newline at end of file
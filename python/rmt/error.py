@@ -1,4 +1,4 @@
-from typing import Any, Type
+from typing import Any, Optional, Type
 
 class RMTError(Exception):
     pass
@@ -16,4 +16,8 @@ class RequestTimeout(RequestError):
     pass
 
 class ExecutionError(RMTError):
-    pass
\ No newline at end of file
+    def __init__(self, message: str = '', code: Optional[int] = None):
+        super().__init__(message)
+
+        # Result code of the failed command, if it was executed by a terminal.
+        self.code = code
\ No newline at end of file
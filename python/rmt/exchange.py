@@ -1,12 +1,12 @@
-from datetime     import datetime
-from typing       import Dict, List, Optional, Set
-from PyQt5.QtCore import QObject, pyqtSignal
-from rmt          import Side, Order, Tick, Bar, OrderType, Timeframe, Instrument, error
+from datetime import datetime
+from typing   import Dict, Iterable, List, Optional, Set, Union
+from rmt      import Side, Order, Tick, Bar, OrderType, OrderStatus, Timeframe, Instrument, TickRouter, error
+from .signal  import Signal
 
-class Exchange(QObject):
+class Exchange:
     """Provides access to market data and allows execution of trades."""
 
-    tick_received = pyqtSignal(str, Tick)
+    tick_received = Signal(str, Tick)
     """Event emitted when a quote update of an instrument is received.
     
     This event is emitted by `Exchange.refresh_rates()` when a new tick of
@@ -17,7 +17,7 @@ class Exchange(QObject):
     not, `Exchange.get_tick()` may be called.
     """
 
-    order_placed = pyqtSignal(Order)
+    order_placed = Signal(Order)
     """Event emitted when a limit order or a stop order is placed.
 
     This event is emitted by the methods `Exchange.place_limit_order()` and
@@ -29,7 +29,7 @@ class Exchange(QObject):
     or a stop order by calling `Order.type()`.
     """
 
-    order_canceled = pyqtSignal(Order)
+    order_canceled = Signal(Order)
     """Event emitted when a limit order or stop order is canceled.
 
     This event is emitted by `Exchange.cancel_order()` when a pending order
@@ -40,7 +40,7 @@ class Exchange(QObject):
     by calling `Order.type()`.
     """
 
-    order_expired = pyqtSignal(Order)
+    order_expired = Signal(Order)
     """Event emitted when a limit order or stop order expires.
     
     This event is emitted when the exchange automatically cancels a pending order
@@ -52,7 +52,7 @@ class Exchange(QObject):
     a limit order or a stop order, call `Order.type()`.
     """
 
-    order_filled = pyqtSignal(Order)
+    order_filled = Signal(Order)
     """Event emitted when an order is filled.
     
     This event is emitted by `Exchange.place_market_order()` immediately before it
@@ -69,7 +69,7 @@ class Exchange(QObject):
     marker order, a limit order, or a stop order, call `Order.type()`.
     """
 
-    order_closed = pyqtSignal(Order)
+    order_closed = Signal(Order)
     """Event emitted when a filled order is closed
     
     This event is emitted by `Exchange.close_order()` immediately after it closes an
@@ -88,6 +88,23 @@ class Exchange(QObject):
         super().__init__()
 
         self._closed_bars: Dict[str, List[Bar]] = {}
+        self._tick_router: Optional[TickRouter] = None
+
+    @property
+    def tick_router(self) -> TickRouter:
+        """Router which dispatches ticks to handlers interested in their symbol.
+
+        The router is created on first access, at which point it's connected to
+        `Exchange.tick_received`. Consumers which only want ticks of a few symbols,
+        such as strategies, should register with it rather than connect to
+        `Exchange.tick_received`, so that they aren't called for every tick.
+        """
+
+        if self._tick_router is None:
+            self._tick_router = TickRouter()
+            self.tick_received.connect(self._tick_router.route)
+
+        return self._tick_router
 
     def get_tick(self, symbol: str) -> Tick:
         """Returns the last quotes of an instrument."""
@@ -97,6 +114,32 @@ class Exchange(QObject):
     def get_instrument(self, symbol: str) -> Instrument:
         raise error.NotImplementedException(self.__class__, 'get_instrument')
 
+    def get_instruments(self, symbols: Union[str, Iterable[str]] = '*') -> Dict[str, Instrument]:
+        """Retrieves information about several instruments at once.
+
+        `symbols` may be an iterable of instrument symbols or the string `'*'`,
+        in which case information about all instruments known by the exchange
+        is retrieved. Symbols not recognized by the exchange are left out of
+        the returned dictionary, which maps symbols to their instruments.
+
+        The default implementation calls `Exchange.get_instrument()` for each
+        symbol. Subclasses should override this method if the exchange is able
+        to provide information about several instruments in a single request.
+        """
+
+        if symbols == '*':
+            raise error.NotImplementedException(self.__class__, 'get_instruments')
+
+        instruments: Dict[str, Instrument] = {}
+
+        for symbol in symbols:
+            try:
+                instruments[symbol] = self.get_instrument(symbol)
+            except error.ExecutionError:
+                pass
+
+        return instruments
+
     def get_history_bars(self,
                          symbol:     str,
                          start_time: Optional[datetime] = None,
@@ -422,8 +465,92 @@ class Exchange(QObject):
 
         raise error.NotImplementedException(self.__class__, 'place_order')
 
+    def get_orders(self,
+                   symbol:       Optional[str]      = None,
+                   magic_number: Optional[int]      = None,
+                   start_time:   Optional[datetime] = None,
+                   end_time:     Optional[datetime] = None,
+                   history:      bool               = False
+    ) -> Dict[int, Order]:
+        """Retrieves information about several orders at once.
+
+        Description
+        -----------
+        This method requests information from the exchange server about all orders
+        matching the given filters, and returns a dictionary mapping the ticket of
+        each of those orders to an object storing information about that order.
+
+        If `history` is `False`, only filled and pending orders are retrieved, and
+        `start_time` and `end_time` filter orders by open time. Otherwise, only
+        closed, canceled, and expired orders are retrieved, and the time range
+        filters orders by close time.
+
+        As with `get_order()`, the returned objects represent the state of the
+        orders at the time this method is called.
+
+        Parameters
+        ----------
+        symbol : str, optional
+            Symbol of the orders' instrument. (default: any symbol)
+
+        magic_number : int, optional
+            Magic number of the orders. (default: any magic number)
+
+        start_time : datetime, optional
+            Minimum open or close time of the orders. (default: no minimum)
+
+        end_time : datetime, optional
+            Maximum open or close time of the orders. (default: no maximum)
+
+        history : bool, optional
+            Whether to retrieve finished orders rather than active ones. (default: False)
+
+        Raises
+        ------
+        RequestError
+            If request could not be delivered to, or understood by the exchange.
+
+        Returns
+        -------
+        Dict[int, Order]
+            Orders matching the filters, keyed by ticket.
+        """
+
+        raise error.NotImplementedException(self.__class__, 'get_orders')
+
     def orders(self) -> Dict[int, Order]:
         raise error.NotImplementedException(self.__class__, 'orders')
 
+    def find_orders(self,
+                    symbol:       Optional[str]  = None,
+                    side:         Optional[Side] = None,
+                    magic_number: Optional[int]  = None,
+                    status:       Union[None, OrderStatus, Iterable[OrderStatus]] = None
+    ) -> Dict[int, Order]:
+        """Returns the tracked orders matching all given filters, keyed by ticket.
+
+        Only orders returned by `Exchange.orders()` are searched, and no request
+        is made to the exchange server. Filters which are `None` match any order.
+        `status` may be a single status or several of them, in which case orders
+        having any of them are matched.
+
+        The default implementation scans all tracked orders. Subclasses which
+        index their orders should override this method.
+        """
+
+        if isinstance(status, OrderStatus):
+            status = [status]
+        elif status is not None:
+            status = list(status)
+
+        return {
+            ticket: order
+            for ticket, order in self.orders().items()
+            if  (symbol       is None or order.symbol()       == symbol)
+            and (side         is None or order.side()         == side)
+            and (magic_number is None or order.magic_number() == magic_number)
+            and (status       is None or order.status()       in status)
+        }
+
     def process_events(self):
         raise error.NotImplementedException(self.__class__, 'process_events')
\ No newline at end of file
@@ -1 +1,10 @@
-from .mt4 import MetaTrader4
\ No newline at end of file
+from typing       import TYPE_CHECKING
+from rmt.lazyutil import lazy_attributes
+
+if TYPE_CHECKING:
+    from .mt4 import MetaTrader4
+
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    'mt4':         ('.mt4', None),
+    'MetaTrader4': ('.mt4', 'MetaTrader4')
+})
\ No newline at end of file
@@ -1,6 +1,25 @@
-from .content        import Content
-from .command_result import CommandResultCode
-from .operation_code import OperationCode
-from .raise_error    import raise_error
-from .               import events, requests, responses
-from .metatrader4    import MetaTrader4
\ No newline at end of file
+from typing             import TYPE_CHECKING
+from rmt.lazyutil       import lazy_attributes
+from .content           import Content
+from .command_result    import CommandResultCode
+from .operation_code    import OperationCode
+from .raise_error       import raise_error
+from .request_scheduler import RequestScheduler
+from .single_flight     import SingleFlight
+
+# Modules which import ZMQ, and those only needed to talk to the Expert Server,
+# are imported on first access.
+if TYPE_CHECKING:
+    from .            import events, requests, responses
+    from .metatrader4 import MetaTrader4
+    from .stub_server import StubServer
+    from .proxy       import Proxy
+
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    'events':      ('.events',      None),
+    'requests':    ('.requests',    None),
+    'responses':   ('.responses',   None),
+    'MetaTrader4': ('.metatrader4', 'MetaTrader4'),
+    'StubServer':  ('.stub_server', 'StubServer'),
+    'Proxy':       ('.proxy',       'Proxy')
+})
\ No newline at end of file
@@ -1 +1,2 @@
-from .tick_event import TickEvent
\ No newline at end of file
+from .tick_event  import TickEvent
+from .order_event import OrderEvent
\ No newline at end of file
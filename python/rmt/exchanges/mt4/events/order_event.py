@@ -0,0 +1,25 @@
+from rmt         import Order
+from ..          import Content
+from ..responses import GetOrderResponse
+
+class OrderEvent:
+    def __init__(self, ticket: str, content: Content):
+        if not ticket.isdigit():
+            raise ValueError("order event name has invalid ticket '%s'" % ticket)
+
+        if not isinstance(content, dict):
+            raise ValueError("order event content is of invalid type (expected: object, got: array)")
+
+        try:
+            order = GetOrderResponse(content).order()
+        except KeyError as e:
+            raise ValueError('missing key %s from order event content' % e)
+
+        self._ticket = int(ticket)
+        self._order  = order
+
+    def ticket(self) -> int:
+        return self._ticket
+
+    def order(self) -> Order:
+        return self._order
\ No newline at end of file
@@ -1,25 +1,105 @@
 import zmq
 import json
 import logging
-from datetime import datetime
-from typing   import Dict, List, Optional, Set, Tuple
-from time     import sleep
+import math
+import os
+from datetime import datetime, timedelta
+from typing   import Dict, Iterable, List, Optional, Set, Tuple, Union
+from time     import monotonic, perf_counter, sleep
 from rmt      import (error, Order, Side, OrderType,
                       Exchange, Tick, Bar, OrderStatus,
-                      Timeframe, Instrument)
-from . import *
+                      Timeframe, Instrument, OrderCache, RateLimiter,
+                      Registry)
+from .        import (CommandResultCode, Content, OperationCode, RequestScheduler,
+                      SingleFlight, events, raise_error, requests, responses)
+
+THROTTLING_CODES = frozenset([
+    CommandResultCode.SERVER_BUSY,
+    CommandResultCode.TOO_FREQUENT_REQUESTS,
+    CommandResultCode.TOO_MANY_REQUESTS,
+    CommandResultCode.TRADE_CONTEXT_BUSY
+])
+"""Result codes with which the Expert reports that requests are being throttled."""
 
 class MetaTrader4(Exchange):
-    """Bindings for executing market operations on MetaTrader 4."""
+    """Bindings for executing market operations on MetaTrader 4.
+
+    Instruments retrieved from the Expert Server are cached. If `instrument_ttl`
+    is `None`, a cached instrument is never requested again. Otherwise, the
+    levels of a cached instrument (see `Instrument.with_levels()`) are refreshed
+    once they are older than `instrument_ttl` seconds, either by `process_events()`,
+    which refreshes all stale instruments in a single request, or, if it was not
+    called in time, by the next call to `get_instrument()`. As such, the levels
+    returned by `get_instrument()` are never older than `instrument_ttl` seconds.
+
+    Orders placed, fetched, or received by events are tracked in `order_cache`.
+    If `order_cache` is `None`, a cache that never evicts orders is used. Pass
+    a cache with limits (see `OrderCache`) to bound memory usage of processes
+    which run for long; evicted orders are requested again or, if the cache has
+    an archive, read from it by `get_order()`.
+
+    Requests are sent through `trading_limiter` if they're trade operations, such
+    as placing orders, or through `data_limiter` otherwise, so that each kind of
+    request has its own budget. If either is `None`, a `RateLimiter` which doesn't
+    limit the rate of requests, but still backs off, is used. Whenever the Expert
+    responds with one of `THROTTLING_CODES`, the limiter backs off before sending
+    further requests. Requests which are idempotent, such as getting ticks, are
+    then retried up to `max_retries` times before their error is raised.
+
+    Requests may be sent from several threads, in which case they're sent one at
+    a time in order of priority (see `requests.RequestPriority`): trade operations
+    first, then queries such as getting ticks or orders, and then history downloads.
+    To keep a long history download from delaying more urgent requests, requests
+    for history bars between a start and an end time are split into requests of at
+    most `history_chunk_bars` bars each. If `history_chunk_bars` is `None`, history
+    is always requested at once.
+
+    Idempotent requests which are identical to a request in flight, as when several
+    threads get the tick of the same symbol at the same moment, aren't sent again.
+    Instead, they wait for the response of the request in flight and share it. The
+    number of requests saved this way is returned by `requests_saved()`.
+
+    The last tick of each subscribed symbol is kept as tick events are processed
+    by `process_events()`. If `tick_max_age` is `None`, the default, `get_tick()`
+    always requests a tick from the Expert. Otherwise, if the last tick of a symbol
+    was received no more than `tick_max_age` seconds ago, `get_tick()` returns it
+    rather than requesting a tick. Note that ticks are timestamped when
+    `process_events()` reads them, so a tick may be older than that if
+    `process_events()` is called seldom.
+
+    Likewise, the current bar of a subscribed symbol is requested from the Expert
+    only the first time `get_current_bar()` is called for a timeframe. From then
+    on, the bar is updated with the bid of each tick processed by `process_events()`,
+    and a new bar is opened once a tick falls past the end of the current one (see
+    `Timeframe.bar_time()`). The volume of such bars is a count of ticks received,
+    which may be lower than the tick volume counted by MetaTrader.
+
+    Runtime metrics of the client, such as ticks received per symbol, request
+    latencies and result codes per command, and cache hits, are kept in the
+    `Registry` returned by `metrics`, from which they may be exported in the
+    OpenMetrics text format, as by `client.metrics.serve(9464)` or
+    `client.metrics.write(path)`. Names of metrics start with `rmt_`.
+    """
 
     def __init__(self,
-                 protocol: str = 'tcp',
-                 host:     str = 'localhost',
-                 req_port: int = 32768,
-                 sub_port: int = 32769
+                 protocol:           str                   = 'tcp',
+                 host:               str                   = 'localhost',
+                 req_port:           int                   = 32768,
+                 sub_port:           int                   = 32769,
+                 instrument_ttl:     Optional[float]       = None,
+                 order_cache:        Optional[OrderCache]  = None,
+                 trading_limiter:    Optional[RateLimiter] = None,
+                 data_limiter:       Optional[RateLimiter] = None,
+                 max_retries:        int                   = 0,
+                 history_chunk_bars: Optional[int]         = 5000,
+                 tick_max_age:       Optional[float]       = None
     ):
         super().__init__()
 
+        self._connects = 0
+        self._metrics  = Registry()
+        self._init_metrics()
+
         ctx = zmq.Context.instance()
         self._req_socket = ctx.socket(zmq.REQ)
         self._sub_socket = ctx.socket(zmq.SUB)
@@ -53,24 +133,52 @@ class MetaTrader4(Exchange):
         self._req_socket.setsockopt(zmq.RCVTIMEO, 10000)
 
         self._subscribed_symbols: Set[str] = set()
+
+        # Last tick of each subscribed symbol, along with the time it was received.
+        self._last_ticks: Dict[str, Tuple[Tick, float]] = {}
+        self._tick_max_age = tick_max_age
+
+        # Current bar of each subscribed symbol, by timeframe, for the timeframes
+        # which `get_current_bar()` was called with.
+        self._current_bars: Dict[str, Dict[Timeframe, Bar]] = {}
         self._logger = logging.getLogger(MetaTrader4.__name__)
 
         self._instruments: Dict[str, Instrument] = {}
+        self._instrument_ttl = instrument_ttl
+        self._instrument_refresh_times: Dict[str, float] = {}
+        self._next_instrument_refresh = math.inf
+
+        self._orders = order_cache if order_cache is not None else OrderCache()
 
-        self._orders: Dict[int, Order] = {}
+        self._trading_limiter = trading_limiter if trading_limiter is not None else RateLimiter()
+        self._data_limiter    = data_limiter    if data_limiter    is not None else RateLimiter()
+        self._max_retries     = max_retries
+
+        self._scheduler          = RequestScheduler()
+        self._history_chunk_bars = history_chunk_bars
+        self._single_flight      = SingleFlight()
 
         self._event_factory = {
-            'tick': (events.TickEvent, lambda e: self.tick_received.emit(e.symbol(), e.tick()))
+            'tick':  (events.TickEvent,  self._on_tick_event),
+            'order': (events.OrderEvent, self._on_order_event)
         }
 
         self.connect(protocol, host, req_port, sub_port)
 
+        # Order events keep `self._orders` up to date, so always receive them.
+        self._sub_socket.subscribe('order.')
+
     def connect(self,
                 protocol: str,
                 host: str,
                 req_port: int,
                 sub_port: int
     ):
+        if self._connects > 0:
+            self._reconnects.inc()
+
+        self._connects += 1
+
         addr_prefix = protocol + '://' + host + ':%s'
 
         req_addr = addr_prefix % req_port
@@ -84,8 +192,18 @@ class MetaTrader4(Exchange):
     def disconnect(self):
         self._req_socket.close()
         self._sub_socket.close()
+        self._orders.close()
 
     def get_tick(self, symbol: str) -> Tick:
+        if self._tick_max_age is not None:
+            last_tick = self._last_ticks.get(symbol)
+
+            if last_tick is not None and monotonic() - last_tick[1] <= self._tick_max_age:
+                self._tick_cache_hits.inc()
+                return last_tick[0]
+
+            self._tick_cache_misses.inc()
+
         request  = requests.GetTickRequest(symbol)
         response = responses.GetTickResponse(self._send_request(request))
         
@@ -93,30 +211,145 @@ class MetaTrader4(Exchange):
 
     def get_instrument(self, symbol: str) -> Instrument:
         if symbol not in self._instruments:
+            self._instrument_cache_misses.inc()
+
             request  = requests.GetInstrumentRequest(symbol)
             response = responses.GetInstrumentResponse(self._send_request(request))
 
-            instrument = Instrument(
-                symbol          = symbol,
-                description     = response.description(),
-                base_currency   = response.base_currency(),
-                profit_currency = response.profit_currency(),
-                margin_currency = response.margin_currency(),
-                decimal_places  = response.decimal_places(),
-                point           = response.point(),
-                tick_size       = response.tick_size(),
-                contract_size   = response.contract_size(),
-                lot_step        = response.lot_step(),
-                min_lot         = response.min_lot(),
-                max_lot         = response.max_lot(),
-                min_stop_level  = response.min_stop_level(),
-                freeze_level    = response.freeze_level(),
-                spread          = response.spread()
-            )
+            self._cache_instruments({symbol: response.instrument(symbol)}, monotonic())
 
-            self._instruments[symbol] = instrument
+        else:
+            self._instrument_cache_hits.inc()
+
+            if self._is_instrument_stale(symbol, monotonic()):
+                self.refresh_instruments([symbol])
 
         return self._instruments[symbol]
+
+    def get_instruments(self, symbols: Union[str, Iterable[str]] = '*') -> Dict[str, Instrument]:
+        """Retrieves information about several instruments in a single request.
+
+        Instruments which are already cached are not requested again, unless
+        `symbols` is `'*'`, in which case the whole catalog is requested and
+        every cached instrument is replaced.
+        """
+
+        if symbols == '*':
+            request  = requests.GetInstrumentsRequest()
+            response = responses.GetInstrumentsResponse(self._send_request(request))
+
+            self._cache_instruments(response.instruments(), monotonic())
+
+            return response.instruments()
+
+        symbols = list(dict.fromkeys(symbols))
+        missing = [symbol for symbol in symbols if symbol not in self._instruments]
+
+        if len(missing) > 0:
+            request  = requests.GetInstrumentsRequest(missing)
+            response = responses.GetInstrumentsResponse(self._send_request(request))
+
+            self._cache_instruments(response.instruments(), monotonic())
+
+        now   = monotonic()
+        stale = [symbol for symbol in symbols if self._is_instrument_stale(symbol, now)]
+
+        if len(stale) > 0:
+            self.refresh_instruments(stale)
+
+        return {
+            symbol: self._instruments[symbol]
+            for symbol in symbols
+            if symbol in self._instruments
+        }
+
+    def save_instruments(self, path: str):
+        """Writes a snapshot of all cached instruments to a file.
+
+        The snapshot is a JSON document in the same format as the content of a
+        `getInstruments` response, and may be read back by `load_instruments()`
+        so that a new process doesn't need to request instruments again to the
+        Expert Server.
+
+        The file is replaced atomically, so that a concurrent reader never sees
+        a partially written snapshot.
+        """
+
+        content = {
+            symbol: self._instrument_content(instrument)
+            for symbol, instrument in self._instruments.items()
+        }
+
+        tmp_path = path + '.tmp'
+
+        with open(tmp_path, 'w') as f:
+            json.dump(content, f)
+
+        os.replace(tmp_path, path)
+
+    def load_instruments(self, path: str) -> Dict[str, Instrument]:
+        """Reads a snapshot written by `save_instruments()` into the instrument cache.
+
+        Instruments read from the snapshot replace those with the same symbol
+        which are already cached. Returns the instruments read from the file.
+
+        The levels of the instruments read from the snapshot are considered
+        stale, so they will be refreshed as soon as `instrument_ttl` allows it.
+
+        Raises
+        ------
+        OSError
+            If the file could not be read.
+
+        ValueError
+            If the file is not a valid snapshot.
+        """
+
+        with open(path, 'r') as f:
+            content = json.load(f)
+
+        try:
+            instruments = responses.GetInstrumentsResponse(content).instruments()
+        except (KeyError, TypeError) as e:
+            raise ValueError("invalid instrument snapshot '%s': %s" % (path, e))
+
+        self._cache_instruments(instruments, -math.inf)
+
+        return instruments
+
+    def refresh_instruments(self, symbols: Optional[Iterable[str]] = None):
+        """Updates the levels of cached instruments in a single request.
+
+        Refreshes the minimum stop level, freeze level, and spread of the cached
+        instruments identified by `symbols`, or of all cached instruments if
+        `symbols` is `None`. Symbols of instruments which are not cached are
+        ignored, since the whole instrument must be retrieved for them.
+        """
+
+        if symbols is None:
+            symbols = list(self._instruments)
+        else:
+            symbols = [symbol for symbol in symbols if symbol in self._instruments]
+
+        if len(symbols) == 0:
+            return
+
+        request  = requests.GetInstrumentLevelsRequest(symbols)
+        response = responses.GetInstrumentLevelsResponse(self._send_request(request))
+
+        levels = response.levels()
+        now    = monotonic()
+
+        for symbol in symbols:
+            if symbol in levels:
+                self._instruments[symbol] = self._instruments[symbol].with_levels(*levels[symbol])
+
+            # Symbols missing from the response are no longer known by the terminal.
+            # Mark them as refreshed anyway, so that they aren't requested over and
+            # over again on every call to `process_events()`.
+            self._instrument_refresh_times[symbol] = now
+
+        self._update_next_instrument_refresh()
     
     def get_history_bars(self,
                          symbol: str,
@@ -124,19 +357,69 @@ class MetaTrader4(Exchange):
                          end_time:   Optional[datetime] = None,
                          timeframe:  Timeframe = Timeframe.M1
     ) -> List[Bar]:
-        request  = requests.GetHistoryBarsRequest(symbol, start_time, end_time, timeframe)
-        response = responses.GetHistoryBarsResponse(self._send_request(request))
-        
-        return response.bars()
+        if (self._history_chunk_bars is None
+            or start_time is None
+            or end_time   is None
+            or end_time - start_time <= timeframe.duration * self._history_chunk_bars
+        ):
+            return self._get_history_chunk(symbol, start_time, end_time, timeframe)
+
+        ################################################################################
+        # Split the range into consecutive, non-overlapping chunks. Since the Expert
+        # returns bars whose open times are within the requested range, inclusive, and
+        # bar times have a resolution of seconds, each chunk starts one second after the
+        # end of the previous one.
+        #
+        # A chunk may fail because it has no bars at all, as with a weekend or holiday,
+        # so such failures are only raised if every chunk failed. Any other failure,
+        # such as the history being updated, is raised at once, since skipping the
+        # chunk would leave a gap in the bars returned.
+        ################################################################################
+        chunk_span = timeframe.duration * self._history_chunk_bars
+        bars: Dict[datetime, Bar] = {}
+        last_error = None
+
+        chunk_start = start_time
+
+        while chunk_start <= end_time:
+            chunk_end = min(chunk_start + chunk_span, end_time)
+
+            try:
+                for bar in self._get_history_chunk(symbol, chunk_start, chunk_end, timeframe):
+                    bars[bar.time] = bar
+            except error.ExecutionError as e:
+                if e.code != CommandResultCode.NO_HISTORY_DATA:
+                    raise
+
+                last_error = e
+
+            chunk_start = chunk_end + timedelta(seconds=1)
+
+        if len(bars) == 0 and last_error is not None:
+            raise last_error
+
+        return [bars[t] for t in sorted(bars)]
 
     def get_current_bar(self,
                         symbol:    str,
                         timeframe: Timeframe = Timeframe.M1
     ) -> Bar:
+        bars = self._current_bars.get(symbol)
+
+        if bars is not None and timeframe in bars:
+            self._bar_cache_hits.inc()
+            return bars[timeframe]
+
+        self._bar_cache_misses.inc()
+
         request  = requests.GetCurrentBarRequest(symbol, timeframe)
         response = responses.GetCurrentBarResponse(self._send_request(request))
+        bar      = response.bar()
+
+        if symbol in self._subscribed_symbols:
+            self._current_bars.setdefault(symbol, {})[timeframe] = bar
 
-        return response.bar()
+        return bar
 
     def subscribe(self, symbol: str):
         if symbol in self._subscribed_symbols:
@@ -161,12 +444,16 @@ class MetaTrader4(Exchange):
         if symbol in self._subscribed_symbols:
             self._sub_socket.unsubscribe('tick.' + symbol)
             self._subscribed_symbols.remove(symbol)
+            self._last_ticks.pop(symbol, None)
+            self._current_bars.pop(symbol, None)
 
     def unsubscribe_all(self):
         for symbol in self._subscribed_symbols:
-            self._sub_socket.unsubscribe('tick' + symbol)
+            self._sub_socket.unsubscribe('tick.' + symbol)
         
         self._subscribed_symbols.clear()
+        self._last_ticks.clear()
+        self._current_bars.clear()
 
     def subscriptions(self) -> Set[str]:
         return self._subscribed_symbols.copy()
@@ -275,7 +562,8 @@ class MetaTrader4(Exchange):
                 swap         = order_info.swap(),
             )
 
-            self._orders[response.ticket()] = order
+            self._track_order(response.ticket(), order)
+            self._emit_order_signal(order)
 
         return response.ticket()
 
@@ -296,14 +584,28 @@ class MetaTrader4(Exchange):
 
         self._send_request(request)
 
-        # order._stop_loss   = float(stop_loss)
-        # order._take_profit = float(take_profit)
+        order = self._orders.get(ticket)
+
+        if order is None:
+            return
+
+        changes = {}
+
+        if stop_loss is not None:
+            changes['stop_loss'] = float(stop_loss)
 
-        # if price is not None:
-        #     order._open_price = float(price)
+        if take_profit is not None:
+            changes['take_profit'] = float(take_profit)
 
-        # if expiration is not None:
-        #     order._expiration = expiration
+        # The open price and expiration time of filled orders can't be modified.
+        if order.status() == OrderStatus.PENDING:
+            if price is not None:
+                changes['open_price'] = float(price)
+
+            if expiration is not None:
+                changes['expiration'] = expiration
+
+        self._track_order(ticket, self._updated_order(order, **changes))
 
     def close_order(self,
                     ticket:   int,
@@ -314,51 +616,122 @@ class MetaTrader4(Exchange):
         request  = requests.CloseOrderRequest(ticket, price, slippage, lots)
         response = responses.CloseOrderResponse(self._send_request(request))
 
-        # order._status      = OrderStatus.CLOSED
-        # order._lots        = response.lots()
-        # order._close_price = response.close_price()
-        # order._close_time  = response.close_time()
-        # order._comment     = response.comment()
-        # order._commission  = response.commission()
-        # order._profit      = response.profit()
-        # order._swap        = response.swap()
-
-        if response.new_order():
-            ticket = response.new_order().ticket()
-
-        #     order = Order(
-        #         ticket       = response.new_order_ticket(),
-        #         symbol       = order.symbol(),
-        #         side         = order.side(),
-        #         type         = order.type(),
-        #         lots         = response.new_order_lots(),
-        #         status       = OrderStatus.FILLED,
-        #         open_price   = order.open_price(),
-        #         open_time    = order.open_time(),
-        #         stop_loss    = order.stop_loss(),
-        #         take_profit  = order.take_profit(),
-        #         magic_number = response.new_order_magic_number(),
-        #         comment      = response.new_order_comment(),
-        #         commission   = response.new_order_commission(),
-        #         profit       = response.new_order_profit(),
-        #         swap         = response.new_order_swap()
-        #     )
+        order     = self._orders.get(ticket)
+        new_order = response.new_order()
+
+        ################################################################################
+        # Update the tracked order only if the server managed to read the closed order
+        # after closing it, in which case the response has its close price. Otherwise,
+        # stop tracking it, so that the order is retrieved again by `get_order()` or
+        # updated by the order event which the server publishes for the closed order.
+        ################################################################################
+        if order is not None and response.close_price() == 0:
+            self._untrack_order(ticket)
+
+        elif order is not None:
+            closed_order = self._updated_order(
+                order,
+                status      = OrderStatus.CLOSED,
+                lots        = response.lots(),
+                close_price = response.close_price(),
+                close_time  = response.close_time(),
+                comment     = response.comment(),
+                commission  = response.commission(),
+                profit      = response.profit(),
+                swap        = response.swap()
+            )
+
+            self._track_order(ticket, closed_order)
+
+            # A partial close leaves the remaining lots in a new order.
+            if new_order is not None:
+                remaining_order = self._updated_order(
+                    order,
+                    status       = OrderStatus.FILLED,
+                    lots         = new_order.lots(),
+                    magic_number = new_order.magic_number(),
+                    comment      = new_order.comment(),
+                    commission   = new_order.commission(),
+                    profit       = new_order.profit(),
+                    swap         = new_order.swap()
+                )
+
+                self._track_order(new_order.ticket(), remaining_order)
+
+            self._emit_order_signal(closed_order)
+
+        if new_order is not None:
+            ticket = new_order.ticket()
 
         return ticket
 
     def get_order(self, ticket: int) -> Order:
-        if ticket not in self._orders:
+        order = self._orders.restore(ticket)
+
+        if order is not None:
+            self._order_cache_hits.inc()
+        else:
+            self._order_cache_misses.inc()
+
             request  = requests.GetOrderRequest(ticket)
             response = responses.GetOrderResponse(self._send_request(request))
+            order    = response.order()
+
+            self._track_order(ticket, order)
+
+        return order
+
+    def get_orders(self,
+                   symbol:       Optional[str]      = None,
+                   magic_number: Optional[int]      = None,
+                   start_time:   Optional[datetime] = None,
+                   end_time:     Optional[datetime] = None,
+                   history:      bool               = False
+    ) -> Dict[int, Order]:
+        request  = requests.GetOrdersRequest(symbol, magic_number, start_time, end_time, history)
+        response = responses.GetOrdersResponse(self._send_request(request))
+
+        for ticket, order in response.orders().items():
+            self._track_order(ticket, order)
+
+        return response.orders()
+
+    def orders(self) -> Dict[int, Order]:
+        return self._orders.to_dict()
+
+    def find_orders(self,
+                    symbol:       Optional[str]  = None,
+                    side:         Optional[Side] = None,
+                    magic_number: Optional[int]  = None,
+                    status:       Union[None, OrderStatus, Iterable[OrderStatus]] = None
+    ) -> Dict[int, Order]:
+        return self._orders.find(symbol, side, magic_number, status)
+
+    def requests_saved(self) -> int:
+        """Returns the number of requests which shared the response of an identical request in flight."""
 
-            self._orders[ticket] = response.order()
+        return self._single_flight.calls_saved()
 
-        return self._orders[ticket]
+    @property
+    def metrics(self) -> Registry:
+        """Registry of the runtime metrics of this client."""
+
+        return self._metrics
 
     def process_events(self):
+        if monotonic() >= self._next_instrument_refresh:
+            self._refresh_stale_instruments()
+
+        self._orders.evict()
+
+        batch_size = 0
+
         while True:
+            event_msg = ''
+
             try:
-                event_msg = self._sub_socket.recv_string(zmq.DONTWAIT)
+                event_msg   = self._sub_socket.recv_string(zmq.DONTWAIT)
+                batch_size += 1
                 
                 self._logger.debug('received event message: %s', event_msg)
                 self._process_event(event_msg)
@@ -367,6 +740,9 @@ class MetaTrader4(Exchange):
                 break
             except (ValueError, TypeError) as e:
                 self._logger.warning('failed to read event msg: %s', e)
+                self._count_dropped_event(event_msg)
+
+        self._batch_size.set(batch_size)
 
     #===============================================================================
     # Internals (U Can't Touch This)
@@ -395,6 +771,136 @@ class MetaTrader4(Exchange):
         
         return CommandResultCode(cmd_result), content
 
+    def _init_metrics(self):
+        metrics = self._metrics
+
+        self._ticks_received = metrics.counter('rmt_ticks_received', 'Ticks received, by symbol.', ['symbol'])
+        self._ticks_dropped  = metrics.counter('rmt_ticks_dropped',  'Unreadable tick messages, by symbol.', ['symbol'])
+        self._events_dropped = metrics.counter('rmt_events_dropped', 'Unreadable event messages other than ticks.')
+        self._reconnects     = metrics.counter('rmt_reconnects',     'Calls to connect() after the first one.')
+        self._batch_size     = metrics.gauge('rmt_process_events_batch_size', 'Events read by the last process_events().')
+
+        self._requests = metrics.counter(
+            'rmt_requests',
+            'Requests sent to the Expert Server, by command and result code.',
+            ['command', 'code']
+        )
+
+        self._request_duration = metrics.histogram(
+            'rmt_request_duration_seconds',
+            'Time between sending a request and receiving its response, by command.',
+            ['command']
+        )
+
+        cache_lookups = metrics.counter(
+            'rmt_cache_lookups',
+            'Lookups of cached data, by cache and result.',
+            ['cache', 'result']
+        )
+
+        # Resolve labels once, so that cache lookups don't pay for it.
+        self._tick_cache_hits         = cache_lookups.labels('tick',        'hit')
+        self._tick_cache_misses       = cache_lookups.labels('tick',        'miss')
+        self._bar_cache_hits          = cache_lookups.labels('current_bar', 'hit')
+        self._bar_cache_misses        = cache_lookups.labels('current_bar', 'miss')
+        self._instrument_cache_hits   = cache_lookups.labels('instrument',  'hit')
+        self._instrument_cache_misses = cache_lookups.labels('instrument',  'miss')
+        self._order_cache_hits        = cache_lookups.labels('order',       'hit')
+        self._order_cache_misses      = cache_lookups.labels('order',       'miss')
+
+        # Values which are kept elsewhere are only read when metrics are exported.
+        metrics.counter(
+            'rmt_requests_saved',
+            'Requests which shared the response of an identical request in flight.',
+            function=self.requests_saved
+        )
+
+        gauges = [
+            ('rmt_requests_waiting',   'Requests waiting for their turn to be sent.', lambda: self._scheduler.waiting()),
+            ('rmt_order_cache_size',   'Orders in the order cache.',                  lambda: len(self._orders)),
+            ('rmt_instruments_cached', 'Instruments in the instrument cache.',        lambda: len(self._instruments)),
+            ('rmt_subscriptions',      'Symbols subscribed.',                         lambda: len(self._subscribed_symbols))
+        ]
+
+        for name, help, function in gauges:
+            metrics.gauge(name, help, function=function)
+
+    def _count_request(self, command: str, code: str, start_time: float):
+        self._request_duration.labels(command).observe(perf_counter() - start_time)
+        self._requests.labels(command, code).inc()
+
+    def _count_dropped_event(self, msg: str):
+        event_name = msg[:msg.find(' ')] if ' ' in msg else msg
+
+        if event_name.startswith('tick.'):
+            self._ticks_dropped.labels(event_name[len('tick.'):]).inc()
+        else:
+            self._events_dropped.inc()
+
+    def _cache_instruments(self, instruments: Dict[str, Instrument], refresh_time: float):
+        for symbol, instrument in instruments.items():
+            self._instruments[symbol] = instrument
+            self._instrument_refresh_times[symbol] = refresh_time
+
+        self._update_next_instrument_refresh()
+
+    def _is_instrument_stale(self, symbol: str, now: float) -> bool:
+        if self._instrument_ttl is None or symbol not in self._instrument_refresh_times:
+            return False
+
+        return now - self._instrument_refresh_times[symbol] > self._instrument_ttl
+
+    def _update_next_instrument_refresh(self):
+        if self._instrument_ttl is None or len(self._instrument_refresh_times) == 0:
+            self._next_instrument_refresh = math.inf
+        else:
+            self._next_instrument_refresh = min(self._instrument_refresh_times.values()) + self._instrument_ttl
+
+    def _refresh_stale_instruments(self):
+        now   = monotonic()
+        stale = [s for s in self._instrument_refresh_times if self._is_instrument_stale(s, now)]
+
+        # Invalid responses raise `KeyError`, `ValueError` or `TypeError` while being parsed,
+        # which must not escape from `process_events()` any more than request errors.
+        try:
+            self.refresh_instruments(stale)
+        except (error.RMTError, KeyError, ValueError, TypeError) as e:
+            self._logger.warning('failed to refresh instruments: %s', e)
+
+            # Don't retry on every call to `process_events()`.
+            self._next_instrument_refresh = now + self._instrument_ttl
+
+    def _instrument_content(self, instrument: Instrument) -> Content:
+        """Returns an instrument in the format read by `GetInstrumentResponse`."""
+
+        return {
+            'desc':       instrument.description,
+            'bcurrency':  instrument.base_currency,
+            'pcurrency':  instrument.profit_currency,
+            'mcurrency':  instrument.margin_currency,
+            'ndecimals':  instrument.decimal_places,
+            'point':      instrument.point,
+            'ticksz':     instrument.tick_size,
+            'contractsz': instrument.contract_size,
+            'lotstep':    instrument.lot_step,
+            'minlot':     instrument.min_lot,
+            'maxlot':     instrument.max_lot,
+            'minstop':    instrument.min_stop_level,
+            'freezelvl':  instrument.freeze_level,
+            'spread':     instrument.spread
+        }
+
+    def _get_history_chunk(self,
+                           symbol:     str,
+                           start_time: Optional[datetime],
+                           end_time:   Optional[datetime],
+                           timeframe:  Timeframe
+    ) -> List[Bar]:
+        request  = requests.GetHistoryBarsRequest(symbol, start_time, end_time, timeframe)
+        response = responses.GetHistoryBarsResponse(self._send_request(request))
+
+        return response.bars()
+
     def _send_request(self, request: requests.Request) -> Content:
         cmd = request.command
 
@@ -405,11 +911,67 @@ class MetaTrader4(Exchange):
             raise error.RequestError("expected alphabetic command string (got: '%s')" % request.command)
 
         try:
-            content      = json.dumps(request.content())
-            request: str = '%s %s' % (cmd, content)            
+            # Sort keys so that identical requests have identical messages.
+            request_msg = '%s %s' % (cmd, json.dumps(request.content(), sort_keys=True))
         except (error.NotImplementedException, ValueError) as e:
             raise error.RequestError('failed to serialize JSON request: %s' % e)
 
+        if not request.idempotent:
+            return self._send_message(request, request_msg)
+
+        return self._single_flight.do(request_msg, lambda: self._send_message(request, request_msg))
+
+    def _send_message(self, request: requests.Request, request_msg: str) -> Content:
+        cmd     = request.command
+        limiter = self._trading_limiter if request.trading else self._data_limiter
+        retries = 0
+
+        while True:
+            limiter.acquire()
+            self._scheduler.acquire(request.priority)
+
+            start_time = perf_counter()
+
+            try:
+                cmd_result, content = self._exchange_messages(request_msg)
+            except error.RequestTimeout:
+                self._count_request(cmd, 'TIMEOUT', start_time)
+                raise
+            except error.RequestError:
+                self._count_request(cmd, 'INVALID_RESPONSE', start_time)
+                raise
+            finally:
+                self._scheduler.release()
+
+            self._count_request(cmd, cmd_result.name, start_time)
+
+            if cmd_result not in THROTTLING_CODES:
+                limiter.succeeded()
+                break
+
+            limiter.throttled()
+
+            if not request.idempotent or retries >= self._max_retries:
+                break
+
+            retries += 1
+            self._logger.warning(
+                "command '%s' was throttled (%s); retrying in %.2fs (retry %d of %d)",
+                cmd,
+                cmd_result.name,
+                limiter.backoff,
+                retries,
+                self._max_retries
+            )
+
+        if cmd_result != CommandResultCode.SUCCESS:
+            raise_error(cmd, cmd_result, content)
+
+        return content
+
+    def _exchange_messages(self, request: str) -> Tuple[CommandResultCode, Content]:
+        """Sends a request message and returns the result code and content of its response."""
+
         response: str = ''
 
         try:
@@ -434,10 +996,92 @@ class MetaTrader4(Exchange):
         if content is None:
             content = {}
 
-        if cmd_result != CommandResultCode.SUCCESS:
-            raise_error(cmd, cmd_result, content)
+        return cmd_result, content
 
-        return content
+    def _track_order(self, ticket: int, order: Order):
+        self._orders.set(ticket, order)
+
+    def _untrack_order(self, ticket: int):
+        self._orders.remove(ticket)
+
+    def _updated_order(self, order: Order, **changes) -> Order:
+        """Returns a copy of `order` with the properties in `changes` replaced.
+
+        Tracked orders are never modified, since objects returned by `get_order()`
+        must keep representing the state of an order at the time they were returned.
+        """
+
+        properties = {name[1:]: value for name, value in vars(order).items()}
+        properties.update(changes)
+
+        return Order(**properties)
+
+    def _emit_order_signal(self, order: Order):
+        status = order.status()
+
+        if status == OrderStatus.PENDING:
+            self.order_placed.emit(order)
+        elif status in [OrderStatus.PARTIALLY_FILLED, OrderStatus.FILLED]:
+            self.order_filled.emit(order)
+        elif status == OrderStatus.CLOSED:
+            self.order_closed.emit(order)
+        elif status == OrderStatus.CANCELED:
+            self.order_canceled.emit(order)
+        elif status == OrderStatus.EXPIRED:
+            self.order_expired.emit(order)
+
+    def _on_tick_event(self, event: events.TickEvent):
+        symbol = event.symbol()
+        tick   = event.tick()
+
+        self._ticks_received.labels(symbol).inc()
+
+        # Ticks may still be queued on the socket after unsubscribing.
+        if symbol in self._subscribed_symbols:
+            self._last_ticks[symbol] = (tick, monotonic())
+
+            bars = self._current_bars.get(symbol)
+
+            if bars is not None:
+                for timeframe, bar in bars.items():
+                    bars[timeframe] = self._bar_with_tick(bar, timeframe, tick)
+
+        self.tick_received.emit(symbol, tick)
+
+    def _bar_with_tick(self, bar: Bar, timeframe: Timeframe, tick: Tick) -> Bar:
+        """Returns the current bar of `timeframe` after `tick`, given the current bar `bar` before it."""
+
+        bar_time = timeframe.bar_time(tick.server_time)
+
+        if bar_time > bar.time:
+            return Bar(bar_time, tick.bid, tick.bid, tick.bid, tick.bid, 1)
+
+        # Ticks of previous bars may arrive late; they don't change the current bar.
+        if bar_time < bar.time:
+            return bar
+
+        return Bar(
+            bar.time,
+            bar.open,
+            max(bar.high, tick.bid),
+            min(bar.low,  tick.bid),
+            tick.bid,
+            bar.volume + 1
+        )
+
+    def _on_order_event(self, event: events.OrderEvent):
+        ticket   = event.ticket()
+        order    = event.order()
+        previous = self._orders.get(ticket)
+
+        self._track_order(ticket, order)
+
+        # Events that only change an order's properties, such as its S/L, don't
+        # change its status, and thus aren't notified by any signal. This also
+        # prevents signals already emitted by `place_order()` or `close_order()`
+        # from being emitted again when the event for that change is received.
+        if previous is None or previous.status() != order.status():
+            self._emit_order_signal(order)
 
     def _process_event(self, msg: str):
         """Parses, validates, and notifies an event message.
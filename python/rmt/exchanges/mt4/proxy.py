@@ -0,0 +1,306 @@
+import argparse
+import collections
+import json
+import logging
+import sys
+import zmq
+from time   import monotonic
+from typing import Deque, List, Optional, Set, Tuple
+from .      import CommandResultCode
+
+class Proxy:
+    """Shares one connection to the Expert Server among many local clients.
+
+    The class `Proxy` connects a REQ socket and a SUB socket to the Expert Server,
+    just as `MetaTrader4` does, and binds a ROUTER socket and an XPUB socket which
+    clients connect to instead of the Expert's REP and PUB sockets. A client only
+    has to point `MetaTrader4` to the proxy's ports:
+
+        exchange = MetaTrader4(req_port=32770, sub_port=32771)
+
+    Events published by the Expert are forwarded to clients, and subscriptions are
+    aggregated: the proxy subscribes to a topic once any client subscribes to it,
+    and unsubscribes once no client is subscribed to it anymore.
+
+    Requests of all clients are forwarded to the Expert one at a time, in the order
+    they are received, since the Expert processes requests sequentially anyway.
+    `watchSymbol` requests for a symbol which was already watched are answered by
+    the proxy itself, so that the Expert receives a single `watchSymbol` request
+    per symbol no matter how many clients subscribe to it. Since the Expert has no
+    command to stop watching a symbol, symbols remain watched for as long as the
+    proxy runs.
+
+    If the Expert doesn't respond to a request within `request_timeout` seconds,
+    the request is dropped without a response, so that the client times out as if
+    it were connected to the Expert directly, and the proxy reconnects to the Expert
+    to forward the next request.
+
+    A proxy may be started from the command line (see `main()`):
+
+        python -m rmt.exchanges.mt4.proxy --help
+
+    The package doesn't install console scripts, so the proxy is run as a module
+    rather than as an `rmt-proxy` command.
+    """
+
+    def __init__(self,
+                 upstream_protocol: str   = 'tcp',
+                 upstream_host:     str   = 'localhost',
+                 upstream_req_port: int   = 32768,
+                 upstream_sub_port: int   = 32769,
+                 protocol:          str   = 'tcp',
+                 host:              str   = '127.0.0.1',
+                 router_port:       int   = 32770,
+                 xpub_port:         int   = 32771,
+                 request_timeout:   float = 10
+    ):
+        self._ctx    = zmq.Context.instance()
+        self._logger = logging.getLogger(Proxy.__name__)
+
+        upstream_prefix = upstream_protocol + '://' + upstream_host + ':%s'
+
+        self._upstream_req_addr = upstream_prefix % upstream_req_port
+        self._upstream_req      = self._connect_upstream_req()
+
+        self._upstream_sub = self._ctx.socket(zmq.SUB)
+        self._upstream_sub.connect(upstream_prefix % upstream_sub_port)
+
+        addr_prefix = protocol + '://' + host + ':%s'
+
+        self._router = self._ctx.socket(zmq.ROUTER)
+        self._router.bind(addr_prefix % router_port)
+
+        self._xpub = self._ctx.socket(zmq.XPUB)
+        self._xpub.bind(addr_prefix % xpub_port)
+
+        self._poller = zmq.Poller()
+        self._poller.register(self._upstream_sub, zmq.POLLIN)
+        self._poller.register(self._router,       zmq.POLLIN)
+        self._poller.register(self._xpub,         zmq.POLLIN)
+
+        self._request_timeout = request_timeout
+        self._running         = False
+
+        # Requests waiting to be forwarded, as pairs of a client's envelope (its
+        # identity frames followed by the empty delimiter frame) and the request.
+        self._pending_requests: Deque[Tuple[List[bytes], bytes]] = collections.deque()
+
+        # Request forwarded to the Expert whose response is awaited, if any, along
+        # with the time it was forwarded.
+        self._active_request: Optional[Tuple[List[bytes], bytes]] = None
+        self._active_request_time = 0.0
+
+        self._watched_symbols: Set[str] = set()
+        self._watch_requests_saved = 0
+
+    def watched_symbols(self) -> Set[str]:
+        """Returns the symbols for which a `watchSymbol` request was sent to the Expert."""
+
+        return self._watched_symbols.copy()
+
+    def watch_requests_saved(self) -> int:
+        """Returns the number of `watchSymbol` requests answered without forwarding them."""
+
+        return self._watch_requests_saved
+
+    def run(self, poll_timeout_ms: int = 100):
+        """Forwards messages until `stop()` is called."""
+
+        self._running = True
+
+        while self._running:
+            self.poll(poll_timeout_ms)
+
+    def stop(self):
+        """Makes `run()` return. May be called from any thread."""
+
+        self._running = False
+
+    def poll(self, timeout_ms: int = 0):
+        """Forwards messages received within `timeout_ms` milliseconds."""
+
+        events = dict(self._poller.poll(timeout_ms))
+
+        if self._upstream_sub in events:
+            self._forward_events()
+
+        if self._xpub in events:
+            self._forward_subscriptions()
+
+        if self._router in events:
+            self._receive_requests()
+
+        if self._upstream_req in events:
+            self._receive_response()
+
+        self._check_request_timeout()
+        self._forward_next_request()
+
+    def close(self):
+        self._upstream_req.close(linger=0)
+        self._upstream_sub.close(linger=0)
+        self._router.close(linger=0)
+        self._xpub.close(linger=0)
+
+    #===============================================================================
+    # Internals
+    #===============================================================================
+    def _connect_upstream_req(self) -> zmq.Socket:
+        socket = self._ctx.socket(zmq.REQ)
+        socket.connect(self._upstream_req_addr)
+
+        return socket
+
+    def _forward_events(self):
+        while True:
+            try:
+                self._xpub.send(self._upstream_sub.recv(zmq.NOBLOCK))
+            except zmq.error.Again:
+                break
+
+    def _forward_subscriptions(self):
+        # XPUB only passes on the first subscription to a topic and the last
+        # unsubscription from it, so these are effectively reference counted.
+        while True:
+            try:
+                message = self._xpub.recv(zmq.NOBLOCK)
+            except zmq.error.Again:
+                break
+
+            if len(message) == 0:
+                continue
+
+            topic = message[1:]
+
+            if message[0] == 1:
+                self._logger.debug('subscribing to: %s', topic)
+                self._upstream_sub.subscribe(topic)
+            elif message[0] == 0:
+                self._logger.debug('unsubscribing from: %s', topic)
+                self._upstream_sub.unsubscribe(topic)
+
+    def _receive_requests(self):
+        while True:
+            try:
+                frames = self._router.recv_multipart(zmq.NOBLOCK)
+            except zmq.error.Again:
+                break
+
+            self._pending_requests.append((frames[:-1], frames[-1]))
+
+    def _forward_next_request(self):
+        while self._active_request is None and len(self._pending_requests) > 0:
+            envelope, request = self._pending_requests.popleft()
+
+            symbol = self._watched_symbol(request)
+
+            if symbol is not None and symbol in self._watched_symbols:
+                self._watch_requests_saved += 1
+                self._router.send_multipart(envelope + [str(CommandResultCode.SUCCESS.value).encode()])
+                continue
+
+            self._logger.debug('forwarding request: %s', request)
+
+            self._upstream_req.send(request)
+            self._poller.register(self._upstream_req, zmq.POLLIN)
+
+            self._active_request      = (envelope, request)
+            self._active_request_time = monotonic()
+
+    def _receive_response(self):
+        response = self._upstream_req.recv()
+        self._poller.unregister(self._upstream_req)
+
+        envelope, request = self._active_request
+        self._active_request = None
+
+        self._logger.debug('forwarding response: %s', response)
+
+        symbol = self._watched_symbol(request)
+
+        if symbol is not None and response.split(b' ', 1)[0] == str(CommandResultCode.SUCCESS.value).encode():
+            self._watched_symbols.add(symbol)
+
+        self._router.send_multipart(envelope + [response])
+
+    def _check_request_timeout(self):
+        if self._active_request is None:
+            return
+
+        if monotonic() - self._active_request_time < self._request_timeout:
+            return
+
+        self._logger.warning('request timed out; dropping it: %s', self._active_request[1])
+
+        # A REQ socket can't send another request until it receives a response,
+        # so replace it.
+        self._poller.unregister(self._upstream_req)
+        self._upstream_req.close(linger=0)
+        self._upstream_req = self._connect_upstream_req()
+
+        self._active_request = None
+
+    def _watched_symbol(self, request: bytes) -> Optional[str]:
+        """Returns the symbol of a `watchSymbol` request, or `None` if it's any other request."""
+
+        if not request.startswith(b'watchSymbol '):
+            return None
+
+        try:
+            symbol = json.loads(request[len(b'watchSymbol '):]).get('symbol')
+        except (ValueError, AttributeError):
+            return None
+
+        # Requests to watch all symbols have a response content, which the
+        # proxy doesn't keep, so always forward them.
+        if not isinstance(symbol, str) or symbol == '*':
+            return None
+
+        return symbol
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Runs a `Proxy` with options read from the command line."""
+
+    parser = argparse.ArgumentParser(
+        prog        = 'rmt-proxy',
+        description = 'Shares one connection to the RemoteMetaTrader Expert Server among local clients.'
+    )
+    parser.add_argument('--upstream-protocol', default='tcp')
+    parser.add_argument('--upstream-host',     default='localhost')
+    parser.add_argument('--upstream-req-port', default=32768, type=int, help="port of the Expert's REP socket")
+    parser.add_argument('--upstream-sub-port', default=32769, type=int, help="port of the Expert's PUB socket")
+    parser.add_argument('--protocol',          default='tcp')
+    parser.add_argument('--host',              default='127.0.0.1', help='address on which to bind')
+    parser.add_argument('--req-port',          default=32770, type=int, help='port on which clients send requests')
+    parser.add_argument('--sub-port',          default=32771, type=int, help='port on which clients receive events')
+    parser.add_argument('--request-timeout',   default=10, type=float, help='seconds to wait for responses')
+    parser.add_argument('-v', '--verbose',     action='store_true')
+
+    args = parser.parse_args(argv)
+
+    logging.basicConfig()
+    logging.getLogger().setLevel(logging.DEBUG if args.verbose else logging.INFO)
+
+    proxy = Proxy(
+        args.upstream_protocol,
+        args.upstream_host,
+        args.upstream_req_port,
+        args.upstream_sub_port,
+        args.protocol,
+        args.host,
+        args.req_port,
+        args.sub_port,
+        args.request_timeout
+    )
+
+    try:
+        proxy.run()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        proxy.close()
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
\ No newline at end of file
@@ -75,5 +75,6 @@ def raise_error(command: str, result_code: CommandResultCode, content: Content)
     else:
         raise error.ExecutionError(
             "execution of command '%s' failed with code %s (%s)"
-            % (command, result_code.value, result_code.name)
+            % (command, result_code.value, result_code.name),
+            result_code
         )
\ No newline at end of file
@@ -0,0 +1,59 @@
+import heapq
+import itertools
+import threading
+from typing import List, Tuple
+
+class RequestScheduler:
+    """Lets one request at a time be sent, choosing the highest-priority request waiting.
+
+    A REQ socket can only have one request outstanding, so threads which send
+    requests through the same socket must take turns. The class `RequestScheduler`
+    decides whose turn it is: once the request being sent completes, the waiting
+    request with the lowest priority value goes next, and requests of the same
+    priority go in the order they started waiting.
+
+    A request which is being sent is never interrupted. Thus, long operations
+    should be split into several requests, so that urgent requests may be sent
+    in between them.
+    """
+
+    def __init__(self):
+        self._cond    = threading.Condition()
+        self._busy    = False
+        self._counter = itertools.count()
+
+        # Heap of the priority and arrival order of waiting requests.
+        self._waiting: List[Tuple[int, int]] = []
+
+    def acquire(self, priority: int):
+        """Blocks until it's the turn of a request of `priority` to be sent."""
+
+        with self._cond:
+            entry = (priority, next(self._counter))
+            heapq.heappush(self._waiting, entry)
+
+            try:
+                while self._busy or self._waiting[0] != entry:
+                    self._cond.wait()
+            except BaseException:
+                # Don't leave the entry in the heap, or no request would get a turn after it.
+                self._waiting.remove(entry)
+                heapq.heapify(self._waiting)
+                self._cond.notify_all()
+                raise
+
+            heapq.heappop(self._waiting)
+            self._busy = True
+
+    def release(self):
+        """Signals that the request which acquired the scheduler has completed."""
+
+        with self._cond:
+            self._busy = False
+            self._cond.notify_all()
+
+    def waiting(self) -> int:
+        """Returns the number of requests waiting for their turn."""
+
+        with self._cond:
+            return len(self._waiting)
\ No newline at end of file
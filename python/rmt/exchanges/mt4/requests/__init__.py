@@ -1,10 +1,13 @@
-from .request          import Request
-from .get_tick         import GetTickRequest
-from .get_instrument   import GetInstrumentRequest
-from .get_current_bar  import GetCurrentBarRequest
-from .get_history_bars import GetHistoryBarsRequest
-from .get_order        import GetOrderRequest
-from .watch_symbol     import WatchSymbolRequest
-from .place_order      import PlaceOrderRequest
-from .close_order      import CloseOrderRequest
-from .modify_order     import ModifyOrderRequest
\ No newline at end of file
+from .request               import Request, RequestPriority
+from .get_tick              import GetTickRequest
+from .get_instrument        import GetInstrumentRequest
+from .get_instruments       import GetInstrumentsRequest
+from .get_instrument_levels import GetInstrumentLevelsRequest
+from .get_current_bar       import GetCurrentBarRequest
+from .get_history_bars      import GetHistoryBarsRequest
+from .get_order             import GetOrderRequest
+from .get_orders            import GetOrdersRequest
+from .watch_symbol          import WatchSymbolRequest
+from .place_order           import PlaceOrderRequest
+from .close_order           import CloseOrderRequest
+from .modify_order          import ModifyOrderRequest
\ No newline at end of file
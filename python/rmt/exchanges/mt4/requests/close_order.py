@@ -1,9 +1,11 @@
 from typing import Optional
 from ..     import Content
-from .      import Request
+from .      import Request, RequestPriority
 
 class CloseOrderRequest(Request):
-    command = 'closeOrder'
+    command    = 'closeOrder'
+    trading    = True
+    priority   = RequestPriority.TRADING
 
     def __init__(self,
                  ticket:   int,
@@ -3,7 +3,8 @@ from ..  import Content
 from .   import Request
 
 class GetCurrentBarRequest(Request):
-    command = 'getCurrentBar'
+    command    = 'getCurrentBar'
+    idempotent = True
 
     def __init__(self, symbol: str, timeframe: Timeframe):
         super().__init__()
@@ -2,10 +2,12 @@ from datetime import datetime
 from typing   import Optional
 from rmt      import Timeframe
 from ..       import Content
-from .        import Request
+from .        import Request, RequestPriority
 
 class GetHistoryBarsRequest(Request):
-    command = 'getHistoryBars'
+    command    = 'getHistoryBars'
+    idempotent = True
+    priority   = RequestPriority.HISTORY
 
     def __init__(self,
                  symbol:     str,
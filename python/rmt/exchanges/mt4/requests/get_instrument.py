@@ -2,7 +2,8 @@ from .. import Content
 from .  import Request
 
 class GetInstrumentRequest(Request):
-    command = 'getInstrument'
+    command    = 'getInstrument'
+    idempotent = True
 
     def __init__(self, symbol: str):
         super().__init__()
@@ -0,0 +1,4 @@
+from .get_instruments import GetInstrumentsRequest
+
+class GetInstrumentLevelsRequest(GetInstrumentsRequest):
+    command = 'getInstrumentLevels'
\ No newline at end of file
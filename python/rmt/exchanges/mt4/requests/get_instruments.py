@@ -0,0 +1,20 @@
+from typing import Iterable, Optional
+from ..     import Content
+from .      import Request
+
+class GetInstrumentsRequest(Request):
+    command    = 'getInstruments'
+    idempotent = True
+
+    def __init__(self, symbols: Optional[Iterable[str]] = None):
+        super().__init__()
+
+        self._symbols = list(symbols) if symbols is not None else None
+
+    def content(self) -> Content:
+        msg = {}
+
+        if self._symbols is not None:
+            msg['symbols'] = self._symbols
+
+        return msg
\ No newline at end of file
@@ -2,7 +2,8 @@ from .. import Content
 from .  import Request
 
 class GetOrderRequest(Request):
-    command = 'getOrder'
+    command    = 'getOrder'
+    idempotent = True
 
     def __init__(self, ticket: int):
         super().__init__()
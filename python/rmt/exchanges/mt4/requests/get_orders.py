@@ -0,0 +1,46 @@
+from datetime import datetime
+from typing   import Optional
+from ..       import Content
+from .        import Request
+
+class GetOrdersRequest(Request):
+    command    = 'getOrders'
+    idempotent = True
+
+    def __init__(self,
+                 symbol:       Optional[str]      = None,
+                 magic_number: Optional[int]      = None,
+                 start_time:   Optional[datetime] = None,
+                 end_time:     Optional[datetime] = None,
+                 history:      bool               = False
+    ):
+        super().__init__()
+
+        if symbol == '':
+            raise ValueError('symbol must not be empty')
+
+        self._symbol       = symbol
+        self._magic_number = magic_number
+        self._start_time   = start_time
+        self._end_time     = end_time
+        self._history      = history
+
+    def content(self) -> Content:
+        msg = {}
+
+        if self._history:
+            msg['history'] = True
+
+        if self._symbol is not None:
+            msg['symbol'] = self._symbol
+
+        if self._magic_number is not None:
+            msg['magic'] = int(self._magic_number)
+
+        if isinstance(self._start_time, datetime):
+            msg['start_time'] = int(self._start_time.timestamp())
+
+        if isinstance(self._end_time, datetime):
+            msg['end_time'] = int(self._end_time.timestamp())
+
+        return msg
\ No newline at end of file
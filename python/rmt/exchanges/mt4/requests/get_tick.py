@@ -2,7 +2,8 @@ from .. import Content
 from .  import Request
 
 class GetTickRequest(Request):
-    command = 'getTick'
+    command    = 'getTick'
+    idempotent = True
 
     def __init__(self, symbol: str):
         super().__init__()
@@ -1,10 +1,12 @@
 from datetime import datetime
 from typing   import Optional
 from ..       import Content
-from .        import Request
+from .        import Request, RequestPriority
 
 class ModifyOrderRequest(Request):
-    command = 'modifyOrder'
+    command    = 'modifyOrder'
+    trading    = True
+    priority   = RequestPriority.TRADING
 
     def __init__(self,
                  ticket:      int,
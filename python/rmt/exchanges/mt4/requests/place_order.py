@@ -1,10 +1,12 @@
 from datetime import datetime
 from typing   import Optional
 from ..       import OperationCode, Content
-from .        import Request
+from .        import Request, RequestPriority
 
 class PlaceOrderRequest(Request):
-    command = 'placeOrder'
+    command    = 'placeOrder'
+    trading    = True
+    priority   = RequestPriority.TRADING
 
     def __init__(self,
                  symbol:       str,
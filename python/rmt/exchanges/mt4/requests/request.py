@@ -1,8 +1,31 @@
-from rmt import error
-from ..  import Content
+from enum import IntEnum
+from rmt  import error
+from ..   import Content
+
+class RequestPriority(IntEnum):
+    """Priority of a request when several are waiting to be sent. Lower values go first."""
+
+    TRADING = 0
+    """Order entry and exit."""
+
+    QUERY = 1
+    """Quotes, instruments, and order queries."""
+
+    HISTORY = 2
+    """History downloads."""
 
 class Request:
     command = ''
+    """Name of the command executed by the Expert."""
+
+    trading = False
+    """Whether the command is a trade operation, as opposed to a data query."""
+
+    idempotent = False
+    """Whether executing the command more than once has the same effect as executing it once."""
+
+    priority = RequestPriority.QUERY
+    """Priority of the request when several are waiting to be sent."""
 
     def content(self) -> Content:
         raise error.NotImplementedException(self.__class__, 'content')
\ No newline at end of file
@@ -2,7 +2,8 @@ from .. import Content
 from .  import Request
 
 class WatchSymbolRequest(Request):
-    command = 'watchSymbol'
+    command    = 'watchSymbol'
+    idempotent = True
 
     def __init__(self, symbol: str):
         super().__init__()
@@ -1,7 +1,10 @@
-from .get_tick         import GetTickResponse
-from .get_instrument   import GetInstrumentResponse
-from .get_current_bar  import GetCurrentBarResponse
-from .get_history_bars import GetHistoryBarsResponse
-from .get_order        import GetOrderResponse
-from .place_order      import PlaceOrderResponse
-from .close_order      import CloseOrderResponse
\ No newline at end of file
+from .get_tick              import GetTickResponse
+from .get_instrument        import GetInstrumentResponse
+from .get_instruments       import GetInstrumentsResponse
+from .get_instrument_levels import GetInstrumentLevelsResponse
+from .get_current_bar       import GetCurrentBarResponse
+from .get_history_bars      import GetHistoryBarsResponse
+from .get_order             import GetOrderResponse
+from .get_orders            import GetOrdersResponse
+from .place_order           import PlaceOrderResponse
+from .close_order           import CloseOrderResponse
\ No newline at end of file
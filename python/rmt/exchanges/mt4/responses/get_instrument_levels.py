@@ -0,0 +1,24 @@
+from typing import Dict, Tuple
+from rmt    import jsonutil
+from ..     import Content
+
+class GetInstrumentLevelsResponse:
+    def __init__(self, content: Content):
+        if not isinstance(content, dict):
+            raise ValueError('instrument levels response content is of invalid type (expected: object, got: array)')
+
+        self._levels: Dict[str, Tuple[int, int, int]] = {}
+
+        for symbol in content:
+            obj = jsonutil.read_required(content, symbol, dict)
+
+            min_stop_lvl = jsonutil.read_required(obj, 'minstop',   int)
+            freeze_lvl   = jsonutil.read_required(obj, 'freezelvl', int)
+            spread       = jsonutil.read_required(obj, 'spread',    int)
+
+            self._levels[symbol] = (min_stop_lvl, freeze_lvl, spread)
+
+    def levels(self) -> Dict[str, Tuple[int, int, int]]:
+        """Returns the minimum stop level, freeze level, and spread of each instrument."""
+
+        return self._levels
\ No newline at end of file
@@ -0,0 +1,19 @@
+from typing import Dict
+from rmt    import Instrument, jsonutil
+from ..     import Content
+from .      import GetInstrumentResponse
+
+class GetInstrumentsResponse:
+    def __init__(self, content: Content):
+        if not isinstance(content, dict):
+            raise ValueError('instruments response content is of invalid type (expected: object, got: array)')
+
+        self._instruments: Dict[str, Instrument] = {}
+
+        for symbol in content:
+            obj = jsonutil.read_required(content, symbol, dict)
+
+            self._instruments[symbol] = GetInstrumentResponse(obj).instrument(symbol)
+
+    def instruments(self) -> Dict[str, Instrument]:
+        return self._instruments
\ No newline at end of file
@@ -0,0 +1,24 @@
+from typing import Dict
+from rmt    import Order, jsonutil
+from ..     import Content
+from .      import GetOrderResponse
+
+class GetOrdersResponse:
+    def __init__(self, content: Content):
+        # The Expert sends no content if no orders match, which is read as an empty object.
+        if content is None or content == {}:
+            content = []
+
+        if not isinstance(content, list):
+            raise ValueError('orders response content is of invalid type (expected: array, got: object)')
+
+        self._orders: Dict[int, Order] = {}
+
+        for i, _ in enumerate(content):
+            obj    = jsonutil.read_required(content, i, dict)
+            ticket = jsonutil.read_required(obj, 'ticket', int)
+
+            self._orders[ticket] = GetOrderResponse(obj).order()
+
+    def orders(self) -> Dict[int, Order]:
+        return self._orders
\ No newline at end of file
@@ -0,0 +1,81 @@
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
+
+class _Call:
+    """Call in flight, whose result is shared by every caller of the same key."""
+
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done   = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+
+class SingleFlight:
+    """Makes concurrent calls with the same key share the execution of a single call.
+
+    The class `SingleFlight` runs the function passed to `do()` only if no other
+    call with the same key is in flight. Otherwise, the caller waits for the call
+    in flight to complete, and gets its result or exception, without running its
+    own function. Once a call completes, the next call with its key runs again.
+
+    This is meant for requests which don't change anything, such as getting a
+    tick, where callers asking the same thing at the same moment may as well
+    share the response.
+    """
+
+    def __init__(self):
+        self._lock  = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._calls_saved = 0
+
+    def calls_saved(self) -> int:
+        """Returns the number of calls which shared the result of a call in flight."""
+
+        return self._calls_saved
+
+    def in_flight(self) -> int:
+        """Returns the number of keys whose call is in flight."""
+
+        with self._lock:
+            return len(self._calls)
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """Returns the result of `fn()`, or of the call with `key` in flight.
+
+        Raises
+        ------
+        BaseException
+            Any exception raised by `fn()`, or by the call in flight.
+        """
+
+        with self._lock:
+            call = self._calls.get(key)
+
+            if call is None:
+                call = self._calls[key] = _Call()
+                leader = True
+            else:
+                self._calls_saved += 1
+                leader = False
+
+        if not leader:
+            call.done.wait()
+
+            if call.error is not None:
+                raise call.error
+
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+            call.done.set()
+
+        return call.result
\ No newline at end of file
@@ -0,0 +1,196 @@
+import zmq
+import json
+import logging
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+from .      import CommandResultCode, Content
+
+Handler = Callable[[Content], Tuple[CommandResultCode, Optional[Content]]]
+"""Function which executes a command and returns its result code and response content."""
+
+class StubServer:
+    """Stand-in for the Expert Server run on MetaTrader 4.
+
+    The class `StubServer` binds a REP socket and a PUB socket, just as the
+    Expert Server does, and answers requests by calling handlers registered
+    by the user. This allows `MetaTrader4` to be exercised without a running
+    terminal, such as when testing client code or measuring its overhead.
+
+    Requests may be processed on the caller's thread by `process_requests()`,
+    or on a background thread started by `start()`. Events may be published
+    at any time by calling `publish()`.
+
+    Commands for which no handler is registered are answered with the result
+    code `CommandResultCode.UNKNOWN_REQUEST_COMMAND`, as the Expert does.
+    """
+
+    def __init__(self,
+                 protocol: str = 'tcp',
+                 host:     str = '*',
+                 rep_port: int = 32768,
+                 pub_port: int = 32769
+    ):
+        ctx = zmq.Context.instance()
+        self._rep_socket = ctx.socket(zmq.REP)
+        self._pub_socket = ctx.socket(zmq.PUB)
+
+        addr_prefix = protocol + '://' + host + ':%s'
+
+        self._rep_socket.bind(addr_prefix % rep_port)
+        self._pub_socket.bind(addr_prefix % pub_port)
+
+        self._logger   = logging.getLogger(StubServer.__name__)
+        self._handlers: Dict[str, Handler] = {}
+        self._requests: List[Tuple[str, Content]] = []
+        self._thread:   Optional[threading.Thread] = None
+        self._running  = False
+
+    def set_handler(self, command: str, handler: Handler):
+        """Registers a function to execute a command."""
+
+        self._handlers[command] = handler
+
+    def set_response(self,
+                     command: str,
+                     content: Optional[Content] = None,
+                     code:    CommandResultCode = CommandResultCode.SUCCESS
+    ):
+        """Registers a fixed response to a command."""
+
+        self._handlers[command] = lambda _: (code, content)
+
+    def set_instruments(self, instruments: Dict[str, Content]):
+        """Registers handlers for `getInstrument`, `getInstruments`, and `getInstrumentLevels`.
+
+        `instruments` maps symbols to their instrument objects, in the format
+        of a `getInstrument` response.
+        """
+
+        def get_instrument(content: Content) -> Tuple[CommandResultCode, Optional[Content]]:
+            symbol = content.get('symbol')
+
+            if symbol not in instruments:
+                return CommandResultCode.UNKNOWN_SYMBOL, None
+
+            return CommandResultCode.SUCCESS, instruments[symbol]
+
+        def get_instruments(content: Content) -> Tuple[CommandResultCode, Optional[Content]]:
+            symbols = content.get('symbols', list(instruments))
+
+            return CommandResultCode.SUCCESS, {s: instruments[s] for s in symbols if s in instruments}
+
+        def get_instrument_levels(content: Content) -> Tuple[CommandResultCode, Optional[Content]]:
+            _, found = get_instruments(content)
+
+            return CommandResultCode.SUCCESS, {
+                s: {k: obj[k] for k in ('minstop', 'freezelvl', 'spread')}
+                for s, obj in found.items()
+            }
+
+        self.set_handler('getInstrument',       get_instrument)
+        self.set_handler('getInstruments',      get_instruments)
+        self.set_handler('getInstrumentLevels', get_instrument_levels)
+
+    def requests(self) -> List[Tuple[str, Content]]:
+        """Returns the command and content of all requests received so far."""
+
+        return list(self._requests)
+
+    def process_requests(self, timeout_ms: int = 50) -> int:
+        """Answers requests until none is received within `timeout_ms` milliseconds.
+
+        Returns the number of requests answered.
+        """
+
+        count = 0
+
+        while self._rep_socket.poll(timeout_ms, zmq.POLLIN) != 0:
+            request = self._rep_socket.recv_string()
+            self._logger.debug('received request: %s', request)
+
+            response = self._process_one(request)
+            self._logger.debug('sending response: %s', response)
+
+            self._rep_socket.send_string(response)
+            count += 1
+
+        return count
+
+    def publish(self, event_name: str, content: Content):
+        """Publishes an event on the PUB socket."""
+
+        self._pub_socket.send_string('%s %s' % (event_name, json.dumps(content)))
+
+    def publish_tick(self, symbol: str, timestamp: int, bid: float, ask: float):
+        """Publishes a tick event, as the Expert does when an instrument's quotes change."""
+
+        self.publish('tick.' + symbol, [timestamp, bid, ask])
+
+    def publish_order(self, ticket: int, content: Content):
+        """Publishes an order event, as the Expert does when an order changes.
+
+        `content` is an order object in the format of a `getOrder` response.
+        """
+
+        self.publish('order.%s' % ticket, content)
+
+    def start(self):
+        """Starts answering requests on a background thread."""
+
+        if self._thread is not None:
+            return
+
+        self._running = True
+        self._thread  = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stops the thread started by `start()`."""
+
+        if self._thread is None:
+            return
+
+        self._running = False
+        self._thread.join()
+        self._thread = None
+
+    def close(self):
+        self.stop()
+        self._rep_socket.close()
+        self._pub_socket.close()
+
+    #===============================================================================
+    # Internals
+    #===============================================================================
+    def _run(self):
+        while self._running:
+            self.process_requests()
+
+    def _process_one(self, request: str) -> str:
+        sep_index = request.find(' ')
+
+        if sep_index == -1:
+            command = request
+            content = {}
+        else:
+            command = request[:sep_index]
+
+            try:
+                content = json.loads(request[(sep_index + 1):])
+            except ValueError:
+                return str(CommandResultCode.INVALID_JSON.value)
+
+        if command == '' or not command.isalpha():
+            return str(CommandResultCode.INVALID_REQUEST.value)
+
+        self._requests.append((command, content))
+
+        if command not in self._handlers:
+            return str(CommandResultCode.UNKNOWN_REQUEST_COMMAND.value)
+
+        code, response_content = self._handlers[command](content)
+
+        if response_content is None:
+            return str(code.value)
+
+        return '%s %s' % (code.value, json.dumps(response_content))
\ No newline at end of file
@@ -0,0 +1,17 @@
+from typing          import TYPE_CHECKING
+from rmt.lazyutil    import lazy_attributes
+from .indicator      import Indicator
+from .moving_average import SMA, EMA, WMA
+from .rolling        import RollingMin, RollingMax
+from .rsi            import RSI
+from .atr            import ATR
+from .bollinger      import Bands, BollingerBands
+from .macd           import MACDValue, MACD
+
+# The vectorized indicators require NumPy, so they're imported on first access.
+if TYPE_CHECKING:
+    from . import vectorized
+
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    'vectorized': ('.vectorized', None)
+})
\ No newline at end of file
@@ -0,0 +1,54 @@
+from typing import Optional
+from rmt    import Bar
+from .      import Indicator
+
+class ATR(Indicator):
+    """Average true range of bars, with Wilder's smoothing.
+
+    The true range of a bar is the greatest of its range and the distances from
+    the previous bar's close to its high and low. The first bar has no previous
+    bar, so its true range is just its range. The average starts as the simple
+    average of the first `period` true ranges.
+
+    Since true ranges are computed from bars, updating the indicator with plain
+    values by `update()` takes each value as a bar whose prices are all that value.
+    """
+
+    def __init__(self, period: int = 14):
+        super().__init__(period)
+        self.reset()
+
+    def update(self, value: float) -> Optional[float]:
+        return self._update(value, value, value)
+
+    def update_bar(self, bar: Bar) -> Optional[float]:
+        return self._update(bar.high, bar.low, bar.close)
+
+    def reset(self):
+        self._previous_close: Optional[float] = None
+        self._count = 0
+        self._sum   = 0.0
+        self._value = None
+
+    #===============================================================================
+    # Internals
+    #===============================================================================
+    def _update(self, high: float, low: float, close: float) -> Optional[float]:
+        if self._previous_close is None:
+            true_range = high - low
+        else:
+            true_range = max(high, self._previous_close) - min(low, self._previous_close)
+
+        self._previous_close = close
+
+        if self._value is not None:
+            self._value += (true_range - self._value) / self._period
+            return self._value
+
+        self._count += 1
+        self._sum   += true_range
+
+        if self._count == self._period:
+            self._value = self._sum / self._period
+
+        return self._value
\ No newline at end of file
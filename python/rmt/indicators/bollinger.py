@@ -0,0 +1,66 @@
+import collections
+import math
+from typing import Deque, NamedTuple, Optional
+from .      import Indicator
+
+class Bands(NamedTuple):
+    middle: float
+    upper:  float
+    lower:  float
+
+class BollingerBands(Indicator):
+    """Bollinger bands: the simple moving average of the last `period` values, and
+    bands `deviations` standard deviations above and below it.
+
+    The standard deviation is the population standard deviation of the window,
+    as on MetaTrader. The mean and the sum of squared deviations of the window
+    are updated as values enter and leave it, and recomputed from the window once
+    every `period` updates so that rounding errors don't accumulate.
+    """
+
+    def __init__(self, period: int = 20, deviations: float = 2):
+        super().__init__(period)
+
+        self._deviations = deviations
+        self._window: Deque[float] = collections.deque()
+        self._mean = 0.0
+        self._m2   = 0.0
+        self._updates_since_resum = 0
+
+    @property
+    def deviations(self) -> float:
+        return self._deviations
+
+    def update(self, value: float) -> Optional[Bands]:
+        window = self._window
+        window.append(value)
+
+        if len(window) > self._period:
+            old        = window.popleft()
+            old_mean   = self._mean
+            self._mean = old_mean + (value - old) / self._period
+            self._m2   += (value - old) * (value - self._mean + old - old_mean)
+        else:
+            delta       = value - self._mean
+            self._mean += delta / len(window)
+            self._m2   += delta * (value - self._mean)
+
+        self._updates_since_resum += 1
+
+        if self._updates_since_resum >= self._period:
+            self._mean = sum(window) / len(window)
+            self._m2   = sum((v - self._mean) ** 2 for v in window)
+            self._updates_since_resum = 0
+
+        if len(window) == self._period:
+            width       = self._deviations * math.sqrt(max(self._m2, 0.0) / self._period)
+            self._value = Bands(self._mean, self._mean + width, self._mean - width)
+
+        return self._value
+
+    def reset(self):
+        self._window.clear()
+        self._mean  = 0.0
+        self._m2    = 0.0
+        self._value = None
+        self._updates_since_resum = 0
\ No newline at end of file
@@ -0,0 +1,67 @@
+from typing import Any, Iterable, Optional, Union
+from rmt    import error, Bar
+
+class Indicator:
+    """Technical indicator computed incrementally from a stream of values.
+
+    An indicator is updated with one value at a time, such as the close of each
+    bar or the bid of each tick, by `update()`, and each update takes constant
+    time regardless of the indicator's period. The indicator's value is `None`
+    until it has received enough values to be computed, at which point it becomes
+    `ready`.
+
+    Updating an indicator with a `Bar` by `update_bar()` updates it with the bar's
+    close, unless the indicator uses other prices of bars, as `ATR` does.
+
+    An indicator is usually seeded with history bars by `seed()` before being
+    updated with new bars as they close, for instance by `Strategy.add_indicator()`.
+    """
+
+    def __init__(self, period: int):
+        if period < 1:
+            raise ValueError('period must be at least 1 (got: %s)' % period)
+
+        self._period = period
+        self._value: Optional[Any] = None
+
+    @property
+    def period(self) -> int:
+        return self._period
+
+    @property
+    def value(self) -> Optional[Any]:
+        """Current value of the indicator, or `None` if it's not ready yet."""
+
+        return self._value
+
+    @property
+    def ready(self) -> bool:
+        """Whether the indicator has received enough values to be computed."""
+
+        return self._value is not None
+
+    def update(self, value: float) -> Optional[Any]:
+        """Updates the indicator with a new value, and returns the indicator's value."""
+
+        raise error.NotImplementedException(self.__class__, 'update')
+
+    def update_bar(self, bar: Bar) -> Optional[Any]:
+        """Updates the indicator with a new bar, and returns the indicator's value."""
+
+        return self.update(bar.close)
+
+    def seed(self, history: Iterable[Union[Bar, float]]) -> Optional[Any]:
+        """Updates the indicator with history bars or values, oldest first, and returns its value."""
+
+        for item in history:
+            if isinstance(item, Bar):
+                self.update_bar(item)
+            else:
+                self.update(float(item))
+
+        return self._value
+
+    def reset(self):
+        """Clears all values received, making the indicator as if it were just created."""
+
+        raise error.NotImplementedException(self.__class__, 'reset')
\ No newline at end of file
@@ -0,0 +1,50 @@
+from typing import NamedTuple, Optional
+from .      import Indicator, EMA
+
+class MACDValue(NamedTuple):
+    macd:      float
+    signal:    float
+    histogram: float
+
+class MACD(Indicator):
+    """Moving average convergence/divergence.
+
+    The MACD line is the difference between a fast and a slow `EMA` of values,
+    the signal line is an `EMA` of the MACD line, and the histogram is the
+    difference between both lines. The indicator's `period` is that of the slow
+    average.
+    """
+
+    def __init__(self, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9):
+        if fast_period >= slow_period:
+            raise ValueError(
+                'fast period must be shorter than slow period (got: %s and %s)'
+                % (fast_period, slow_period)
+            )
+
+        super().__init__(slow_period)
+
+        self._fast   = EMA(fast_period)
+        self._slow   = EMA(slow_period)
+        self._signal = EMA(signal_period)
+
+    def update(self, value: float) -> Optional[MACDValue]:
+        fast = self._fast.update(value)
+        slow = self._slow.update(value)
+
+        if slow is None:
+            return None
+
+        macd   = fast - slow
+        signal = self._signal.update(macd)
+
+        if signal is not None:
+            self._value = MACDValue(macd, signal, macd - signal)
+
+        return self._value
+
+    def reset(self):
+        self._fast.reset()
+        self._slow.reset()
+        self._signal.reset()
+        self._value = None
\ No newline at end of file
@@ -0,0 +1,122 @@
+import collections
+from typing import Deque, Optional
+from .      import Indicator
+
+class SMA(Indicator):
+    """Simple moving average of the last `period` values.
+
+    The sum of the window is kept as values enter and leave it. So that rounding
+    errors don't accumulate over long streams, the sum is recomputed from the
+    window once every `period` updates, which keeps updates constant-time on
+    average.
+    """
+
+    def __init__(self, period: int):
+        super().__init__(period)
+
+        self._window: Deque[float] = collections.deque()
+        self._sum = 0.0
+        self._updates_since_resum = 0
+
+    def update(self, value: float) -> Optional[float]:
+        self._window.append(value)
+        self._sum += value
+
+        if len(self._window) > self._period:
+            self._sum -= self._window.popleft()
+
+        self._updates_since_resum += 1
+
+        if self._updates_since_resum >= self._period:
+            self._sum = sum(self._window)
+            self._updates_since_resum = 0
+
+        if len(self._window) == self._period:
+            self._value = self._sum / self._period
+
+        return self._value
+
+    def reset(self):
+        self._window.clear()
+        self._sum   = 0.0
+        self._value = None
+        self._updates_since_resum = 0
+
+class EMA(Indicator):
+    """Exponential moving average with a smoothing factor of `2 / (period + 1)`.
+
+    The average starts as the simple average of the first `period` values.
+    """
+
+    def __init__(self, period: int):
+        super().__init__(period)
+
+        self._alpha = 2 / (period + 1)
+        self._count = 0
+        self._sum   = 0.0
+
+    def update(self, value: float) -> Optional[float]:
+        if self._value is not None:
+            self._value += self._alpha * (value - self._value)
+            return self._value
+
+        self._count += 1
+        self._sum   += value
+
+        if self._count == self._period:
+            self._value = self._sum / self._period
+
+        return self._value
+
+    def reset(self):
+        self._count = 0
+        self._sum   = 0.0
+        self._value = None
+
+class WMA(Indicator):
+    """Linearly weighted moving average of the last `period` values.
+
+    The most recent value has a weight of `period`, the one before it a weight
+    of `period - 1`, and so on. Sliding the window subtracts the plain sum of
+    the window from the weighted sum, which lowers the weight of every value in
+    the window by one, so each update takes constant time. As with `SMA`, both
+    sums are recomputed from the window once every `period` updates.
+    """
+
+    def __init__(self, period: int):
+        super().__init__(period)
+
+        self._window: Deque[float] = collections.deque()
+        self._sum          = 0.0
+        self._weighted_sum = 0.0
+        self._weight_total = period * (period + 1) / 2
+        self._updates_since_resum = 0
+
+    def update(self, value: float) -> Optional[float]:
+        if len(self._window) < self._period:
+            self._window.append(value)
+            self._sum          += value
+            self._weighted_sum += len(self._window) * value
+        else:
+            self._weighted_sum += self._period * value - self._sum
+            self._sum          += value - self._window.popleft()
+            self._window.append(value)
+
+        self._updates_since_resum += 1
+
+        if self._updates_since_resum >= self._period:
+            self._sum          = sum(self._window)
+            self._weighted_sum = sum(i * v for i, v in enumerate(self._window, 1))
+            self._updates_since_resum = 0
+
+        if len(self._window) == self._period:
+            self._value = self._weighted_sum / self._weight_total
+
+        return self._value
+
+    def reset(self):
+        self._window.clear()
+        self._sum          = 0.0
+        self._weighted_sum = 0.0
+        self._value        = None
+        self._updates_since_resum = 0
\ No newline at end of file
@@ -0,0 +1,63 @@
+import collections
+import operator
+from typing import Callable, Deque, Optional, Tuple
+from rmt    import Bar
+from .      import Indicator
+
+class _RollingExtreme(Indicator):
+    """Extreme of the last `period` values, as determined by `is_better`.
+
+    A deque holds the values which may still become the extreme once the values
+    before them leave the window, along with their positions in the stream. Each
+    value is appended once and removed at most once, so updates take constant
+    time on average.
+    """
+
+    def __init__(self, period: int, is_better: Callable[[float, float], bool]):
+        super().__init__(period)
+
+        self._is_better = is_better
+        self._count     = 0
+        self._candidates: Deque[Tuple[int, float]] = collections.deque()
+
+    def update(self, value: float) -> Optional[float]:
+        candidates = self._candidates
+
+        # Values no better than the new one will leave the window before it, so
+        # they can never be the extreme again.
+        while len(candidates) > 0 and not self._is_better(candidates[-1][1], value):
+            candidates.pop()
+
+        candidates.append((self._count, value))
+        self._count += 1
+
+        if candidates[0][0] <= self._count - 1 - self._period:
+            candidates.popleft()
+
+        if self._count >= self._period:
+            self._value = candidates[0][1]
+
+        return self._value
+
+    def reset(self):
+        self._candidates.clear()
+        self._count = 0
+        self._value = None
+
+class RollingMin(_RollingExtreme):
+    """Lowest of the last `period` values. Bars are taken by their low."""
+
+    def __init__(self, period: int):
+        super().__init__(period, operator.lt)
+
+    def update_bar(self, bar: Bar) -> Optional[float]:
+        return self.update(bar.low)
+
+class RollingMax(_RollingExtreme):
+    """Highest of the last `period` values. Bars are taken by their high."""
+
+    def __init__(self, period: int):
+        super().__init__(period, operator.gt)
+
+    def update_bar(self, bar: Bar) -> Optional[float]:
+        return self.update(bar.high)
\ No newline at end of file
@@ -0,0 +1,54 @@
+from typing import Optional
+from .      import Indicator
+
+class RSI(Indicator):
+    """Relative strength index, with Wilder's smoothing of gains and losses.
+
+    The average gain and loss start as the simple averages of the first `period`
+    changes, so the index is ready after `period + 1` values. From then on, each
+    change is weighted by `1 / period`.
+    """
+
+    def __init__(self, period: int = 14):
+        super().__init__(period)
+        self.reset()
+
+    def update(self, value: float) -> Optional[float]:
+        previous = self._previous
+        self._previous = value
+
+        if previous is None:
+            return None
+
+        change = value - previous
+        gain   = max(change, 0.0)
+        loss   = max(-change, 0.0)
+
+        if self._count < self._period:
+            # Sum the first changes, and average them once there are `period` of them.
+            self._count    += 1
+            self._avg_gain += gain
+            self._avg_loss += loss
+
+            if self._count < self._period:
+                return None
+
+            self._avg_gain /= self._period
+            self._avg_loss /= self._period
+        else:
+            self._avg_gain += (gain - self._avg_gain) / self._period
+            self._avg_loss += (loss - self._avg_loss) / self._period
+
+        if self._avg_loss == 0:
+            self._value = 50.0 if self._avg_gain == 0 else 100.0
+        else:
+            self._value = 100 - 100 / (1 + self._avg_gain / self._avg_loss)
+
+        return self._value
+
+    def reset(self):
+        self._previous: Optional[float] = None
+        self._count    = 0
+        self._avg_gain = 0.0
+        self._avg_loss = 0.0
+        self._value    = None
\ No newline at end of file
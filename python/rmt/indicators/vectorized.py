@@ -0,0 +1,235 @@
+################################################################################
+# NumPy versions of the streaming indicators of `rmt.indicators`.
+#
+# Each function computes an indicator over a whole array of values in one call,
+# and returns an array of the same length holding, at each position, the value
+# the streaming indicator would have after being updated with the values up to
+# that position, or NaN where the streaming indicator wouldn't be ready yet.
+# Results are equal to those of the streaming indicators up to rounding errors.
+#
+# Windowed indicators, such as `sma()`, reduce a sliding view of the values in
+# chunks, so that temporary arrays stay small however long the values are.
+#
+# Indicators which are defined recursively, such as `ema()`, are first-order
+# linear recurrences `y[i] = decay * y[i - 1] + x[i]`, which are solved in blocks
+# by `_linear_recurrence()`: within a block, each output is a weighted sum of the
+# block's inputs, computed for all blocks at once by a matrix product, plus the
+# output at the end of the previous block, which is itself found by solving the
+# recurrence of block ends in the same way.
+################################################################################
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from typing                  import Callable
+from .                       import Bands, MACDValue
+
+_BLOCK_SIZE = 64
+"""Number of values of each block of `_linear_recurrence()`."""
+
+_WINDOW_CHUNK_VALUES = 1 << 20
+"""Maximum number of values of the windows reduced at once by `_rolling()`."""
+
+def sma(values: np.ndarray, period: int) -> np.ndarray:
+    """Simple moving average of the last `period` values (see `SMA`)."""
+
+    return _rolling(values, period, lambda windows: windows.sum(axis=1) / period)
+
+def wma(values: np.ndarray, period: int) -> np.ndarray:
+    """Linearly weighted moving average of the last `period` values (see `WMA`)."""
+
+    weights = np.arange(1, period + 1, dtype=np.float64) / (period * (period + 1) / 2)
+
+    return _rolling(values, period, lambda windows: windows @ weights)
+
+def ema(values: np.ndarray, period: int) -> np.ndarray:
+    """Exponential moving average of values (see `EMA`)."""
+
+    _check_period(period)
+
+    values = np.asarray(values, dtype=np.float64)
+    result = np.full(len(values), np.nan)
+
+    if len(values) < period:
+        return result
+
+    alpha = 2 / (period + 1)
+    seed  = values[:period].sum() / period
+
+    result[period - 1] = seed
+    result[period:]    = _linear_recurrence(alpha * values[period:], 1 - alpha, seed)
+
+    return result
+
+def rolling_min(values: np.ndarray, period: int) -> np.ndarray:
+    """Lowest of the last `period` values (see `RollingMin`)."""
+
+    return _rolling(values, period, lambda windows: windows.min(axis=1))
+
+def rolling_max(values: np.ndarray, period: int) -> np.ndarray:
+    """Highest of the last `period` values (see `RollingMax`)."""
+
+    return _rolling(values, period, lambda windows: windows.max(axis=1))
+
+def bollinger_bands(values: np.ndarray, period: int = 20, deviations: float = 2) -> Bands:
+    """Bollinger bands of values (see `BollingerBands`), as arrays of the middle, upper, and lower bands."""
+
+    def std(windows: np.ndarray) -> np.ndarray:
+        centered = windows - windows.mean(axis=1)[:, np.newaxis]
+        return np.sqrt((centered * centered).sum(axis=1) / period)
+
+    middle = sma(values, period)
+    width  = deviations * _rolling(values, period, std)
+
+    return Bands(middle, middle + width, middle - width)
+
+def rsi(values: np.ndarray, period: int = 14) -> np.ndarray:
+    """Relative strength index of values, with Wilder's smoothing (see `RSI`)."""
+
+    _check_period(period)
+
+    values = np.asarray(values, dtype=np.float64)
+    result = np.full(len(values), np.nan)
+
+    if len(values) <= period:
+        return result
+
+    changes = np.diff(values)
+    gains   = np.maximum(changes, 0.0)
+    losses  = np.maximum(-changes, 0.0)
+
+    avg_gain = _wilder_average(gains,  period)
+    avg_loss = _wilder_average(losses, period)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        index = 100 - 100 / (1 + avg_gain / avg_loss)
+
+    index = np.where(avg_loss == 0, np.where(avg_gain == 0, 50.0, 100.0), index)
+
+    result[period:] = index[period - 1:]
+
+    return result
+
+def atr(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = 14) -> np.ndarray:
+    """Average true range of bars, with Wilder's smoothing (see `ATR`)."""
+
+    _check_period(period)
+
+    high  = np.asarray(high,  dtype=np.float64)
+    low   = np.asarray(low,   dtype=np.float64)
+    close = np.asarray(close, dtype=np.float64)
+
+    if len(high) == 0:
+        return np.full(0, np.nan)
+
+    previous_close = close[:-1]
+
+    true_ranges = np.empty(len(high))
+    true_ranges[0]  = high[0] - low[0]
+    true_ranges[1:] = np.maximum(high[1:], previous_close) - np.minimum(low[1:], previous_close)
+
+    result = np.full(len(high), np.nan)
+
+    if len(high) >= period:
+        result[period - 1:] = _wilder_average(true_ranges, period)[period - 1:]
+
+    return result
+
+def macd(values: np.ndarray,
+         fast_period:   int = 12,
+         slow_period:   int = 26,
+         signal_period: int = 9
+) -> MACDValue:
+    """MACD of values (see `MACD`), as arrays of the MACD line, signal line, and histogram."""
+
+    if fast_period >= slow_period:
+        raise ValueError(
+            'fast period must be shorter than slow period (got: %s and %s)'
+            % (fast_period, slow_period)
+        )
+
+    line   = ema(values, fast_period) - ema(values, slow_period)
+    signal = np.full(len(line), np.nan)
+
+    if len(line) >= slow_period:
+        signal[slow_period - 1:] = ema(line[slow_period - 1:], signal_period)
+
+    # The streaming indicator has no value until its signal line has one.
+    line = np.where(np.isnan(signal), np.nan, line)
+
+    return MACDValue(line, signal, line - signal)
+
+#===============================================================================
+# Internals
+#===============================================================================
+def _check_period(period: int):
+    if period < 1:
+        raise ValueError('period must be at least 1 (got: %s)' % period)
+
+def _rolling(values: np.ndarray, period: int, reduce: Callable[[np.ndarray], np.ndarray]) -> np.ndarray:
+    """Applies `reduce` to rows of windows of `period` values, and aligns its results to each window's last value."""
+
+    _check_period(period)
+
+    values = np.asarray(values, dtype=np.float64)
+    result = np.full(len(values), np.nan)
+
+    if len(values) < period:
+        return result
+
+    windows    = sliding_window_view(values, period)
+    chunk_rows = max(1, _WINDOW_CHUNK_VALUES // period)
+
+    for start in range(0, len(windows), chunk_rows):
+        chunk = windows[start:start + chunk_rows]
+        result[period - 1 + start:period - 1 + start + len(chunk)] = reduce(chunk)
+
+    return result
+
+def _wilder_average(values: np.ndarray, period: int) -> np.ndarray:
+    """Average of values with Wilder's smoothing, starting as the simple average of the first `period` values."""
+
+    result = np.full(len(values), np.nan)
+
+    if len(values) < period:
+        return result
+
+    seed = values[:period].sum() / period
+
+    result[period - 1] = seed
+    result[period:]    = _linear_recurrence(values[period:] / period, 1 - 1 / period, seed)
+
+    return result
+
+def _linear_recurrence(inputs: np.ndarray, decay: float, initial: float) -> np.ndarray:
+    """Returns `y` such that `y[i] = decay * y[i - 1] + inputs[i]`, where `y[-1]` is `initial`."""
+
+    count = len(inputs)
+
+    if count == 0:
+        return np.empty(0)
+
+    size    = _BLOCK_SIZE
+    offsets = np.arange(size)
+
+    # kernel[i, j] = decay ** (i - j) if i >= j, or 0 otherwise, so that the product
+    # of a block by the kernel's transpose is the recurrence within the block as if
+    # the output before the block were 0.
+    lags   = offsets[:, np.newaxis] - offsets[np.newaxis, :]
+    kernel = np.where(lags >= 0, decay ** np.maximum(lags, 0), 0.0)
+
+    block_count = -(-count // size)
+
+    padded = np.zeros(block_count * size)
+    padded[:count] = inputs
+
+    partial = padded.reshape(block_count, size) @ kernel.T
+
+    # Output at the end of each block, which carries over to the next block.
+    if block_count == 1:
+        carried = np.array([initial])
+    else:
+        block_ends = _linear_recurrence(partial[:-1, -1], decay ** size, initial)
+        carried    = np.concatenate(([initial], block_ends))
+
+    outputs = partial + carried[:, np.newaxis] * (decay ** (offsets + 1))[np.newaxis, :]
+
+    return outputs.ravel()[:count]
\ No newline at end of file
@@ -1,3 +1,4 @@
+import copy
 from pprint import pformat
 
 class Instrument:
@@ -6,6 +7,11 @@ class Instrument:
     The class `Instrument` wraps around information about a trading instrument
     that is not subject to market changes. Dynamic information, such as its bid
     and ask prices, must be retrieved from an `Exchange`.
+
+    The exception to this are the properties `min_stop_level`, `freeze_level`,
+    and `spread`, which are set by the broker and may change while the market
+    is open. These are called the *levels* of an instrument, and a copy of an
+    instrument with updated levels may be created by `Instrument.with_levels()`.
     """
 
     def __init__(self,
@@ -172,6 +178,20 @@ class Instrument:
 
         return self._spread
 
+    def with_levels(self, min_stop_level: int, freeze_level: int, spread: int) -> 'Instrument':
+        """Returns a copy of the instrument with new levels.
+
+        All properties of the returned instrument other than `min_stop_level`,
+        `freeze_level`, and `spread` are the same as those of this instrument.
+        """
+
+        instrument = copy.copy(self)
+        instrument._min_stop_lvl = min_stop_level
+        instrument._freeze_lvl   = freeze_level
+        instrument._spread       = spread
+
+        return instrument
+
     def is_floating_spread(self) -> bool:
         """Returns whether the instrument has floating spread."""
 
@@ -0,0 +1,54 @@
+import importlib
+import sys
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+LazyAttributes = Dict[str, Tuple[str, Optional[str]]]
+"""Maps attribute names of a package to a module and an attribute of that module.
+
+If the attribute of the module is `None`, the module itself is the attribute
+of the package. Module names may be relative to the package.
+"""
+
+def lazy_attributes(package: str,
+                    attributes: LazyAttributes
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Returns `__getattr__()` and `__dir__()` functions which load attributes of a package lazily.
+
+    The returned functions are meant to be assigned to the package's module-level
+    `__getattr__` and `__dir__` (see PEP 562), so that importing the package does
+    not import the modules in `attributes` until one of their attributes is accessed.
+    Once loaded, an attribute is stored in the package's namespace, so that later
+    accesses don't go through `__getattr__()`.
+
+    Example
+    -------
+    In `rmt/__init__.py`:
+
+        __getattr__, __dir__ = lazy_attributes(__name__, {
+            'Tick':     ('.tick', 'Tick'),
+            'jsonutil': ('.jsonutil', None)
+        })
+    """
+
+    namespace = sys.modules[package].__dict__
+
+    def __getattr__(name: str) -> Any:
+        if name not in attributes:
+            raise AttributeError("module '%s' has no attribute '%s'" % (package, name))
+
+        module_name, attr_name = attributes[name]
+        module = importlib.import_module(module_name, package)
+
+        if attr_name is None:
+            value = module
+        else:
+            value = getattr(module, attr_name)
+
+        namespace[name] = value
+
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(attributes))
+
+    return __getattr__, __dir__
\ No newline at end of file
@@ -0,0 +1,427 @@
+import math
+import os
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing      import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+from rmt         import error
+from .profiler   import Histogram as Buckets
+
+LabelValues = Tuple[str, ...]
+"""Values of the labels of a metric, in the order of its label names."""
+
+MetricFunction = Callable[[], Union[float, Dict[LabelValues, float]]]
+"""Function which returns the value of a metric when it's exported.
+
+Functions of metrics with labels return a value for each tuple of label values.
+"""
+
+CONTENT_TYPE = 'application/openmetrics-text; version=1.0.0; charset=utf-8'
+"""Content type of the OpenMetrics text format."""
+
+_NAME_PATTERN = re.compile(r'^[a-zA-Z_:][a-zA-Z0-9_:]*$')
+
+class Metric:
+    """Family of time series of a metric, one for each combination of label values.
+
+    Values are updated through the object returned by `labels()`, or through the
+    metric itself if it has no labels. Counters keep a count for each thread
+    which increases them, so increments take no lock. Other time series have
+    their own lock, which is only held while their value is updated or read, so
+    updating metrics costs about as much as updating a number, and exporting
+    them doesn't block updates of other time series.
+
+    If `function` is given, the metric's values are not updated, but returned by
+    calling `function` whenever the metric is exported, which is suited to values
+    that are already kept elsewhere, such as the size of a cache.
+    """
+
+    TYPE = ''
+
+    def __init__(self,
+                 name:        str,
+                 help:        str,
+                 label_names: Iterable[str]            = (),
+                 function:    Optional[MetricFunction] = None
+    ):
+        label_names = tuple(label_names)
+
+        for n in (name,) + label_names:
+            if _NAME_PATTERN.match(n) is None:
+                raise ValueError("invalid metric or label name '%s'" % n)
+
+        self._name        = name
+        self._help        = help
+        self._label_names = label_names
+        self._function    = function
+        self._lock        = threading.Lock()
+        self._children: Dict[LabelValues, Any] = {}
+
+        # Metrics without labels have a single time series, exported even before it's updated.
+        if len(label_names) == 0 and function is None:
+            self._children[()] = self._new_child()
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def help(self) -> str:
+        return self._help
+
+    @property
+    def label_names(self) -> Tuple[str, ...]:
+        return self._label_names
+
+    def labels(self, *values: str):
+        """Returns the time series of the given label values, creating it if needed.
+
+        Raises
+        ------
+        ValueError
+            If the number of values differs from the number of label names, or
+            if the metric's values are returned by a function.
+        """
+
+        values = tuple(map(str, values))
+        child  = self._children.get(values)
+
+        if child is not None:
+            return child
+
+        if len(values) != len(self._label_names):
+            raise ValueError(
+                "metric '%s' has %d labels (got: %d values)" % (self._name, len(self._label_names), len(values))
+            )
+
+        if self._function is not None:
+            raise ValueError("values of metric '%s' are returned by a function" % self._name)
+
+        with self._lock:
+            return self._children.setdefault(values, self._new_child())
+
+    def samples(self) -> List[Tuple[str, Dict[str, str], float]]:
+        """Returns the name suffix, labels, and value of each sample of the metric."""
+
+        if self._function is not None:
+            values = self._function()
+
+            if not isinstance(values, dict):
+                values = {(): values}
+
+            return [('', self._label_dict(label_values), value) for label_values, value in values.items()]
+
+        with self._lock:
+            children = list(self._children.items())
+
+        samples = []
+
+        for label_values, child in children:
+            labels = self._label_dict(label_values)
+
+            for suffix, extra_labels, value in child.samples():
+                samples.append((suffix, dict(labels, **extra_labels), value))
+
+        return samples
+
+    #===============================================================================
+    # Internals
+    #===============================================================================
+    def _new_child(self) -> Any:
+        raise error.NotImplementedException(self.__class__, '_new_child')
+
+    def _label_dict(self, label_values: LabelValues) -> Dict[str, str]:
+        return dict(zip(self._label_names, label_values))
+
+class Counter(Metric):
+    """Metric whose values only increase, such as a number of requests.
+
+    Samples of counters are exported with the suffix `_total`, so names of
+    counters should not end with it.
+    """
+
+    TYPE = 'counter'
+
+    def inc(self, amount: float = 1):
+        """Increases the value of a counter without labels."""
+
+        self.labels().inc(amount)
+
+    def _new_child(self) -> '_CounterValue':
+        return _CounterValue()
+
+class Gauge(Metric):
+    """Metric whose values may go up and down, such as the number of events waiting."""
+
+    TYPE = 'gauge'
+
+    def set(self, value: float):
+        """Sets the value of a gauge without labels."""
+
+        self.labels().set(value)
+
+    def inc(self, amount: float = 1):
+        """Increases the value of a gauge without labels."""
+
+        self.labels().inc(amount)
+
+    def dec(self, amount: float = 1):
+        """Decreases the value of a gauge without labels."""
+
+        self.labels().inc(-amount)
+
+    def _new_child(self) -> '_GaugeValue':
+        return _GaugeValue()
+
+class Histogram(Metric):
+    """Metric which counts observed durations in buckets, such as request latencies.
+
+    Durations are counted in the buckets of `profiler.Histogram`, whose upper
+    bounds double from about a microsecond to a minute.
+    """
+
+    TYPE = 'histogram'
+
+    def __init__(self, name: str, help: str, label_names: Iterable[str] = ()):
+        super().__init__(name, help, label_names)
+
+    def observe(self, seconds: float):
+        """Counts a duration in a histogram without labels."""
+
+        self.labels().observe(seconds)
+
+    def _new_child(self) -> '_HistogramValue':
+        return _HistogramValue()
+
+class Registry:
+    """Collection of metrics which are exported together in the OpenMetrics text format.
+
+    Metrics are created by `counter()`, `gauge()` and `histogram()`, and are
+    exported by `exposition()`, which is what `write()` writes to a file and
+    what `serve()` serves over HTTP. Since metrics keep their values as they
+    are updated, exporting them doesn't affect the code updating them, other
+    than for the short time each value is read.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, Metric] = {}
+
+    def counter(self,
+                name:        str,
+                help:        str,
+                label_names: Iterable[str]            = (),
+                function:    Optional[MetricFunction] = None
+    ) -> Counter:
+        return self.register(Counter(name, help, label_names, function))
+
+    def gauge(self,
+              name:        str,
+              help:        str,
+              label_names: Iterable[str]            = (),
+              function:    Optional[MetricFunction] = None
+    ) -> Gauge:
+        return self.register(Gauge(name, help, label_names, function))
+
+    def histogram(self, name: str, help: str, label_names: Iterable[str] = ()) -> Histogram:
+        return self.register(Histogram(name, help, label_names))
+
+    def register(self, metric: Metric) -> Metric:
+        """Adds a metric to the registry, and returns it.
+
+        Raises
+        ------
+        ValueError
+            If a metric with the same name is already registered.
+        """
+
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError("metric '%s' is already registered" % metric.name)
+
+            self._metrics[metric.name] = metric
+
+        return metric
+
+    def unregister(self, name: str):
+        """Removes a metric from the registry. Does nothing if no metric has that name."""
+
+        with self._lock:
+            self._metrics.pop(name, None)
+
+    def get(self, name: str) -> Optional[Metric]:
+        """Returns the metric named `name`, or `None` if there's none."""
+
+        return self._metrics.get(name)
+
+    def exposition(self) -> str:
+        """Returns all metrics in the OpenMetrics text format."""
+
+        with self._lock:
+            metrics = list(self._metrics.values())
+
+        lines = []
+
+        for metric in metrics:
+            lines.append('# HELP %s %s' % (metric.name, _escape(metric.help)))
+            lines.append('# TYPE %s %s' % (metric.name, metric.TYPE))
+
+            suffix_of_value = '_total' if isinstance(metric, Counter) else ''
+
+            for suffix, labels, value in metric.samples():
+                lines.append('%s%s%s %s' % (
+                    metric.name,
+                    suffix or suffix_of_value,
+                    _format_labels(labels),
+                    _format_value(value)
+                ))
+
+        lines.append('# EOF')
+
+        return '\n'.join(lines) + '\n'
+
+    def write(self, path: str):
+        """Writes all metrics to a file, such as one read by the textfile collector of node_exporter.
+
+        The file is replaced atomically, so that a concurrent reader never sees
+        partially written metrics.
+        """
+
+        tmp_path = path + '.tmp'
+
+        with open(tmp_path, 'w') as f:
+            f.write(self.exposition())
+
+        os.replace(tmp_path, path)
+
+    def serve(self, port: int = 9464, host: str = '127.0.0.1') -> 'MetricsServer':
+        """Serves metrics over HTTP on a background thread, and returns the server.
+
+        Metrics are served on any path, such as `/metrics`. The server only listens
+        on localhost by default, and should be closed by `MetricsServer.close()`.
+        """
+
+        return MetricsServer(self, host, port)
+
+class MetricsServer:
+    """HTTP server which serves the metrics of a `Registry`, started by `Registry.serve()`."""
+
+    def __init__(self, registry: Registry, host: str, port: int):
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = registry.exposition().encode('utf-8')
+
+                self.send_response(200)
+                self.send_header('Content-Type',   CONTENT_TYPE)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, name='rmt-metrics-server', daemon=True)
+        self._thread.start()
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        """Host and port on which the server listens, which is useful if it was started on port 0."""
+
+        return self._server.server_address[:2]
+
+    def close(self):
+        """Stops the server and waits for its thread to exit."""
+
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+#===============================================================================
+# Internals
+#===============================================================================
+class _CounterValue:
+    __slots__ = ('_counts',)
+
+    def __init__(self):
+        # Counts by thread; each thread only updates its own count, so no update is lost without a lock.
+        self._counts: Dict[int, float] = {}
+
+    def inc(self, amount: float = 1):
+        if amount < 0:
+            raise ValueError('counters can only be increased (got: %s)' % amount)
+
+        thread_id = threading.get_ident()
+        self._counts[thread_id] = self._counts.get(thread_id, 0) + amount
+
+    def samples(self) -> List[Tuple[str, Dict[str, str], float]]:
+        return [('', {}, sum(list(self._counts.values())))]
+
+class _GaugeValue:
+    __slots__ = ('_lock', '_value')
+
+    def __init__(self):
+        self._lock  = threading.Lock()
+        self._value = 0
+
+    def set(self, value: float):
+        self._value = value
+
+    def inc(self, amount: float = 1):
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1):
+        self.inc(-amount)
+
+    def samples(self) -> List[Tuple[str, Dict[str, str], float]]:
+        return [('', {}, self._value)]
+
+class _HistogramValue:
+    __slots__ = ('_lock', '_buckets')
+
+    def __init__(self):
+        self._lock    = threading.Lock()
+        self._buckets = Buckets()
+
+    def observe(self, seconds: float):
+        with self._lock:
+            self._buckets.record(seconds)
+
+    def samples(self) -> List[Tuple[str, Dict[str, str], float]]:
+        with self._lock:
+            buckets = self._buckets.copy()
+
+        samples    = []
+        cumulative = 0
+
+        for bound, count in buckets.buckets():
+            cumulative += count
+            samples.append(('_bucket', {'le': _format_value(bound)}, cumulative))
+
+        samples.append(('_count', {}, buckets.count))
+        samples.append(('_sum',   {}, buckets.total))
+
+        return samples
+
+def _escape(text: str) -> str:
+    return text.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if len(labels) == 0:
+        return ''
+
+    return '{%s}' % ','.join('%s="%s"' % (name, _escape(str(value))) for name, value in labels.items())
+
+def _format_value(value: float) -> str:
+    if isinstance(value, int):
+        return str(value)
+
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+
+    if math.isnan(value):
+        return 'NaN'
+
+    return repr(float(value))
\ No newline at end of file
@@ -0,0 +1,412 @@
+import collections
+import concurrent.futures
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime           import datetime
+from typing             import Any, Deque, Dict, Iterable, List, Optional, Set, Tuple, Union
+from rmt                import (error, Exchange, Order, OrderStatus, OrderType, Side,
+                                Instrument, BoundSignal, Tick, Bar, Timeframe)
+
+SYMBOL_METHODS = frozenset([
+    'get_tick',
+    'get_instrument',
+    'get_history_bars',
+    'get_history_bar',
+    'get_current_bar',
+    'subscribe',
+    'unsubscribe',
+    'place_order'
+])
+"""Methods routed to an exchange by their first argument, a symbol."""
+
+TICKET_METHODS = frozenset([
+    'modify_order',
+    'close_order',
+    'get_order'
+])
+"""Methods routed to an exchange by their first argument, an order ticket."""
+
+class MultiExchange(Exchange):
+    """Exchange which routes requests to one of several exchanges.
+
+    The class `MultiExchange` wraps several exchanges, such as `MetaTrader4`
+    objects connected to different terminals, accounts, or brokers, and routes
+    each request to the exchange which owns it:
+
+    - Requests about a symbol, such as `place_order()`, go to the exchange
+      which `routes` maps that symbol to, or to the `default` exchange if the
+      symbol is not mapped;
+    - Requests about an order, such as `close_order()`, go to the exchange on
+      which that order was placed or first seen; and
+    - Requests about all symbols or orders, such as `orders()`, go to all
+      exchanges, and their results are merged.
+
+    Each wrapped exchange is only ever called from its own thread, so requests
+    to different exchanges may run concurrently, while requests to the same
+    exchange are executed one at a time, as `MetaTrader4` requires. Methods of
+    this class wait for the requests they make; `submit()` doesn't, and may be
+    used to have several exchanges execute requests at the same time:
+
+        futures = [multi.submit('place_order', symbol, Side.BUY, OrderType.MARKET_ORDER, 0.1)
+                   for symbol in ['EURUSD', 'US100']]
+        tickets = [f.result() for f in futures]
+
+    Signals of wrapped exchanges are re-emitted by this exchange, but on the
+    thread calling `process_events()` or any other method of this class, rather
+    than on the threads of wrapped exchanges. As such, slots are never called
+    concurrently.
+
+    Order tickets are assumed to be unique across wrapped exchanges.
+    """
+
+    def __init__(self,
+                 exchanges: Dict[str, Exchange],
+                 routes:    Optional[Dict[str, str]] = None,
+                 default:   Optional[str]            = None
+    ):
+        super().__init__()
+
+        if len(exchanges) == 0:
+            raise ValueError('no exchanges given')
+
+        self._exchanges = dict(exchanges)
+        self._routes: Dict[str, str] = {}
+        self._default = None
+
+        for symbol, name in (routes or {}).items():
+            self.set_route(symbol, name)
+
+        if default is not None:
+            self._check_exchange_name(default)
+            self._default = default
+
+        self._executors: Dict[str, ThreadPoolExecutor] = {
+            name: ThreadPoolExecutor(max_workers=1, thread_name_prefix='MultiExchange-' + name)
+            for name in self._exchanges
+        }
+
+        # Exchange owning each order seen, updated by the threads of wrapped exchanges.
+        self._ticket_owners: Dict[int, str] = {}
+        self._ticket_owners_lock = threading.Lock()
+
+        # Signals emitted by wrapped exchanges, waiting to be re-emitted.
+        self._queued_signals: Deque[Tuple[BoundSignal, tuple]] = collections.deque()
+
+        for exchange in self._exchanges.values():
+            self._forward_signal(exchange.tick_received,  self.tick_received)
+            self._forward_signal(exchange.order_placed,   self.order_placed)
+            self._forward_signal(exchange.order_canceled, self.order_canceled)
+            self._forward_signal(exchange.order_expired,  self.order_expired)
+            self._forward_signal(exchange.order_filled,   self.order_filled)
+            self._forward_signal(exchange.order_closed,   self.order_closed)
+
+    def exchanges(self) -> Dict[str, Exchange]:
+        """Returns the wrapped exchanges, keyed by name."""
+
+        return self._exchanges.copy()
+
+    def set_route(self, symbol: str, name: str):
+        """Routes requests about `symbol` to the exchange named `name`."""
+
+        self._check_exchange_name(name)
+        self._routes[symbol] = name
+
+    def route(self, symbol: str) -> str:
+        """Returns the name of the exchange to which requests about `symbol` are routed.
+
+        Raises
+        ------
+        ValueError
+            If `symbol` is not routed and there's no default exchange.
+        """
+
+        name = self._routes.get(symbol, self._default)
+
+        if name is None:
+            raise ValueError("symbol '%s' is not routed to any exchange" % symbol)
+
+        return name
+
+    def submit(self, method: str, *args, **kwargs) -> Future:
+        """Requests a method of `Exchange` to be called on the exchange which owns its request.
+
+        Only methods in `SYMBOL_METHODS` and `TICKET_METHODS` may be submitted.
+        Returns a future holding the method's result.
+        """
+
+        if method in SYMBOL_METHODS:
+            name = self.route(args[0] if len(args) > 0 else kwargs['symbol'])
+        elif method in TICKET_METHODS:
+            name = self._ticket_owner(args[0] if len(args) > 0 else kwargs['ticket'])
+        else:
+            raise ValueError("method '%s' cannot be routed" % method)
+
+        return self._submit_to(name, method, *args, **kwargs)
+
+    def get_tick(self, symbol: str) -> Tick:
+        return self._call('get_tick', symbol)
+
+    def get_instrument(self, symbol: str) -> Instrument:
+        return self._call('get_instrument', symbol)
+
+    def get_instruments(self, symbols: Union[str, Iterable[str]] = '*') -> Dict[str, Instrument]:
+        if symbols == '*':
+            futures = [self._submit_to(name, 'get_instruments', '*') for name in self._exchanges]
+        else:
+            symbols_by_name: Dict[str, List[str]] = collections.defaultdict(list)
+
+            for symbol in symbols:
+                symbols_by_name[self.route(symbol)].append(symbol)
+
+            futures = [
+                self._submit_to(name, 'get_instruments', exchange_symbols)
+                for name, exchange_symbols in symbols_by_name.items()
+            ]
+
+        instruments: Dict[str, Instrument] = {}
+
+        for result in self._results(futures):
+            instruments.update(result)
+
+        return instruments
+
+    def get_history_bars(self,
+                         symbol:     str,
+                         start_time: Optional[datetime] = None,
+                         end_time:   Optional[datetime] = None,
+                         timeframe:  Timeframe = Timeframe.M1
+    ) -> List[Bar]:
+        return self._call('get_history_bars', symbol, start_time, end_time, timeframe)
+
+    def get_history_bar(self,
+                        symbol:    str,
+                        time:      datetime,
+                        timeframe: Timeframe = Timeframe.M1
+    ) -> Optional[Bar]:
+        return self._call('get_history_bar', symbol, time, timeframe)
+
+    def get_current_bar(self,
+                        symbol:    str,
+                        timeframe: Timeframe = Timeframe.M1
+    ) -> Bar:
+        return self._call('get_current_bar', symbol, timeframe)
+
+    def subscribe(self, symbol: str):
+        self._call('subscribe', symbol)
+
+    def subscribe_all(self):
+        self._results([self._submit_to(name, 'subscribe_all') for name in self._exchanges])
+
+    def unsubscribe(self, symbol: str):
+        self._call('unsubscribe', symbol)
+
+    def unsubscribe_all(self):
+        self._results([self._submit_to(name, 'unsubscribe_all') for name in self._exchanges])
+
+    def subscriptions(self) -> Set[str]:
+        symbols: Set[str] = set()
+
+        for result in self._results([self._submit_to(name, 'subscriptions') for name in self._exchanges]):
+            symbols |= result
+
+        return symbols
+
+    def place_order(self,
+                    symbol:       str,
+                    side:         Side,
+                    order_type:   OrderType,
+                    lots:         float,
+                    price:        Optional[float] = None,
+                    slippage:     Optional[int]   = None,
+                    stop_loss:    Optional[float] = None,
+                    take_profit:  Optional[float] = None,
+                    comment:      str = '',
+                    magic_number: int = 0,
+                    expiration:   Optional[datetime] = None
+    ) -> int:
+        return self._call(
+            'place_order',
+            symbol,
+            side,
+            order_type,
+            lots,
+            price,
+            slippage,
+            stop_loss,
+            take_profit,
+            comment,
+            magic_number,
+            expiration
+        )
+
+    def modify_order(self,
+                     ticket:      int,
+                     stop_loss:   Optional[float]    = None,
+                     take_profit: Optional[float]    = None,
+                     price:       Optional[float]    = None,
+                     expiration:  Optional[datetime] = None
+    ):
+        self._call('modify_order', ticket, stop_loss, take_profit, price, expiration)
+
+    def close_order(self,
+                    ticket:   int,
+                    price:    Optional[float] = None,
+                    slippage: int             = 0,
+                    lots:     Optional[float] = None
+    ) -> int:
+        return self._call('close_order', ticket, price, slippage, lots)
+
+    def get_order(self, ticket: int) -> Order:
+        return self._call('get_order', ticket)
+
+    def get_orders(self,
+                   symbol:       Optional[str]      = None,
+                   magic_number: Optional[int]      = None,
+                   start_time:   Optional[datetime] = None,
+                   end_time:     Optional[datetime] = None,
+                   history:      bool               = False
+    ) -> Dict[int, Order]:
+        if symbol is not None:
+            names = [self.route(symbol)]
+        else:
+            names = list(self._exchanges)
+
+        futures = [
+            self._submit_to(name, 'get_orders', symbol, magic_number, start_time, end_time, history)
+            for name in names
+        ]
+
+        orders: Dict[int, Order] = {}
+
+        for result in self._results(futures):
+            orders.update(result)
+
+        return orders
+
+    def orders(self) -> Dict[int, Order]:
+        orders: Dict[int, Order] = {}
+
+        for result in self._results([self._submit_to(name, 'orders') for name in self._exchanges]):
+            orders.update(result)
+
+        return orders
+
+    def find_orders(self,
+                    symbol:       Optional[str]  = None,
+                    side:         Optional[Side] = None,
+                    magic_number: Optional[int]  = None,
+                    status:       Union[None, OrderStatus, Iterable[OrderStatus]] = None
+    ) -> Dict[int, Order]:
+        if isinstance(status, Iterable):
+            status = list(status)
+
+        if symbol is not None:
+            names = [self.route(symbol)]
+        else:
+            names = list(self._exchanges)
+
+        futures = [self._submit_to(name, 'find_orders', symbol, side, magic_number, status) for name in names]
+
+        orders: Dict[int, Order] = {}
+
+        for result in self._results(futures):
+            orders.update(result)
+
+        return orders
+
+    def process_events(self):
+        """Processes events of all wrapped exchanges concurrently, and emits their signals."""
+
+        self._results([self._submit_to(name, 'process_events') for name in self._exchanges])
+
+    def shutdown(self):
+        """Stops the threads of wrapped exchanges, after they finish pending requests."""
+
+        for executor in self._executors.values():
+            executor.shutdown()
+
+    #===============================================================================
+    # Internals
+    #===============================================================================
+    def _check_exchange_name(self, name: str):
+        if name not in self._exchanges:
+            raise ValueError("no exchange named '%s'" % name)
+
+    def _forward_signal(self, source: BoundSignal, target: BoundSignal):
+        source.connect(lambda *args: self._queued_signals.append((target, args)))
+
+    def _emit_queued_signals(self):
+        while True:
+            try:
+                signal, args = self._queued_signals.popleft()
+            except IndexError:
+                break
+
+            signal.emit(*args)
+
+    def _submit_to(self, name: str, method: str, *args, **kwargs) -> Future:
+        exchange = self._exchanges[name]
+
+        def call() -> Any:
+            result = getattr(exchange, method)(*args, **kwargs)
+
+            # Remember which exchange owns the orders seen, so that later requests
+            # about them are routed there.
+            if method in ('place_order', 'close_order'):
+                self._set_ticket_owners([result], name)
+            elif method in ('get_orders', 'orders', 'find_orders'):
+                self._set_ticket_owners(result, name)
+
+            return result
+
+        return self._executors[name].submit(call)
+
+    def _call(self, method: str, *args, **kwargs) -> Any:
+        return self._results([self.submit(method, *args, **kwargs)])[0]
+
+    def _results(self, futures: List[Future]) -> List[Any]:
+        """Waits for `futures`, emits queued signals, and returns the futures' results.
+
+        If any future raised an exception, the first one is raised after all
+        futures are done.
+        """
+
+        concurrent.futures.wait(futures)
+
+        self._emit_queued_signals()
+
+        return [future.result() for future in futures]
+
+    def _set_ticket_owners(self, tickets: Iterable[int], name: str):
+        with self._ticket_owners_lock:
+            for ticket in tickets:
+                self._ticket_owners[ticket] = name
+
+    def _ticket_owner(self, ticket: int) -> str:
+        with self._ticket_owners_lock:
+            name = self._ticket_owners.get(ticket)
+
+        if name is not None:
+            return name
+
+        # Look for the order in the caches of all exchanges, which records the owners
+        # of the orders found.
+        concurrent.futures.wait([self._submit_to(name, 'orders') for name in self._exchanges])
+
+        with self._ticket_owners_lock:
+            name = self._ticket_owners.get(ticket)
+
+        if name is not None:
+            return name
+
+        # Ask all exchanges at once; the one which knows the order owns it.
+        futures = {name: self._submit_to(name, 'get_order', ticket) for name in self._exchanges}
+
+        concurrent.futures.wait(futures.values())
+
+        for name, future in futures.items():
+            if future.exception() is None:
+                self._set_ticket_owners([ticket], name)
+                return name
+
+        raise error.ExecutionError('no exchange knows the order #%s' % ticket)
\ No newline at end of file
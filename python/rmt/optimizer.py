@@ -0,0 +1,180 @@
+import itertools
+import json
+import multiprocessing
+import os
+import random
+import shutil
+import tempfile
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from typing             import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Type, Union
+from rmt                import BarArray, Strategy, Timeframe
+from .backtest          import BacktestExchange, Metrics
+
+Params = Dict[str, Any]
+"""Keyword arguments passed to a strategy class, by name."""
+
+_COLUMNS = ('time', 'open', 'high', 'low', 'close', 'volume')
+
+class RunResult(NamedTuple):
+    """Result of a backtest run by `Optimizer`."""
+
+    params:  Params
+    metrics: Metrics
+    stopped: bool
+
+class Optimizer:
+    """Backtests a strategy with many sets of parameters in parallel.
+
+    The class `Optimizer` runs `strategy_class` on a `BacktestExchange` over `bars`
+    once for each set of parameters passed to `run()`, distributing runs over a pool
+    of `max_workers` processes. Sets of parameters may be made by `grid()` or
+    `random_sample()`.
+
+    In each run, every symbol of `bars` is subscribed, and the strategy is created
+    by `strategy_class(exchange, symbols, **params)`, where `symbols` is the list of
+    symbols of `bars`, as `StrategyRunner` does. Thus, strategy classes must accept
+    their parameters as keyword arguments, and must be picklable, that is, defined
+    at module level.
+
+    Bars are written once to files in a temporary directory, which worker processes
+    map into memory, so they aren't sent to workers along with every run, and their
+    pages are shared by all workers. The directory is removed by `close()`.
+
+    Bad sets of parameters may be stopped early by passing `early_stop` to `run()`,
+    which is called with the metrics of a run every `check_every` bars (see
+    `BacktestExchange.run()`). Since it's sent to workers, it must be picklable too.
+    """
+
+    def __init__(self,
+                 strategy_class: Type[Strategy],
+                 bars:           Dict[str, BarArray],
+                 timeframe:      Timeframe     = Timeframe.M1,
+                 spread:         float         = 0.0,
+                 contract_size:  float         = 1.0,
+                 ohlc_ticks:     bool          = False,
+                 max_workers:    Optional[int] = None,
+                 start_method:   Optional[str] = None
+    ):
+        self._strategy_class = strategy_class
+        self._symbols        = sorted(bars)
+        self._max_workers    = max_workers
+        self._context        = multiprocessing.get_context(start_method)
+        self._directory      = tempfile.mkdtemp(prefix='rmt-optimizer-')
+
+        self._exchange_args = {
+            'timeframe':     timeframe,
+            'spread':        spread,
+            'contract_size': contract_size,
+            'ohlc_ticks':    ohlc_ticks
+        }
+
+        # Symbols may not be valid file names, so name files by the symbol's position.
+        for i, symbol in enumerate(self._symbols):
+            for column in _COLUMNS:
+                np.save(os.path.join(self._directory, '%d.%s.npy' % (i, column)), getattr(bars[symbol], column))
+
+        with open(os.path.join(self._directory, 'symbols.json'), 'w') as f:
+            json.dump(self._symbols, f)
+
+    @staticmethod
+    def grid(space: Dict[str, Iterable[Any]]) -> List[Params]:
+        """Returns every combination of the values of parameters in `space`."""
+
+        names  = list(space)
+        values = [list(space[name]) for name in names]
+
+        return [dict(zip(names, combination)) for combination in itertools.product(*values)]
+
+    @staticmethod
+    def random_sample(space: Dict[str, Union[Sequence[Any], Callable[[random.Random], Any]]],
+                      count: int,
+                      seed:  Optional[int] = None
+    ) -> List[Params]:
+        """Returns `count` sets of parameters drawn at random from `space`.
+
+        Each parameter is drawn from a sequence of values, or by calling a function
+        with a `random.Random` object, such as `lambda r: r.uniform(0.5, 2.0)`.
+        """
+
+        rng = random.Random(seed)
+
+        def draw(values: Union[Sequence[Any], Callable[[random.Random], Any]]) -> Any:
+            return values(rng) if callable(values) else rng.choice(values)
+
+        return [{name: draw(values) for name, values in space.items()} for _ in range(count)]
+
+    def run(self,
+            param_sets:  Iterable[Params],
+            early_stop:  Optional[Callable[[Metrics], bool]] = None,
+            check_every: int                                 = 1000
+    ) -> List[RunResult]:
+        """Backtests the strategy with each set of parameters, and returns the results in the same order.
+
+        Raises
+        ------
+        Exception
+            Any exception raised by a run.
+        """
+
+        param_sets = list(param_sets)
+
+        with ProcessPoolExecutor(
+            max_workers = self._max_workers,
+            mp_context  = self._context,
+            initializer = _load_bars,
+            initargs    = (self._directory,)
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _run_backtest,
+                    self._strategy_class,
+                    self._symbols,
+                    params,
+                    self._exchange_args,
+                    early_stop,
+                    check_every
+                )
+                for params in param_sets
+            ]
+
+            return [future.result() for future in futures]
+
+    def close(self):
+        """Removes the files of bars."""
+
+        shutil.rmtree(self._directory, ignore_errors=True)
+
+#===============================================================================
+# Worker processes
+#===============================================================================
+_worker_bars: Dict[str, BarArray] = {}
+
+def _load_bars(directory: str):
+    with open(os.path.join(directory, 'symbols.json')) as f:
+        symbols = json.load(f)
+
+    for i, symbol in enumerate(symbols):
+        columns = {
+            column: np.load(os.path.join(directory, '%d.%s.npy' % (i, column)), mmap_mode='r')
+            for column in _COLUMNS
+        }
+
+        _worker_bars[symbol] = BarArray(**columns)
+
+def _run_backtest(strategy_class: Type[Strategy],
+                  symbols:        List[str],
+                  params:         Params,
+                  exchange_args:  Dict[str, Any],
+                  early_stop:     Optional[Callable[[Metrics], bool]],
+                  check_every:    int
+) -> RunResult:
+    exchange = BacktestExchange(_worker_bars, **exchange_args)
+
+    for symbol in symbols:
+        exchange.subscribe(symbol)
+
+    strategy_class(exchange, symbols, **params)
+    stopped = exchange.run(stop_condition=early_stop, check_every=check_every)
+
+    return RunResult(params, exchange.metrics(), stopped)
\ No newline at end of file
@@ -0,0 +1,272 @@
+import pickle
+import shelve
+from collections import OrderedDict
+from time        import monotonic
+from typing      import Dict, Hashable, Iterable, Iterator, List, Optional, Set, Tuple, Union
+from rmt         import Order, OrderStatus, Side
+
+FINAL_STATUSES = frozenset([OrderStatus.CLOSED, OrderStatus.CANCELED, OrderStatus.EXPIRED])
+"""Statuses after which an order can no longer change."""
+
+class OrderCache:
+    """Stores orders by ticket and indexes them by their properties.
+
+    The class `OrderCache` keeps a mapping from tickets to orders, along with
+    secondary indexes by symbol, magic number, side, and status. Indexes are
+    updated incrementally whenever an order is stored or removed, so that
+    `OrderCache.find()` costs proportionally to the number of orders in its
+    smallest matching index, rather than to the number of stored orders.
+
+    Pending and filled orders are always kept, since they may still change.
+    Orders whose status is in `FINAL_STATUSES`, on the other hand, are evicted
+    in least-recently-used order once there are more than `max_final_orders`
+    of them, or once they haven't been accessed for `max_final_age` seconds.
+    If either limit is `None`, it's not enforced. Age eviction is performed on
+    calls to `set()` and `evict()`.
+
+    If `archive_path` is given, evicted orders are written to a `shelve` file
+    at that path, from which they may be brought back by `restore()`. Since
+    such orders are final, they never have to be requested again. Otherwise,
+    evicted orders are simply discarded.
+    """
+
+    def __init__(self,
+                 max_final_orders: Optional[int]   = None,
+                 max_final_age:    Optional[float] = None,
+                 archive_path:     Optional[str]   = None
+    ):
+        self._orders: Dict[int, Order] = {}
+
+        self._max_final_orders = max_final_orders
+        self._max_final_age    = max_final_age
+
+        # Maps tickets of final orders to the time they were last accessed,
+        # from least to most recently used.
+        self._final_access_times: 'OrderedDict[int, float]' = OrderedDict()
+
+        if archive_path is None:
+            self._archive = None
+        else:
+            self._archive = shelve.open(archive_path, protocol=pickle.HIGHEST_PROTOCOL)
+
+        self._by_symbol: Dict[str,         Set[int]] = {}
+        self._by_magic:  Dict[int,         Set[int]] = {}
+        self._by_side:   Dict[Side,        Set[int]] = {}
+        self._by_status: Dict[OrderStatus, Set[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._orders)
+
+    def __contains__(self, ticket: int) -> bool:
+        return ticket in self._orders
+
+    def __getitem__(self, ticket: int) -> Order:
+        order = self._orders[ticket]
+        self._touch(ticket)
+
+        return order
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._orders)
+
+    def get(self, ticket: int, default: Optional[Order] = None) -> Optional[Order]:
+        order = self._orders.get(ticket)
+
+        if order is None:
+            return default
+
+        self._touch(ticket)
+
+        return order
+
+    def items(self) -> Iterable[Tuple[int, Order]]:
+        return self._orders.items()
+
+    def to_dict(self) -> Dict[int, Order]:
+        """Returns a copy of the stored orders, keyed by ticket."""
+
+        return self._orders.copy()
+
+    def set(self, ticket: int, order: Order):
+        """Stores an order, replacing any order with the same ticket."""
+
+        previous = self._orders.get(ticket)
+
+        if previous is not None:
+            self._unindex(ticket, previous)
+
+        self._orders[ticket] = order
+        self._index(ticket, order)
+
+        if order.status() in FINAL_STATUSES:
+            self._final_access_times[ticket] = monotonic()
+            self._final_access_times.move_to_end(ticket)
+            self.evict()
+        else:
+            self._final_access_times.pop(ticket, None)
+
+    def remove(self, ticket: int) -> Optional[Order]:
+        """Removes and returns the order identified by `ticket`, if any.
+
+        The order is also removed from the archive, if it was archived.
+        """
+
+        order = self._orders.pop(ticket, None)
+
+        if order is not None:
+            self._unindex(ticket, order)
+            self._final_access_times.pop(ticket, None)
+
+        if self._archive is not None:
+            archived_order = self._archive.pop(str(ticket), None)
+
+            if order is None:
+                order = archived_order
+
+        return order
+
+    def clear(self):
+        self._orders.clear()
+        self._by_symbol.clear()
+        self._by_magic.clear()
+        self._by_side.clear()
+        self._by_status.clear()
+        self._final_access_times.clear()
+
+    def evict(self):
+        """Evicts final orders in excess of `max_final_orders` or older than `max_final_age`."""
+
+        if self._max_final_orders is not None:
+            while len(self._final_access_times) > self._max_final_orders:
+                self._evict_oldest()
+
+        if self._max_final_age is not None:
+            expiry_time = monotonic() - self._max_final_age
+
+            # Entries are in access order, so stop at the first recent enough.
+            while len(self._final_access_times) > 0:
+                ticket, access_time = next(iter(self._final_access_times.items()))
+
+                if access_time > expiry_time:
+                    break
+
+                self._evict_oldest()
+
+    def restore(self, ticket: int) -> Optional[Order]:
+        """Returns an order, loading it from the archive if it was evicted.
+
+        If the order is found in the archive, it's stored again in this cache
+        as the most recently used order. Returns `None` if the order is neither
+        stored nor archived.
+        """
+
+        order = self.get(ticket)
+
+        if order is not None or self._archive is None:
+            return order
+
+        order = self._archive.get(str(ticket))
+
+        if order is not None:
+            self.set(ticket, order)
+
+        return order
+
+    def close(self):
+        """Closes the archive, if any. Evicted orders are no longer archived afterwards."""
+
+        if self._archive is not None:
+            self._archive.close()
+            self._archive = None
+
+    def find(self,
+             symbol:       Optional[str]  = None,
+             side:         Optional[Side] = None,
+             magic_number: Optional[int]  = None,
+             status:       Union[None, OrderStatus, Iterable[OrderStatus]] = None
+    ) -> Dict[int, Order]:
+        """Returns the orders matching all given filters, keyed by ticket.
+
+        Filters which are `None` match any order. `status` may be a single status
+        or several of them, in which case orders having any of them are matched.
+        If no filter is given, all orders are returned.
+        """
+
+        matches: List[Set[int]] = []
+
+        if symbol is not None:
+            matches.append(self._by_symbol.get(symbol, set()))
+
+        if side is not None:
+            matches.append(self._by_side.get(side, set()))
+
+        if magic_number is not None:
+            matches.append(self._by_magic.get(magic_number, set()))
+
+        if isinstance(status, OrderStatus):
+            matches.append(self._by_status.get(status, set()))
+        elif status is not None:
+            tickets: Set[int] = set()
+
+            for s in status:
+                tickets |= self._by_status.get(s, set())
+
+            matches.append(tickets)
+
+        if len(matches) == 0:
+            return self._orders.copy()
+
+        matches.sort(key=len)
+        tickets = matches[0].intersection(*matches[1:])
+
+        return {ticket: self._orders[ticket] for ticket in tickets}
+
+    #===============================================================================
+    # Internals
+    #===============================================================================
+    def _touch(self, ticket: int):
+        if ticket in self._final_access_times:
+            self._final_access_times[ticket] = monotonic()
+            self._final_access_times.move_to_end(ticket)
+
+    def _evict_oldest(self):
+        ticket, _ = self._final_access_times.popitem(last=False)
+        order     = self._orders.pop(ticket)
+
+        self._unindex(ticket, order)
+
+        if self._archive is not None:
+            self._archive[str(ticket)] = order
+
+    def _index(self, ticket: int, order: Order):
+        self._add_to_index(self._by_symbol, order.symbol(),       ticket)
+        self._add_to_index(self._by_magic,  order.magic_number(), ticket)
+        self._add_to_index(self._by_side,   order.side(),         ticket)
+        self._add_to_index(self._by_status, order.status(),       ticket)
+
+    def _unindex(self, ticket: int, order: Order):
+        self._remove_from_index(self._by_symbol, order.symbol(),       ticket)
+        self._remove_from_index(self._by_magic,  order.magic_number(), ticket)
+        self._remove_from_index(self._by_side,   order.side(),         ticket)
+        self._remove_from_index(self._by_status, order.status(),       ticket)
+
+    def _add_to_index(self, index: Dict[Hashable, Set[int]], key: Hashable, ticket: int):
+        tickets = index.get(key)
+
+        if tickets is None:
+            index[key] = {ticket}
+        else:
+            tickets.add(ticket)
+
+    def _remove_from_index(self, index: Dict[Hashable, Set[int]], key: Hashable, ticket: int):
+        tickets = index.get(key)
+
+        if tickets is None:
+            return
+
+        tickets.discard(ticket)
+
+        # Drop empty sets, so that the index doesn't grow with every symbol or
+        # magic number ever seen.
+        if len(tickets) == 0:
+            del index[key]
\ No newline at end of file
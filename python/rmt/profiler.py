@@ -0,0 +1,523 @@
+import logging
+import math
+import os
+import sys
+import threading
+import traceback
+import weakref
+from collections import Counter
+from time        import perf_counter
+from typing      import Any, Callable, Dict, List, NamedTuple, Optional, Set, Tuple
+
+class CallbackKey(NamedTuple):
+    """Identifies the durations of a callback in a `Profiler`.
+
+    `owner` names the object whose callback was called, such as `'MyStrategy#1'`
+    for the first `MyStrategy` object seen by the profiler, or `'TickRouter#1.route'`
+    for a slot. `callback` is the name of a `Strategy` method, such as `'on_tick'`,
+    or the name of the signal to which the slot is connected, such as
+    `'tick_received'`. `symbol` is the symbol passed to the callback, if any.
+    """
+
+    owner:    str
+    callback: str
+    symbol:   str
+
+class Histogram:
+    """Counts durations in buckets whose bounds double, from about a microsecond to a minute.
+
+    A duration of `d` seconds is counted in the first bucket whose upper bound,
+    in `Histogram.BOUNDS`, is greater than `d`, or in an overflow bucket if `d`
+    is 64 seconds or longer.
+    """
+
+    BOUNDS = tuple(2.0 ** exponent for exponent in range(-20, 7))
+
+    _MIN_EXPONENT = -20
+
+    def __init__(self):
+        self._counts = [0] * (len(Histogram.BOUNDS) + 1)
+        self._count  = 0
+        self._total  = 0.0
+        self._max    = 0.0
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def total(self) -> float:
+        """Sum of all durations, in seconds."""
+
+        return self._total
+
+    @property
+    def max(self) -> float:
+        """Longest duration, in seconds."""
+
+        return self._max
+
+    def mean(self) -> float:
+        return self._total / self._count if self._count > 0 else 0.0
+
+    def record(self, seconds: float):
+        # `frexp()` returns `e` such that `2 ** (e - 1) <= seconds < 2 ** e`.
+        exponent = math.frexp(seconds)[1] if seconds > 0 else Histogram._MIN_EXPONENT
+        index    = min(max(exponent - Histogram._MIN_EXPONENT, 0), len(Histogram.BOUNDS))
+
+        self._counts[index] += 1
+        self._count += 1
+        self._total += seconds
+        self._max    = max(self._max, seconds)
+
+    def quantile(self, q: float) -> float:
+        """Returns an upper bound of the `q`-quantile of durations, where `q` is between 0 and 1.
+
+        The bound is the upper bound of the bucket in which the quantile falls, or
+        the longest duration if it's shorter than that.
+        """
+
+        if self._count == 0:
+            return 0.0
+
+        rank = max(1, math.ceil(q * self._count))
+        seen = 0
+
+        for bound, count in zip(Histogram.BOUNDS, self._counts):
+            seen += count
+
+            if seen >= rank:
+                return min(bound, self._max)
+
+        return self._max
+
+    def buckets(self) -> List[Tuple[float, int]]:
+        """Returns the upper bound and count of each bucket, the last bound being infinite."""
+
+        return list(zip(Histogram.BOUNDS + (math.inf,), self._counts))
+
+    def merge(self, other: 'Histogram'):
+        """Adds the durations counted by `other` to this histogram."""
+
+        self._counts = [a + b for a, b in zip(self._counts, other._counts)]
+        self._count += other._count
+        self._total += other._total
+        self._max    = max(self._max, other._max)
+
+    def copy(self) -> 'Histogram':
+        histogram = Histogram()
+        histogram.merge(self)
+
+        return histogram
+
+    def __repr__(self) -> str:
+        return 'Histogram(count=%d, mean=%.6f, p99=%.6f, max=%.6f)' % (
+            self._count,
+            self.mean(),
+            self.quantile(0.99),
+            self._max
+        )
+
+class Profiler:
+    """Times strategy callbacks and signal slots, and samples the stacks of running threads.
+
+    Once a profiler is enabled by `enable()`, every call of `Strategy.on_tick()`,
+    `Strategy.on_bar_closed()` and every slot connected to a signal, such as
+    `Exchange.tick_received`, is timed, and its duration is recorded in a
+    `Histogram` of its `CallbackKey`. Histograms may be read by `histograms()`,
+    or summed per owner or per symbol by `by_owner()` and `by_symbol()`. Since
+    ticks are dispatched to strategies one after the other, these show which
+    strategy is delaying all the others.
+
+    If `budget` is not `None`, a warning is logged for each call which takes
+    longer than `budget` seconds. If `stack_samples` is also `True`, a watchdog
+    thread looks for calls exceeding the budget while they are still running,
+    and logs the warning along with the stack of the thread running the call,
+    which shows where it's stuck. A call which was reported by the watchdog is
+    not reported again when it returns. If a call exceeds the budget because of
+    a call nested in it, such as a slot which calls `Strategy.on_tick()`, only
+    the nested call is reported.
+
+    Independently of timing, `start_sampling()` starts a thread which records
+    the stacks of all other threads every `interval` seconds, until `stop_sampling()`
+    is called. Sampling may be started and stopped at any time, without enabling
+    the profiler, and `samples()` returns how often each stack was seen.
+
+    Profilers only see callbacks called in their own process. For strategies run
+    by `StrategyRunner` on worker processes, `enable()` must be called in the workers.
+    """
+
+    def __init__(self, budget: Optional[float] = None, stack_samples: bool = False):
+        if budget is not None and budget <= 0:
+            raise ValueError('budget must be positive (got: %s)' % budget)
+
+        self._budget        = budget
+        self._stack_samples = stack_samples
+        self._logger        = logging.getLogger(Profiler.__name__)
+        self._lock          = threading.Lock()
+        self._histograms: Dict[CallbackKey, Histogram] = {}
+
+        # Labels of owners seen, and how many owners of each class were seen.
+        self._labels: 'weakref.WeakKeyDictionary[Any, str]' = weakref.WeakKeyDictionary()
+        self._label_counts: Counter = Counter()
+
+        # Calls running on each thread, from outermost to innermost.
+        self._running: Dict[int, List[_RunningCall]] = {}
+
+        self._watchdog:      Optional[threading.Thread] = None
+        self._watchdog_stop: Optional[threading.Event]  = None
+
+        self._sampler:      Optional[threading.Thread] = None
+        self._sampler_stop: Optional[threading.Event]  = None
+        self._samples:      Counter = Counter()
+
+    @property
+    def budget(self) -> Optional[float]:
+        return self._budget
+
+    def call(self, owner: Any, callback: str, symbol: str, fn: Callable[..., Any], *args) -> Any:
+        """Calls `fn(*args)`, recording its duration under `owner`, `callback` and `symbol`."""
+
+        running   = _RunningCall(perf_counter(), owner, callback, symbol)
+        thread_id = threading.get_ident()
+        calls     = self._calls_of_thread(thread_id)
+        calls.append(running)
+
+        try:
+            return fn(*args)
+        finally:
+            duration = perf_counter() - running.start
+
+            with self._lock:
+                calls.pop()
+
+                # Threads may come and go, so entries are only kept while calls are running.
+                if len(calls) == 0:
+                    del self._running[thread_id]
+
+                key       = CallbackKey(self._label(owner), callback, symbol)
+                histogram = self._histograms.get(key)
+
+                if histogram is None:
+                    histogram = self._histograms[key] = Histogram()
+
+                histogram.record(duration)
+
+                exceeded = self._budget is not None and duration > self._budget
+                report   = exceeded and not running.reported and not running.slow_inner
+
+                if len(calls) > 0 and (exceeded or running.slow_inner):
+                    calls[-1].slow_inner = True
+
+            if report:
+                self._logger.warning(
+                    '%s %s (%s) took %.3fs, exceeding budget of %.3fs',
+                    key.owner, key.callback, key.symbol, duration, self._budget
+                )
+
+    def histograms(self) -> Dict[CallbackKey, Histogram]:
+        """Returns copies of the histograms of each callback."""
+
+        with self._lock:
+            return {key: histogram.copy() for key, histogram in self._histograms.items()}
+
+    def by_owner(self) -> Dict[str, Histogram]:
+        """Returns histograms of all callbacks of each owner, such as a strategy."""
+
+        return self._merged(lambda key: key.owner)
+
+    def by_symbol(self) -> Dict[str, Histogram]:
+        """Returns histograms of all callbacks called with each symbol."""
+
+        return self._merged(lambda key: key.symbol)
+
+    def summary(self) -> str:
+        """Returns a table of callbacks, from the one which took the longest in total."""
+
+        histograms = sorted(self.histograms().items(), key=lambda item: item[1].total, reverse=True)
+        lines      = ['%-40s %-16s %-12s %10s %10s %10s %10s' % ('owner', 'callback', 'symbol', 'count', 'mean', 'p99', 'max')]
+
+        for key, histogram in histograms:
+            lines.append('%-40s %-16s %-12s %10d %10.6f %10.6f %10.6f' % (
+                key.owner,
+                key.callback,
+                key.symbol,
+                histogram.count,
+                histogram.mean(),
+                histogram.quantile(0.99),
+                histogram.max
+            ))
+
+        return '\n'.join(lines)
+
+    def reset(self):
+        """Clears histograms and stack samples."""
+
+        with self._lock:
+            self._histograms.clear()
+            self._samples.clear()
+
+    def start_sampling(self, interval: float = 0.005):
+        """Starts recording the stacks of all threads every `interval` seconds.
+
+        Does nothing if sampling was already started.
+        """
+
+        if interval <= 0:
+            raise ValueError('interval must be positive (got: %s)' % interval)
+
+        if self._sampler is not None:
+            return
+
+        self._sampler_stop = threading.Event()
+        self._sampler      = threading.Thread(
+            target = self._sample,
+            args   = (interval, self._sampler_stop),
+            name   = 'rmt-profiler-sampler',
+            daemon = True
+        )
+
+        self._sampler.start()
+
+    def stop_sampling(self):
+        """Stops recording stacks. Samples recorded so far are kept."""
+
+        if self._sampler is None:
+            return
+
+        self._sampler_stop.set()
+        self._sampler.join()
+
+        self._sampler      = None
+        self._sampler_stop = None
+
+    def sampling(self) -> bool:
+        """Returns whether stacks are being sampled."""
+
+        return self._sampler is not None
+
+    def samples(self) -> Dict[str, int]:
+        """Returns how many times each stack was sampled.
+
+        Stacks are given from the outermost frame to the innermost, with frames
+        separated by semicolons, which is the "collapsed" format read by flame
+        graph tools.
+        """
+
+        with self._lock:
+            return dict(self._samples)
+
+    def write_samples(self, path: str):
+        """Writes stack samples to a file in the collapsed format (see `samples()`)."""
+
+        with open(path, 'w') as f:
+            for stack, count in sorted(self.samples().items()):
+                f.write('%s %d\n' % (stack, count))
+
+    def close(self):
+        """Stops sampling and the watchdog, and disables the profiler if it's enabled."""
+
+        if _active is self:
+            disable()
+
+        self.stop_sampling()
+        self._stop_watchdog()
+
+    #===============================================================================
+    # Internals
+    #===============================================================================
+    def _calls_of_thread(self, thread_id: int) -> List['_RunningCall']:
+        calls = self._running.get(thread_id)
+
+        if calls is None:
+            with self._lock:
+                calls = self._running.setdefault(thread_id, [])
+
+        return calls
+
+    def _label(self, owner: Any) -> str:
+        func = getattr(owner, '__func__', None)
+        obj  = getattr(owner, '__self__', None)
+
+        if func is not None and obj is not None:
+            return '%s.%s' % (self._label(obj), func.__name__)
+
+        if isinstance(owner, type) or (callable(owner) and hasattr(owner, '__qualname__')):
+            return owner.__qualname__
+
+        try:
+            label = self._labels.get(owner)
+        except TypeError:
+            # Neither hashable nor weakly referenceable.
+            return type(owner).__qualname__
+
+        if label is None:
+            class_name = type(owner).__qualname__
+            self._label_counts[class_name] += 1
+            label = '%s#%d' % (class_name, self._label_counts[class_name])
+
+            try:
+                self._labels[owner] = label
+            except TypeError:
+                return class_name
+
+        return label
+
+    def _merged(self, key_of: Callable[[CallbackKey], str]) -> Dict[str, Histogram]:
+        merged: Dict[str, Histogram] = {}
+
+        with self._lock:
+            for key, histogram in self._histograms.items():
+                merged.setdefault(key_of(key), Histogram()).merge(histogram)
+
+        return merged
+
+    def _start_watchdog(self):
+        if self._budget is None or not self._stack_samples or self._watchdog is not None:
+            return
+
+        self._watchdog_stop = threading.Event()
+        self._watchdog      = threading.Thread(
+            target = self._watch,
+            args   = (max(self._budget / 2, 0.001), self._watchdog_stop),
+            name   = 'rmt-profiler-watchdog',
+            daemon = True
+        )
+
+        self._watchdog.start()
+
+    def _stop_watchdog(self):
+        if self._watchdog is None:
+            return
+
+        self._watchdog_stop.set()
+        self._watchdog.join()
+
+        self._watchdog      = None
+        self._watchdog_stop = None
+
+    def _watch(self, interval: float, stop: threading.Event):
+        while not stop.wait(interval):
+            now     = perf_counter()
+            reports = []
+
+            with self._lock:
+                for thread_id, calls in self._running.items():
+                    # Report the innermost call exceeding the budget, since outer calls are slow because of it.
+                    for running in reversed(calls):
+                        if now - running.start > self._budget:
+                            if not running.reported:
+                                running.reported = True
+                                reports.append((thread_id, self._label(running.owner), running))
+                            break
+
+            if len(reports) == 0:
+                continue
+
+            frames = sys._current_frames()
+
+            for thread_id, label, running in reports:
+                frame = frames.get(thread_id)
+                stack = '' if frame is None else ''.join(traceback.format_stack(frame))
+
+                self._logger.warning(
+                    '%s %s (%s) has been running for %.3fs, exceeding budget of %.3fs; stack:\n%s',
+                    label,
+                    running.callback,
+                    running.symbol,
+                    now - running.start,
+                    self._budget,
+                    stack
+                )
+
+    def _sample(self, interval: float, stop: threading.Event):
+        own_ids: Set[int] = {threading.get_ident()}
+
+        while not stop.wait(interval):
+            if self._watchdog is not None and self._watchdog.ident is not None:
+                own_ids.add(self._watchdog.ident)
+
+            stacks = [
+                _collapsed_stack(frame)
+                for thread_id, frame in sys._current_frames().items()
+                if thread_id not in own_ids
+            ]
+
+            with self._lock:
+                self._samples.update(stacks)
+
+class _RunningCall:
+    __slots__ = ('start', 'owner', 'callback', 'symbol', 'reported', 'slow_inner')
+
+    def __init__(self, start: float, owner: Any, callback: str, symbol: str):
+        self.start      = start
+        self.owner      = owner
+        self.callback   = callback
+        self.symbol     = symbol
+        self.reported   = False
+        self.slow_inner = False
+
+def _collapsed_stack(frame) -> str:
+    frames = []
+
+    while frame is not None:
+        code = frame.f_code
+        frames.append('%s (%s:%d)' % (
+            getattr(code, 'co_qualname', code.co_name),
+            os.path.basename(code.co_filename),
+            code.co_firstlineno
+        ))
+        frame = frame.f_back
+
+    return ';'.join(reversed(frames))
+
+#===============================================================================
+# Active profiler
+#===============================================================================
+_active: Optional[Profiler] = None
+
+enabled = False
+"""Whether a profiler is enabled, which is cheaper to check than `active()` on hot paths."""
+
+def enable(profiler: Optional[Profiler] = None) -> Profiler:
+    """Makes `profiler`, or a new `Profiler` if it's `None`, time callbacks in this process, and returns it.
+
+    A profiler which was enabled before is disabled.
+    """
+
+    global _active, enabled
+
+    if profiler is None:
+        profiler = Profiler()
+
+    if _active is not None and _active is not profiler:
+        disable()
+
+    profiler._start_watchdog()
+    _active = profiler
+    enabled = True
+
+    return profiler
+
+def disable() -> Optional[Profiler]:
+    """Stops timing callbacks, and returns the profiler which was enabled, if any.
+
+    Histograms of the profiler are kept, and it may be enabled again. Stack
+    sampling isn't stopped, since it's independent of timing.
+    """
+
+    global _active, enabled
+
+    profiler = _active
+    _active  = None
+    enabled  = False
+
+    if profiler is not None:
+        profiler._stop_watchdog()
+
+    return profiler
+
+def active() -> Optional[Profiler]:
+    """Returns the profiler which is enabled, if any."""
+
+    return _active
\ No newline at end of file
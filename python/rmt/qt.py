@@ -0,0 +1,54 @@
+from PyQt5.QtCore import QObject, pyqtSignal
+from rmt          import Exchange, Order, Tick
+
+class QtExchangeSignals(QObject):
+    """Forwards signals of an `Exchange` to Qt signals.
+
+    The signals of `Exchange` are plain Python signals (see `rmt.signal.Signal`),
+    so that PyQt5 is not required to use this library. Applications which do use
+    Qt, such as to update widgets when ticks arrive, may create an object of the
+    class `QtExchangeSignals` to connect to Qt slots, benefiting from Qt features
+    such as queued connections across threads.
+
+    This module is not imported by `rmt`, and requires PyQt5 to be installed.
+    """
+
+    tick_received  = pyqtSignal(str, Tick)
+    order_placed   = pyqtSignal(Order)
+    order_canceled = pyqtSignal(Order)
+    order_expired  = pyqtSignal(Order)
+    order_filled   = pyqtSignal(Order)
+    order_closed   = pyqtSignal(Order)
+
+    def __init__(self, exchange: Exchange, parent: QObject = None):
+        super().__init__(parent)
+
+        self._exchange = exchange
+
+        # Bound methods of PyQt signals are created anew on each attribute access,
+        # so keep the connected ones to be able to disconnect them later.
+        self._connections = [
+            (exchange.tick_received,  self.tick_received.emit),
+            (exchange.order_placed,   self.order_placed.emit),
+            (exchange.order_canceled, self.order_canceled.emit),
+            (exchange.order_expired,  self.order_expired.emit),
+            (exchange.order_filled,   self.order_filled.emit),
+            (exchange.order_closed,   self.order_closed.emit)
+        ]
+
+        for signal, slot in self._connections:
+            signal.connect(slot)
+
+    @property
+    def exchange(self) -> Exchange:
+        """The exchange whose signals are forwarded."""
+
+        return self._exchange
+
+    def disconnect_exchange(self):
+        """Stops forwarding signals of the exchange."""
+
+        for signal, slot in self._connections:
+            signal.disconnect(slot)
+
+        self._connections = []
\ No newline at end of file
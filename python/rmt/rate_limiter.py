@@ -0,0 +1,137 @@
+import threading
+import time
+from time   import monotonic
+from typing import Callable, Optional
+
+class TokenBucket:
+    """Allows events at a sustained `rate` per second, in bursts of up to `capacity` events.
+
+    The bucket starts full, holding `capacity` tokens, and is refilled at `rate`
+    tokens per second. Each event takes a token.
+    """
+
+    def __init__(self,
+                 rate:     float,
+                 capacity: float,
+                 clock:    Callable[[], float] = monotonic
+    ):
+        if rate <= 0:
+            raise ValueError('rate must be positive (got: %s)' % rate)
+
+        if capacity < 1:
+            raise ValueError('capacity must be at least 1 (got: %s)' % capacity)
+
+        self._rate        = rate
+        self._capacity    = capacity
+        self._clock       = clock
+        self._tokens      = capacity
+        self._last_refill = clock()
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    @property
+    def capacity(self) -> float:
+        return self._capacity
+
+    def try_acquire(self) -> float:
+        """Takes a token if one is available.
+
+        Returns 0 if a token was taken, or otherwise the number of seconds until
+        one will be available.
+        """
+
+        now = self._clock()
+
+        self._tokens      = min(self._capacity, self._tokens + (now - self._last_refill) * self._rate)
+        self._last_refill = now
+
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0
+
+        return (1 - self._tokens) / self._rate
+
+class RateLimiter:
+    """Limits the rate of requests, and backs off when the server is throttling them.
+
+    The class `RateLimiter` combines an optional `TokenBucket`, which caps the
+    rate of requests sent, with an adaptive backoff, which pauses requests once
+    the server reports being throttled or busy. If `rate` is `None`, requests
+    are only delayed by backoff.
+
+    Each call to `throttled()` pauses requests for the current backoff, which
+    starts at `min_backoff` seconds and is multiplied by `backoff_factor` on
+    every subsequent call, up to `max_backoff` seconds. Each call to `succeeded()`
+    divides the backoff by `backoff_factor`, so that it decreases gradually
+    as the server recovers, until it drops below `min_backoff` and is cleared.
+
+    A limiter may be shared by several threads.
+    """
+
+    def __init__(self,
+                 rate:           Optional[float]         = None,
+                 burst:          float                   = 1,
+                 min_backoff:    float                   = 0.5,
+                 max_backoff:    float                   = 30,
+                 backoff_factor: float                   = 2,
+                 clock:          Callable[[], float]     = monotonic,
+                 sleep:          Callable[[float], None] = time.sleep
+    ):
+        self._bucket         = None if rate is None else TokenBucket(rate, burst, clock)
+        self._min_backoff    = min_backoff
+        self._max_backoff    = max_backoff
+        self._backoff_factor = backoff_factor
+        self._clock          = clock
+        self._sleep          = sleep
+        self._backoff        = 0.0
+        self._paused_until   = 0.0
+        self._lock           = threading.Lock()
+
+    @property
+    def backoff(self) -> float:
+        """Seconds for which requests were last paused, or 0 if not backing off."""
+
+        return self._backoff
+
+    def acquire(self):
+        """Blocks until a request may be sent."""
+
+        while True:
+            with self._lock:
+                wait = self._paused_until - self._clock()
+
+                if wait <= 0:
+                    if self._bucket is None:
+                        return
+
+                    wait = self._bucket.try_acquire()
+
+                    if wait == 0:
+                        return
+
+            self._sleep(wait)
+
+    def throttled(self):
+        """Reports that the server rejected a request for being throttled or busy."""
+
+        with self._lock:
+            if self._backoff == 0:
+                self._backoff = self._min_backoff
+            else:
+                self._backoff = min(self._max_backoff, self._backoff * self._backoff_factor)
+
+            self._paused_until = self._clock() + self._backoff
+
+    def succeeded(self):
+        """Reports that the server accepted a request."""
+
+        with self._lock:
+            if self._backoff == 0:
+                return
+
+            self._backoff /= self._backoff_factor
+
+            if self._backoff < self._min_backoff:
+                self._backoff = 0.0
\ No newline at end of file
@@ -0,0 +1,256 @@
+import numpy as np
+from datetime import datetime
+from typing   import Dict, Iterable, List, Optional
+from rmt      import Bar, BarArray, Timeframe
+
+_SECONDS_PER_DAY = 86400
+
+# The Unix epoch was on a Thursday, 4 days after the Sunday on which its week opened.
+_EPOCH_WEEKDAY_FROM_SUNDAY = 4
+
+def bar_times(times: np.ndarray, timeframe: Timeframe) -> np.ndarray:
+    """Returns the open times of the bars of `timeframe` which contain `times`.
+
+    This is the vectorized version of `Timeframe.bar_time()`, taking and returning
+    `datetime64[s]` arrays.
+    """
+
+    seconds = np.asarray(times, dtype='datetime64[s]').astype(np.int64)
+
+    if timeframe == Timeframe.MN1:
+        return seconds.astype('datetime64[s]').astype('datetime64[M]').astype('datetime64[s]')
+
+    if timeframe == Timeframe.W1:
+        days = seconds // _SECONDS_PER_DAY
+        days = days - (days + _EPOCH_WEEKDAY_FROM_SUNDAY) % 7
+
+        return (days * _SECONDS_PER_DAY).astype('datetime64[s]')
+
+    duration = int(timeframe.duration.total_seconds())
+
+    return (seconds - seconds % duration).astype('datetime64[s]')
+
+def resample(bars: BarArray, timeframe: Timeframe) -> BarArray:
+    """Returns bars of `timeframe` made of `bars`, which must be sorted by time.
+
+    Each bar of `timeframe` opens at the open of the first bar it contains, closes
+    at the close of the last one, and has the highest high, the lowest low, and the
+    total volume of all of them. Bars of `timeframe` are only made for periods which
+    contain at least one bar of `bars`, and may be partial if `bars` starts or ends
+    in the middle of them.
+
+    The timeframe of `bars` must nest in `timeframe`, that is, every bar of `bars`
+    must fall entirely within a bar of `timeframe`. For instance, daily bars may be
+    resampled into weekly and monthly bars, but weekly bars may not be resampled
+    into monthly bars, since weeks may span two months.
+
+    Raises
+    ------
+    ValueError
+        If the times of `bars` are not sorted.
+    """
+
+    if len(bars) == 0:
+        return BarArray.empty()
+
+    times = bars.time
+
+    if np.any(times[1:] < times[:-1]):
+        raise ValueError('bars must be sorted by time')
+
+    keys   = bar_times(times, timeframe)
+    starts = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+    ends   = np.concatenate((starts[1:], [len(bars)])) - 1
+
+    return BarArray(
+        time   = keys[starts],
+        open   = bars.open[starts],
+        high   = np.maximum.reduceat(bars.high, starts),
+        low    = np.minimum.reduceat(bars.low,  starts),
+        close  = bars.close[ends],
+        volume = np.add.reduceat(bars.volume, starts)
+    )
+
+def resample_all(bars:       BarArray,
+                 source:     Timeframe                     = Timeframe.M1,
+                 timeframes: Optional[Iterable[Timeframe]] = None
+) -> Dict[Timeframe, BarArray]:
+    """Resamples bars of timeframe `source` into each of `timeframes`.
+
+    If `timeframes` is `None`, bars are resampled into every timeframe in which
+    `source` nests. Each timeframe is resampled from the longest timeframe already
+    resampled which nests in it, rather than from `source`, so that resampling into
+    all timeframes costs little more than resampling into the shortest one.
+
+    Raises
+    ------
+    ValueError
+        If `source` doesn't nest in one of `timeframes`.
+    """
+
+    if timeframes is None:
+        targets = [tf for tf in Timeframe if tf != source and nests_in(source, tf)]
+    else:
+        targets = sorted(set(timeframes), key=lambda tf: tf.duration)
+
+        for tf in targets:
+            if not nests_in(source, tf):
+                raise ValueError('%s bars cannot be resampled into %s bars' % (source.name, tf.name))
+
+    resampled: Dict[Timeframe, BarArray] = {source: bars}
+
+    for tf in targets:
+        if tf in resampled:
+            continue
+
+        base = max((t for t in resampled if nests_in(t, tf)), key=lambda t: t.duration)
+        resampled[tf] = resample(resampled[base], tf)
+
+    if timeframes is None or source not in targets:
+        del resampled[source]
+
+    return resampled
+
+def nests_in(inner: Timeframe, outer: Timeframe) -> bool:
+    """Returns whether every bar of timeframe `inner` falls entirely within a bar of timeframe `outer`."""
+
+    if inner == outer:
+        return True
+
+    # Weeks may span two months, and no other timeframe is longer than a week.
+    if inner == Timeframe.W1:
+        return False
+
+    return inner.duration < outer.duration
+
+class Resampler:
+    """Resamples bars of timeframe `source` into `timeframes` as they arrive.
+
+    The class `Resampler` keeps the current bar of each of `timeframes`, that is,
+    the bar made of the bars of `source` received since it opened. A bar of `source`
+    is usually received once it closes, by `update()`, or in batches of bars by
+    `update_array()`, which resamples them in a vectorized way. Once a bar falls
+    past the end of the current bar of a timeframe, that current bar closes and is
+    returned, and a new current bar is opened.
+
+    If `timeframes` is `None`, bars are resampled into every timeframe in which
+    `source` nests (see `nests_in()`).
+
+    Raises
+    ------
+    ValueError
+        If `source` doesn't nest in one of `timeframes`.
+    """
+
+    def __init__(self,
+                 timeframes: Optional[Iterable[Timeframe]] = None,
+                 source:     Timeframe                     = Timeframe.M1
+    ):
+        if timeframes is None:
+            timeframes = [tf for tf in Timeframe if tf != source and nests_in(source, tf)]
+
+        timeframes = list(timeframes)
+
+        for tf in timeframes:
+            if not nests_in(source, tf):
+                raise ValueError('%s bars cannot be resampled into %s bars' % (source.name, tf.name))
+
+        self._source      = source
+        self._timeframes  = timeframes
+        self._current_bars: Dict[Timeframe, Optional[Bar]] = {tf: None for tf in timeframes}
+        self._last_time   = None
+
+    @property
+    def source(self) -> Timeframe:
+        return self._source
+
+    @property
+    def timeframes(self) -> List[Timeframe]:
+        return list(self._timeframes)
+
+    def current_bar(self, timeframe: Timeframe) -> Optional[Bar]:
+        """Returns the current bar of `timeframe`, or `None` if no bar was received yet."""
+
+        return self._current_bars[timeframe]
+
+    def update(self, bar: Bar) -> Dict[Timeframe, Bar]:
+        """Adds a bar of timeframe `source`, and returns the bars which it closed, by timeframe.
+
+        Raises
+        ------
+        ValueError
+            If `bar` is not newer than the last bar received.
+        """
+
+        self._check_newer(bar.time)
+
+        closed_bars: Dict[Timeframe, Bar] = {}
+
+        for tf in self._timeframes:
+            current  = self._current_bars[tf]
+            bar_time = tf.bar_time(bar.time)
+
+            if current is None or bar_time != current.time:
+                if current is not None:
+                    closed_bars[tf] = current
+
+                self._current_bars[tf] = Bar(bar_time, bar.open, bar.high, bar.low, bar.close, bar.volume)
+            else:
+                self._current_bars[tf] = Bar(
+                    current.time,
+                    current.open,
+                    max(current.high, bar.high),
+                    min(current.low,  bar.low),
+                    bar.close,
+                    current.volume + bar.volume
+                )
+
+        self._last_time = bar.time
+
+        return closed_bars
+
+    def update_array(self, bars: BarArray) -> Dict[Timeframe, BarArray]:
+        """Adds bars of timeframe `source`, and returns the bars which they closed, by timeframe.
+
+        Raises
+        ------
+        ValueError
+            If `bars` are not sorted by time, or not newer than the last bar received.
+        """
+
+        if len(bars) == 0:
+            return {tf: BarArray.empty() for tf in self._timeframes}
+
+        self._check_newer(bars[0].time)
+
+        closed_bars: Dict[Timeframe, BarArray] = {}
+
+        for tf in self._timeframes:
+            current = self._current_bars[tf]
+
+            # Resample the current bar along with the new bars, so that new bars which
+            # fall within it are merged into it.
+            if current is None:
+                resampled = resample(bars, tf)
+            else:
+                resampled = resample(BarArray.concatenate([BarArray.from_bars([current]), bars]), tf)
+
+            closed_bars[tf]        = resampled[:-1]
+            self._current_bars[tf] = resampled[-1]
+
+        self._last_time = bars[-1].time
+
+        return closed_bars
+
+    def reset(self):
+        """Discards the current bars."""
+
+        self._current_bars = {tf: None for tf in self._timeframes}
+        self._last_time    = None
+
+    #===============================================================================
+    # Internals
+    #===============================================================================
+    def _check_newer(self, time: datetime):
+        if self._last_time is not None and time <= self._last_time:
+            raise ValueError('bar at %s is not newer than the last bar, at %s' % (time, self._last_time))
\ No newline at end of file
@@ -0,0 +1,329 @@
+import logging
+import multiprocessing
+import pickle
+import queue
+from time   import sleep
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Type
+from rmt    import Exchange, Strategy, Tick, TickRing, error
+
+FORWARDED_METHODS = [
+    'get_tick',
+    'get_instrument',
+    'get_instruments',
+    'get_history_bars',
+    'get_history_bar',
+    'get_current_bar',
+    'place_order',
+    'modify_order',
+    'close_order',
+    'get_order',
+    'get_orders',
+    'orders',
+    'find_orders'
+]
+"""Methods of `WorkerExchange` which are executed by the exchange of a `StrategyRunner`."""
+
+class WorkerExchange(Exchange):
+    """Exchange used by strategies running on worker processes of a `StrategyRunner`.
+
+    Ticks are read from the runner's `TickRing`, and are only emitted for symbols
+    subscribed by `subscribe()`. The methods in `FORWARDED_METHODS` are forwarded
+    to the runner, which executes them on its exchange and sends back their result,
+    or the exception they raised. Such calls block until the runner processes them,
+    which happens on calls to `StrategyRunner.process_events()`.
+
+    Order signals, such as `Exchange.order_filled`, are not emitted by this class.
+    """
+
+    def __init__(self,
+                 worker_id:      int,
+                 ring:           TickRing,
+                 request_queue:  multiprocessing.Queue,
+                 response_queue: multiprocessing.Queue
+    ):
+        super().__init__()
+
+        self._worker_id      = worker_id
+        self._ring           = ring
+        self._request_queue  = request_queue
+        self._response_queue = response_queue
+        self._subscribed_symbols: Set[str] = set()
+
+    def subscribe(self, symbol: str):
+        self._call('subscribe', symbol)
+        self._subscribed_symbols.add(symbol)
+
+    def unsubscribe(self, symbol: str):
+        self._subscribed_symbols.discard(symbol)
+
+    def unsubscribe_all(self):
+        self._subscribed_symbols.clear()
+
+    def subscriptions(self) -> Set[str]:
+        return self._subscribed_symbols.copy()
+
+    def process_events(self) -> int:
+        """Emits `tick_received` for ticks of subscribed symbols written to the ring.
+
+        Returns the number of ticks read from the ring, including those of symbols
+        which are not subscribed.
+        """
+
+        ticks = self._ring.read()
+
+        for symbol, tick in ticks:
+            if symbol in self._subscribed_symbols:
+                self.tick_received.emit(symbol, tick)
+
+        return len(ticks)
+
+    #===============================================================================
+    # Internals
+    #===============================================================================
+    def _call(self, method: str, *args, **kwargs) -> Any:
+        self._request_queue.put((self._worker_id, method, args, kwargs))
+
+        succeeded, result = self._response_queue.get()
+
+        if not succeeded:
+            raise result
+
+        return result
+
+def _make_forwarder(method: str) -> Callable[..., Any]:
+    def forwarder(self: WorkerExchange, *args, **kwargs) -> Any:
+        return self._call(method, *args, **kwargs)
+
+    forwarder.__name__ = method
+    forwarder.__doc__  = getattr(Exchange, method).__doc__
+
+    return forwarder
+
+for _method in FORWARDED_METHODS:
+    setattr(WorkerExchange, _method, _make_forwarder(_method))
+
+class StrategyRunner:
+    """Runs strategies on worker processes, sharing a single exchange connection.
+
+    The class `StrategyRunner` owns an exchange, such as `MetaTrader4`, and writes
+    every tick it receives into a `TickRing` in shared memory. Each strategy added
+    by `add_strategy()` runs on its own process, against a `WorkerExchange` which
+    reads ticks from the ring, so that CPU-heavy strategies don't contend for the
+    interpreter lock of the process which receives ticks.
+
+    Requests made by strategies, such as placing orders, are sent to the runner
+    through a single queue, and executed by the runner's exchange in the order they
+    are received, on calls to `StrategyRunner.process_events()`. Since the process
+    which owns the exchange is the only one to talk to it, the exchange doesn't
+    have to be thread- or process-safe.
+
+    Example
+    -------
+        runner = StrategyRunner(rmt.exchanges.MetaTrader4())
+        runner.add_strategy(MyStrategy, ['EURUSD'])
+        runner.start()
+
+        while running:
+            runner.process_events()
+
+        runner.stop()
+
+    Strategy classes, as well as their arguments, must be picklable, since they
+    are sent to worker processes. In practice, they must be defined at module level.
+    """
+
+    def __init__(self,
+                 exchange:      Exchange,
+                 ring_capacity: int           = 65536,
+                 poll_interval: float         = 0.001,
+                 start_method:  Optional[str] = None
+    ):
+        self._exchange      = exchange
+        self._ring          = TickRing(capacity=ring_capacity)
+        self._poll_interval = poll_interval
+        self._context       = multiprocessing.get_context(start_method)
+        self._logger        = logging.getLogger(StrategyRunner.__name__)
+
+        self._request_queue   = self._context.Queue()
+        self._response_queues: List[multiprocessing.Queue] = []
+        self._stop_event      = self._context.Event()
+        self._workers:         List[multiprocessing.Process] = []
+        self._strategies:      List[Tuple[Type[Strategy], List[str], tuple, Dict[str, Any]]] = []
+
+        # Symbols whose ticks were skipped for not fitting in the ring, which are only warned about once.
+        self._skipped_symbols: Set[str] = set()
+
+        self._exchange.tick_received.connect(self._on_tick_received)
+
+    @property
+    def exchange(self) -> Exchange:
+        """The exchange which receives ticks and executes requests of strategies."""
+
+        return self._exchange
+
+    def add_strategy(self,
+                     strategy_class: Type[Strategy],
+                     symbols:        Iterable[str],
+                     *args,
+                     **kwargs
+    ):
+        """Adds a strategy to be run on its own worker process.
+
+        Once the worker process is started, it subscribes to `symbols` and calls
+        `strategy_class(exchange, symbols, *args, **kwargs)`, where `exchange` is
+        a `WorkerExchange`.
+
+        Raises
+        ------
+        RuntimeError
+            If the runner was already started.
+        ValueError
+            If the UTF-8 encoding of a symbol is longer than `TickRing.MAX_SYMBOL_LEN`
+            bytes, since its ticks couldn't be written to the ring.
+        """
+
+        if len(self._workers) > 0:
+            raise RuntimeError('cannot add strategies after the runner is started')
+
+        symbols = list(symbols)
+
+        for symbol in symbols:
+            if not _fits_in_ring(symbol):
+                raise ValueError("symbol '%s' is longer than %d bytes" % (symbol, TickRing.MAX_SYMBOL_LEN))
+
+        self._strategies.append((strategy_class, symbols, args, kwargs))
+
+    def start(self):
+        """Starts a worker process for each strategy added."""
+
+        if len(self._workers) > 0:
+            return
+
+        self._stop_event.clear()
+
+        for worker_id, (strategy_class, symbols, args, kwargs) in enumerate(self._strategies):
+            response_queue = self._context.Queue()
+
+            worker = self._context.Process(
+                target = _run_worker,
+                args   = (
+                    worker_id,
+                    self._ring.name,
+                    self._request_queue,
+                    response_queue,
+                    self._stop_event,
+                    self._poll_interval,
+                    strategy_class,
+                    symbols,
+                    args,
+                    kwargs
+                ),
+                daemon = True
+            )
+
+            self._response_queues.append(response_queue)
+            self._workers.append(worker)
+
+            worker.start()
+
+    def process_events(self) -> int:
+        """Processes events of the exchange and executes pending requests of strategies.
+
+        Returns the number of requests executed.
+        """
+
+        self._exchange.process_events()
+
+        count = 0
+
+        while True:
+            try:
+                worker_id, method, args, kwargs = self._request_queue.get_nowait()
+            except queue.Empty:
+                break
+
+            self._response_queues[worker_id].put(self._execute(method, args, kwargs))
+            count += 1
+
+        return count
+
+    def stop(self, timeout: Optional[float] = 5):
+        """Stops the worker processes, waiting at most `timeout` seconds for each."""
+
+        self._stop_event.set()
+
+        for worker in self._workers:
+            worker.join(timeout)
+
+            if worker.is_alive():
+                self._logger.warning('worker %s did not stop in time; terminating it', worker.pid)
+                worker.terminate()
+
+        self._workers.clear()
+        self._response_queues.clear()
+
+    def close(self):
+        """Stops the worker processes and destroys the tick ring."""
+
+        self.stop()
+        self._exchange.tick_received.disconnect(self._on_tick_received)
+        self._ring.close()
+
+    #===============================================================================
+    # Internals
+    #===============================================================================
+    def _on_tick_received(self, symbol: str, tick: Tick):
+        # Raising here would stop the exchange from emitting the tick to other slots,
+        # so ticks of symbols which don't fit in the ring are skipped instead. Such
+        # symbols can only come from subscriptions not made through `add_strategy()`.
+        if not _fits_in_ring(symbol):
+            if symbol not in self._skipped_symbols:
+                self._skipped_symbols.add(symbol)
+                self._logger.warning(
+                    "skipping ticks of symbol '%s', which is longer than %d bytes", symbol, TickRing.MAX_SYMBOL_LEN
+                )
+            return
+
+        self._ring.write(symbol, tick)
+
+    def _execute(self, method: str, args: tuple, kwargs: Dict[str, Any]) -> Tuple[bool, Any]:
+        try:
+            return True, getattr(self._exchange, method)(*args, **kwargs)
+        except Exception as e:
+            # Exceptions whose constructor takes arguments other than their message
+            # can't be unpickled by the worker, so send their message instead.
+            try:
+                pickle.loads(pickle.dumps(e))
+            except Exception:
+                e = error.RMTError('%s: %s' % (type(e).__name__, e))
+
+            return False, e
+
+def _fits_in_ring(symbol: str) -> bool:
+    return len(symbol.encode('utf-8')) <= TickRing.MAX_SYMBOL_LEN
+
+def _run_worker(worker_id:      int,
+                ring_name:      str,
+                request_queue:  multiprocessing.Queue,
+                response_queue: multiprocessing.Queue,
+                stop_event:     Any,
+                poll_interval:  float,
+                strategy_class: Type[Strategy],
+                symbols:        List[str],
+                args:           tuple,
+                kwargs:         Dict[str, Any]
+):
+    ring     = TickRing(ring_name)
+    exchange = WorkerExchange(worker_id, ring, request_queue, response_queue)
+
+    for symbol in symbols:
+        exchange.subscribe(symbol)
+
+    strategy_class(exchange, symbols, *args, **kwargs)
+
+    try:
+        while not stop_event.is_set():
+            if exchange.process_events() == 0:
+                sleep(poll_interval)
+    finally:
+        ring.close()
\ No newline at end of file
@@ -0,0 +1,128 @@
+from typing import Any, Callable, Optional, Tuple
+from .      import profiler as profiling
+
+Slot = Callable[..., Any]
+"""Callable connected to a signal."""
+
+class Signal:
+    """Declares an event which objects of a class may emit.
+
+    The class `Signal` mimics the connect/emit semantics of Qt signals without
+    requiring Qt, and is meant to be declared as a class attribute:
+
+        class Exchange:
+            tick_received = Signal(str, Tick)
+
+    Accessing the attribute on an object returns a `BoundSignal`, which is
+    created on first access and stored on the object, so that later accesses
+    are plain attribute lookups.
+
+    Unlike Qt signals, slots are always called directly on the thread which
+    emits the signal, and the argument types passed to `Signal` are used for
+    documentation only; arguments passed to `BoundSignal.emit()` are not checked.
+
+    While a `Profiler` is enabled (see `rmt.profiler.enable()`), each slot called
+    by `BoundSignal.emit()` is timed by it, under the signal's name.
+    """
+
+    def __init__(self, *types: type):
+        self._types = types
+        self._name  = ''
+
+    def __set_name__(self, owner: type, name: str):
+        self._name = name
+
+    def __get__(self, instance: Any, owner: Optional[type] = None):
+        if instance is None:
+            return self
+
+        # `Signal` doesn't define `__set__()`, so the bound signal stored in the
+        # object's `__dict__` takes precedence over it on later lookups.
+        bound_signal = BoundSignal(self._types, self._name)
+        instance.__dict__[self._name] = bound_signal
+
+        return bound_signal
+
+    @property
+    def types(self) -> Tuple[type, ...]:
+        """Types of the arguments passed to slots."""
+
+        return self._types
+
+class BoundSignal:
+    """Signal of a specific object, to which slots are connected."""
+
+    __slots__ = ('_types', '_name', '_slots')
+
+    def __init__(self, types: Tuple[type, ...] = (), name: str = ''):
+        self._types = types
+        self._name  = name
+
+        # Stored as a tuple, rather than a list, so that slots connected or
+        # disconnected while the signal is being emitted don't affect that
+        # ongoing emission, and so that `emit()` doesn't have to copy it.
+        self._slots: Tuple[Slot, ...] = ()
+
+    @property
+    def types(self) -> Tuple[type, ...]:
+        """Types of the arguments passed to slots."""
+
+        return self._types
+
+    @property
+    def name(self) -> str:
+        """Name of the attribute which declares the signal."""
+
+        return self._name
+
+    def connect(self, slot: Slot):
+        """Connects a slot to this signal.
+
+        A slot connected several times is called as many times on emission.
+        """
+
+        self._slots = self._slots + (slot,)
+
+    def disconnect(self, slot: Optional[Slot] = None):
+        """Disconnects a slot, or all slots if `slot` is `None`.
+
+        If a slot is connected several times, only its last connection is removed.
+
+        Raises
+        ------
+        TypeError
+            If `slot` is not connected to this signal.
+        """
+
+        if slot is None:
+            self._slots = ()
+            return
+
+        for i in range(len(self._slots) - 1, -1, -1):
+            if self._slots[i] == slot:
+                self._slots = self._slots[:i] + self._slots[(i + 1):]
+                return
+
+        raise TypeError("'%r' is not connected" % slot)
+
+    def receivers(self) -> int:
+        """Returns the number of slots connected to this signal."""
+
+        return len(self._slots)
+
+    def emit(self, *args):
+        """Calls all connected slots with `args`, in the order they were connected."""
+
+        # Signals are emitted on every tick, so the flag is checked before calling `active()`.
+        profiler = profiling.active() if profiling.enabled else None
+
+        if profiler is None:
+            for slot in self._slots:
+                slot(*args)
+            return
+
+        # Signals which concern an instrument, such as `tick_received`, pass its symbol first.
+        symbol = args[0] if len(args) > 0 and isinstance(args[0], str) else ''
+
+        for slot in self._slots:
+            profiler.call(slot, self._name, symbol, slot, *args)
\ No newline at end of file
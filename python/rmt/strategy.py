@@ -1,9 +1,10 @@
-from datetime     import datetime, timedelta
-from typing       import Optional
-from PyQt5.QtCore import QObject, pyqtSlot
-from rmt          import Exchange, Tick, Bar
+from datetime    import datetime, timedelta
+from typing      import Dict, Iterable, List, Optional
+from rmt         import Exchange, Tick, Bar
+from .indicators import Indicator
+from .profiler   import active as active_profiler
 
-class Strategy(QObject):
+class Strategy:
     """
     Building block of algorithmic trading.
 
@@ -16,14 +17,34 @@ class Strategy(QObject):
 
     After a bar closes, `Strategy.on_bar_closed()` is invoked immediately before
     `Strategy.on_tick()`.
+
+    If `symbols` is given, the strategy only receives ticks of those symbols, which
+    are routed to it by `Exchange.tick_router`. Otherwise, it receives ticks of all
+    symbols subscribed on the exchange. Running many strategies on few symbols each
+    is cheaper if they specify their symbols, since ticks of other symbols are then
+    not dispatched to them at all.
+
+    Indicators added by `Strategy.add_indicator()` are updated with each closed bar
+    of their symbol before `Strategy.on_bar_closed()` is invoked, so that their
+    values are up to date within it.
+
+    While a `Profiler` is enabled (see `rmt.profiler.enable()`), calls of
+    `Strategy.on_tick()` and `Strategy.on_bar_closed()` are timed by it.
     """
 
-    def __init__(self, exchange: Exchange):
+    def __init__(self, exchange: Exchange, symbols: Optional[Iterable[str]] = None):
         super().__init__()
 
         self._exchange = exchange
-        self._exchange.tick_received.connect(self._on_tick_received)
-        self._last_closed_bar_time: Optional[datetime] = None
+        self._symbols  = None if symbols is None else frozenset(symbols)
+        self._last_closed_bar_times: Dict[str, datetime] = {}
+        self._indicators: Dict[str, List[Indicator]] = {}
+
+        if self._symbols is None:
+            self._exchange.tick_router.add_handler(self._on_tick_received)
+        else:
+            for symbol in self._symbols:
+                self._exchange.tick_router.add_handler(self._on_tick_received, symbol)
 
     @property
     def exchange(self) -> Exchange:
@@ -31,6 +52,51 @@ class Strategy(QObject):
 
         return self._exchange
 
+    @property
+    def symbols(self) -> Optional[frozenset]:
+        """Symbols whose ticks the strategy receives, or `None` if it receives ticks of all symbols."""
+
+        return self._symbols
+
+    def stop(self):
+        """Stops receiving ticks."""
+
+        if self._symbols is None:
+            self._exchange.tick_router.remove_handler(self._on_tick_received)
+        else:
+            for symbol in self._symbols:
+                self._exchange.tick_router.remove_handler(self._on_tick_received, symbol)
+
+    def add_indicator(self, symbol: str, indicator: Indicator) -> Indicator:
+        """Updates `indicator` with closed bars of `symbol`, and returns it.
+
+        The indicator may be seeded with history bars beforehand (see `Indicator.seed()`).
+        """
+
+        self._indicators.setdefault(symbol, []).append(indicator)
+
+        return indicator
+
+    def remove_indicator(self, symbol: str, indicator: Indicator):
+        """Stops updating an indicator added by `add_indicator()`.
+
+        Raises
+        ------
+        ValueError
+            If `indicator` was not added for `symbol`.
+        """
+
+        symbol_indicators = self._indicators.get(symbol, [])
+        symbol_indicators.remove(indicator)
+
+        if len(symbol_indicators) == 0:
+            self._indicators.pop(symbol, None)
+
+    def indicators(self, symbol: str) -> List[Indicator]:
+        """Returns the indicators added for `symbol`."""
+
+        return list(self._indicators.get(symbol, ()))
+
     def on_tick(self, symbol: str, server_time: datetime, bid: float, ask: float):
         """Method invoked when an instrument's new quotes is received."""
 
@@ -44,18 +110,27 @@ class Strategy(QObject):
     #===============================================================================
     # Internals
     #===============================================================================
-    @pyqtSlot(str, Tick)
     def _on_tick_received(self, symbol: str, tick: Tick):
+        profiler             = active_profiler()
         last_closed_bar_time = tick.server_time.replace(second=0) - timedelta(0, 60, 0)
 
-        if self._last_closed_bar_time is None:
-            self._last_closed_bar_time = last_closed_bar_time
-        elif self._last_closed_bar_time != last_closed_bar_time:
-            self._last_closed_bar_time = last_closed_bar_time
+        # Bars of each symbol close on its own ticks, so the last closed bar is tracked by symbol.
+        previous_bar_time = self._last_closed_bar_times.get(symbol)
+        self._last_closed_bar_times[symbol] = last_closed_bar_time
 
+        if previous_bar_time is not None and previous_bar_time != last_closed_bar_time:
             closed_bar = self.exchange.get_history_bar(symbol, last_closed_bar_time)
 
             if closed_bar is not None:
-                self.on_bar_closed(symbol, closed_bar)
-
-        self.on_tick(symbol, tick.server_time, tick.bid, tick.ask)
\ No newline at end of file
+                for indicator in self._indicators.get(symbol, ()):
+                    indicator.update_bar(closed_bar)
+
+                if profiler is None:
+                    self.on_bar_closed(symbol, closed_bar)
+                else:
+                    profiler.call(self, 'on_bar_closed', symbol, self.on_bar_closed, symbol, closed_bar)
+
+        if profiler is None:
+            self.on_tick(symbol, tick.server_time, tick.bid, tick.ask)
+        else:
+            profiler.call(self, 'on_tick', symbol, self.on_tick, symbol, tick.server_time, tick.bid, tick.ask)
\ No newline at end of file
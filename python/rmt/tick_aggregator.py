@@ -0,0 +1,176 @@
+import numpy as np
+from enum       import IntEnum
+from typing     import Optional
+from rmt        import Bar, BarArray, Timeframe
+from .resampler import bar_times
+
+TICK_DTYPE = np.dtype([('time', '<f8'), ('bid', '<f8'), ('ask', '<f8')])
+"""Record of a tick in tick files: POSIX time in seconds, bid, and ask."""
+
+class TickPrice(IntEnum):
+    """Price of ticks which bars are made of."""
+
+    BID = 0
+    ASK = 1
+    MID = 2
+
+def save_ticks(path: str, time: np.ndarray, bid: np.ndarray, ask: np.ndarray, append: bool = False):
+    """Writes ticks to a file of `TICK_DTYPE` records, which may be read by `load_ticks()`."""
+
+    records = np.empty(len(time), dtype=TICK_DTYPE)
+    records['time'] = time
+    records['bid']  = bid
+    records['ask']  = ask
+
+    with open(path, 'ab' if append else 'wb') as f:
+        records.tofile(f)
+
+def load_ticks(path: str) -> np.ndarray:
+    """Maps a file of `TICK_DTYPE` records into memory, without reading it."""
+
+    return np.memmap(path, dtype=TICK_DTYPE, mode='r')
+
+class TickAggregator:
+    """Makes bars of `timeframe` from ticks, processing them in vectorized batches.
+
+    The class `TickAggregator` takes arrays of ticks, sorted by time, by `update()`,
+    and groups them into bars by the open times of the bars they fall within (see
+    `Timeframe.bar_time()`). The prices of bars are the bids, asks, or mid prices of
+    ticks, as given by `price`, and their volume is the number of ticks they contain.
+
+    Since the last bar of a batch may continue in the next batch, it's kept as the
+    current bar, and only returned once a tick falls past its end, or by `flush()`.
+    Thus, ticks which don't fit in memory may be aggregated by passing them in
+    chunks, as `aggregate_ticks()` does.
+    """
+
+    def __init__(self, timeframe: Timeframe, price: TickPrice = TickPrice.BID):
+        self._timeframe = timeframe
+        self._price     = price
+        self._current: Optional[BarArray] = None
+        self._last_time = -np.inf
+
+    @property
+    def timeframe(self) -> Timeframe:
+        return self._timeframe
+
+    @property
+    def price(self) -> TickPrice:
+        return self._price
+
+    def current_bar(self) -> Optional[Bar]:
+        """Returns the bar made of the last ticks, which may still continue, or `None` if there's none."""
+
+        return None if self._current is None else self._current[0]
+
+    def update(self, time: np.ndarray, bid: np.ndarray, ask: np.ndarray) -> BarArray:
+        """Adds ticks, and returns the bars which they closed.
+
+        Raises
+        ------
+        ValueError
+            If ticks are not sorted by time, or are older than the last tick added.
+        """
+
+        time = np.asarray(time, dtype=np.float64)
+
+        if len(time) == 0:
+            return BarArray.empty()
+
+        if time[0] < self._last_time or np.any(time[1:] < time[:-1]):
+            raise ValueError('ticks must be sorted by time')
+
+        prices = self._prices(np.asarray(bid, dtype=np.float64), np.asarray(ask, dtype=np.float64))
+
+        keys   = bar_times(np.floor(time).astype(np.int64), self._timeframe)
+        starts = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+        ends   = np.concatenate((starts[1:], [len(time)])) - 1
+
+        bars = BarArray(
+            time   = keys[starts],
+            open   = prices[starts],
+            high   = np.maximum.reduceat(prices, starts),
+            low    = np.minimum.reduceat(prices, starts),
+            close  = prices[ends],
+            volume = np.diff(np.concatenate((starts, [len(time)])))
+        )
+
+        if self._current is not None:
+            bars = self._merge_current(bars)
+
+        self._current   = bars[-1:]
+        self._last_time = time[-1]
+
+        return bars[:-1]
+
+    def flush(self) -> BarArray:
+        """Returns the current bar, if any, as closed, so that the next tick opens a new bar."""
+
+        current = self._current
+        self._current = None
+
+        return BarArray.empty() if current is None else current
+
+    #===============================================================================
+    # Internals
+    #===============================================================================
+    def _prices(self, bid: np.ndarray, ask: np.ndarray) -> np.ndarray:
+        if self._price == TickPrice.BID:
+            return bid
+
+        if self._price == TickPrice.ASK:
+            return ask
+
+        return (bid + ask) / 2
+
+    def _merge_current(self, bars: BarArray) -> BarArray:
+        """Merges the current bar into `bars`, or prepends it if `bars` opens a new bar."""
+
+        current = self._current
+
+        if current.time[0] != bars.time[0]:
+            return BarArray.concatenate([current, bars])
+
+        high   = bars.high.copy()
+        low    = bars.low.copy()
+        open   = bars.open.copy()
+        volume = bars.volume.copy()
+
+        open[0]    = current.open[0]
+        high[0]    = max(high[0], current.high[0])
+        low[0]     = min(low[0],  current.low[0])
+        volume[0] += current.volume[0]
+
+        return BarArray(bars.time, open, high, low, bars.close, volume)
+
+def aggregate_ticks(ticks:      np.ndarray,
+                    timeframe:  Timeframe,
+                    price:      TickPrice = TickPrice.BID,
+                    chunk_size: int       = 1 << 22
+) -> BarArray:
+    """Returns bars of `timeframe` made of an array of `TICK_DTYPE` records, sorted by time.
+
+    Ticks are processed `chunk_size` at a time, so that `ticks` may be a memory-mapped
+    file much larger than memory, as returned by `load_ticks()`:
+
+        bars = aggregate_ticks(load_ticks('EURUSD.ticks'), Timeframe.M1, TickPrice.MID)
+
+    Raises
+    ------
+    ValueError
+        If ticks are not sorted by time.
+    """
+
+    if chunk_size < 1:
+        raise ValueError('chunk size must be at least 1 (got: %s)' % chunk_size)
+
+    aggregator = TickAggregator(timeframe, price)
+    chunks     = []
+
+    for start in range(0, len(ticks), chunk_size):
+        chunk = ticks[start:start + chunk_size]
+        chunks.append(aggregator.update(chunk['time'], chunk['bid'], chunk['ask']))
+
+    chunks.append(aggregator.flush())
+
+    return BarArray.concatenate(chunks)
\ No newline at end of file
@@ -0,0 +1,174 @@
+import struct
+from datetime                      import datetime, timezone
+from multiprocessing.shared_memory import SharedMemory
+from typing                        import List, Optional, Tuple
+from rmt                           import Tick
+
+class TickRing:
+    """Ring buffer of ticks in shared memory, written by one process and read by many.
+
+    The class `TickRing` stores ticks as fixed-size records in a block of shared
+    memory, so that a process receiving ticks may make them available to other
+    processes without serializing them through pipes. The process which creates
+    the ring (with `name` set to `None`) is its only writer, and other processes
+    attach to it by passing its `name`.
+
+    Each reader keeps its own position in the ring. A reader which falls more than
+    `capacity` ticks behind the writer loses the oldest ticks it didn't read, and
+    the number of ticks lost is counted by `TickRing.lost()`, rather than blocking
+    the writer.
+
+    Record layout
+    -------------
+    The block starts with a header holding the sequence number of the next tick
+    to be written, followed by `capacity` records of `RECORD_FORMAT`:
+
+        sequence number | symbol (UTF-8, zero-padded) | timestamp | bid | ask
+
+    Sequence numbers start at 1. Before writing a record, the writer sets its
+    sequence number to 0, and only sets it to the tick's sequence number after
+    the rest of the record has been written. A reader copies a record and then
+    checks its sequence number again, discarding the copy if the record was being
+    overwritten in the meantime.
+    """
+
+    HEADER_FORMAT  = '<Q'
+    RECORD_FORMAT  = '<Q16sddd'
+    MAX_SYMBOL_LEN = 16
+
+    def __init__(self, name: Optional[str] = None, capacity: int = 65536):
+        self._header = struct.Struct(TickRing.HEADER_FORMAT)
+        self._record = struct.Struct(TickRing.RECORD_FORMAT)
+
+        if name is None:
+            size = self._header.size + capacity * self._record.size
+
+            self._shm      = SharedMemory(create=True, size=size)
+            self._owner    = True
+            self._capacity = capacity
+        else:
+            self._shm      = self._attach(name)
+            self._owner    = False
+            self._capacity = (self._shm.size - self._header.size) // self._record.size
+
+        self._buf         = self._shm.buf
+        self._next_write  = 1
+        self._next_read   = self._written_count() + 1
+        self._lost        = 0
+
+    @property
+    def name(self) -> str:
+        """Name by which other processes may attach to the ring."""
+
+        return self._shm.name
+
+    @property
+    def capacity(self) -> int:
+        """Number of ticks the ring holds before overwriting the oldest ones."""
+
+        return self._capacity
+
+    def lost(self) -> int:
+        """Returns the number of ticks this reader lost for falling behind the writer."""
+
+        return self._lost
+
+    def write(self, symbol: str, tick: Tick):
+        """Appends a tick to the ring.
+
+        Raises
+        ------
+        ValueError
+            If the UTF-8 encoding of `symbol` is longer than `MAX_SYMBOL_LEN` bytes.
+        """
+
+        encoded_symbol = symbol.encode('utf-8')
+
+        if len(encoded_symbol) > TickRing.MAX_SYMBOL_LEN:
+            raise ValueError("symbol '%s' is longer than %d bytes" % (symbol, TickRing.MAX_SYMBOL_LEN))
+
+        seq    = self._next_write
+        offset = self._record_offset(seq)
+
+        struct.pack_into('<Q', self._buf, offset, 0)
+        self._record.pack_into(
+            self._buf,
+            offset,
+            0,
+            encoded_symbol,
+            tick.server_time.timestamp(),
+            tick.bid,
+            tick.ask
+        )
+        struct.pack_into('<Q', self._buf, offset, seq)
+
+        self._next_write = seq + 1
+        self._header.pack_into(self._buf, 0, self._next_write - 1)
+
+    def read(self, max_ticks: Optional[int] = None) -> List[Tuple[str, Tick]]:
+        """Returns the ticks written since the last call, oldest first, up to `max_ticks` ticks."""
+
+        written = self._written_count()
+        ticks   = []
+
+        # Skip ticks that have already been overwritten.
+        if written - self._next_read + 1 > self._capacity:
+            first_available = written - self._capacity + 1
+            self._lost     += first_available - self._next_read
+            self._next_read = first_available
+
+        last = written
+
+        if max_ticks is not None:
+            last = min(last, self._next_read + max_ticks - 1)
+
+        while self._next_read <= last:
+            seq    = self._next_read
+            offset = self._record_offset(seq)
+
+            record_seq, encoded_symbol, timestamp, bid, ask = self._record.unpack_from(self._buf, offset)
+            current_seq = struct.unpack_from('<Q', self._buf, offset)[0]
+
+            self._next_read += 1
+
+            if record_seq != seq or current_seq != seq:
+                # The writer lapped this reader while the record was being read.
+                self._lost += 1
+                continue
+
+            tick = Tick(datetime.fromtimestamp(timestamp, timezone.utc), bid, ask)
+            ticks.append((encoded_symbol.rstrip(b'\0').decode('utf-8'), tick))
+
+        return ticks
+
+    def close(self):
+        """Detaches from the ring, and destroys it if this is the process which created it."""
+
+        self._buf = None
+        self._shm.close()
+
+        if self._owner:
+            self._shm.unlink()
+
+    #===============================================================================
+    # Internals
+    #===============================================================================
+    def _written_count(self) -> int:
+        return self._header.unpack_from(self._buf, 0)[0]
+
+    def _record_offset(self, seq: int) -> int:
+        return self._header.size + ((seq - 1) % self._capacity) * self._record.size
+
+    def _attach(self, name: str) -> SharedMemory:
+        ################################################################################
+        # Before Python 3.13, attaching to a block of shared memory registers it with
+        # the resource tracker as if this process had created it. That's harmless for
+        # processes started by `multiprocessing` from the process which created the
+        # ring, such as workers of `StrategyRunner`, since they share its tracker, but
+        # an unrelated process would destroy the block on exit. So opt out of tracking
+        # where possible.
+        ################################################################################
+        try:
+            return SharedMemory(name=name, track=False)
+        except TypeError:
+            return SharedMemory(name=name)
\ No newline at end of file
@@ -0,0 +1,81 @@
+from typing import Callable, Dict, Optional, Set, Tuple
+from rmt    import Tick
+
+TickHandler = Callable[[str, Tick], None]
+"""Function called with an instrument's symbol and its new tick."""
+
+class TickRouter:
+    """Routes ticks to handlers registered for their instrument's symbol.
+
+    The class `TickRouter` keeps a table mapping symbols to the handlers which
+    are interested in them, and `TickRouter.route()` calls only the handlers
+    registered for a tick's symbol, plus those registered for all symbols.
+    As such, the cost of routing a tick depends on how many handlers want it,
+    not on how many handlers exist for other symbols.
+
+    A router is usually obtained from `Exchange.tick_router`, which connects
+    `TickRouter.route()` to `Exchange.tick_received`. Note that registering a
+    handler for a symbol doesn't subscribe to that symbol's ticks; that is
+    done by `Exchange.subscribe()`.
+    """
+
+    def __init__(self):
+        # Handlers are stored in tuples, so that handlers added or removed while
+        # a tick is being routed don't affect that ongoing routing.
+        self._handlers: Dict[str, Tuple[TickHandler, ...]] = {}
+        self._global_handlers: Tuple[TickHandler, ...] = ()
+
+    def add_handler(self, handler: TickHandler, symbol: Optional[str] = None):
+        """Registers a handler to be called with ticks of `symbol`.
+
+        If `symbol` is `None`, the handler is called with ticks of all symbols.
+        """
+
+        if symbol is None:
+            self._global_handlers = self._global_handlers + (handler,)
+        else:
+            self._handlers[symbol] = self._handlers.get(symbol, ()) + (handler,)
+
+    def remove_handler(self, handler: TickHandler, symbol: Optional[str] = None):
+        """Unregisters a handler registered by `add_handler()` with the same arguments.
+
+        Raises
+        ------
+        ValueError
+            If `handler` is not registered for `symbol`.
+        """
+
+        if symbol is None:
+            self._global_handlers = self._without(self._global_handlers, handler)
+            return
+
+        handlers = self._without(self._handlers.get(symbol, ()), handler)
+
+        if len(handlers) == 0:
+            del self._handlers[symbol]
+        else:
+            self._handlers[symbol] = handlers
+
+    def symbols(self) -> Set[str]:
+        """Returns the symbols for which at least one handler is registered."""
+
+        return set(self._handlers)
+
+    def route(self, symbol: str, tick: Tick):
+        """Calls the handlers registered for `symbol` and for all symbols."""
+
+        for handler in self._handlers.get(symbol, ()):
+            handler(symbol, tick)
+
+        for handler in self._global_handlers:
+            handler(symbol, tick)
+
+    #===============================================================================
+    # Internals
+    #===============================================================================
+    def _without(self, handlers: Tuple[TickHandler, ...], handler: TickHandler) -> Tuple[TickHandler, ...]:
+        for i in range(len(handlers) - 1, -1, -1):
+            if handlers[i] == handler:
+                return handlers[:i] + handlers[(i + 1):]
+
+        raise ValueError('handler is not registered')
\ No newline at end of file
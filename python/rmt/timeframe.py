@@ -1,4 +1,5 @@
-from enum import Enum
+from datetime import datetime, timedelta
+from enum     import Enum
 
 class Timeframe(Enum):
     M1  = 'M1'
@@ -9,4 +10,46 @@ class Timeframe(Enum):
     H4  = 'H4'
     D1  = 'D1'
     W1  = 'W1'
-    MN1 = 'MN1'
\ No newline at end of file
+    MN1 = 'MN1'
+
+    @property
+    def duration(self) -> timedelta:
+        """Nominal duration of a bar of this timeframe.
+
+        Since months vary in length, `Timeframe.MN1` is taken to last 31 days,
+        which is as long as a month may be.
+        """
+
+        return _DURATIONS[self]
+
+    def bar_time(self, time: datetime) -> datetime:
+        """Returns the open time of the bar of this timeframe which contains `time`.
+
+        As on MetaTrader 4, bars up to `Timeframe.D1` are aligned to midnight,
+        weekly bars open on Sundays, and monthly bars open on the first day of
+        the month. The returned time has the same time zone as `time`.
+        """
+
+        midnight = time.replace(hour=0, minute=0, second=0, microsecond=0)
+
+        if self == Timeframe.MN1:
+            return midnight.replace(day=1)
+
+        if self == Timeframe.W1:
+            return midnight - timedelta(days=(midnight.weekday() + 1) % 7)
+
+        duration = _DURATIONS[self]
+
+        return midnight + ((time - midnight) // duration) * duration
+
+_DURATIONS = {
+    Timeframe.M1:  timedelta(minutes=1),
+    Timeframe.M5:  timedelta(minutes=5),
+    Timeframe.M15: timedelta(minutes=15),
+    Timeframe.M30: timedelta(minutes=30),
+    Timeframe.H1:  timedelta(hours=1),
+    Timeframe.H4:  timedelta(hours=4),
+    Timeframe.D1:  timedelta(days=1),
+    Timeframe.W1:  timedelta(weeks=1),
+    Timeframe.MN1: timedelta(days=31)
+}
\ No newline at end of file
@@ -16,7 +16,7 @@ logging.getLogger().setLevel(logging.INFO)
 exchange = rmt.exchanges.MetaTrader4()
 exchange.subscribe('US100')
 
-strategy = MyStrategy(exchange)
+strategy = MyStrategy(exchange, symbols=['US100'])
 
 for i in range(5):
     exchange.process_events()
@@ -0,0 +1,18 @@
+import os
+import rmt
+
+SNAPSHOT_PATH = 'instruments.json'
+
+mt4 = rmt.exchanges.MetaTrader4()
+
+if os.path.exists(SNAPSHOT_PATH):
+    instruments = mt4.load_instruments(SNAPSHOT_PATH)
+else:
+    instruments = mt4.get_instruments('*')
+    mt4.save_instruments(SNAPSHOT_PATH)
+
+for symbol, instrument in instruments.items():
+    print(symbol, instrument.description)
+
+# Served from the cache, without sending requests to the Expert.
+print(mt4.get_instruments(['US100', 'EURUSD']))
\ No newline at end of file
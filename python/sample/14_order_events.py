@@ -0,0 +1,19 @@
+import logging
+import rmt
+from time import sleep
+
+logging.basicConfig()
+logging.getLogger().setLevel(logging.INFO)
+
+exchange = rmt.exchanges.MetaTrader4()
+
+exchange.order_placed.connect(lambda order: print('placed:', order))
+exchange.order_filled.connect(lambda order: print('filled:', order))
+exchange.order_closed.connect(lambda order: print('closed:', order))
+exchange.order_canceled.connect(lambda order: print('canceled:', order))
+exchange.order_expired.connect(lambda order: print('expired:', order))
+
+# Place, fill, or close orders on the terminal, and their changes will be printed.
+for i in range(60):
+    exchange.process_events()
+    sleep(1)
\ No newline at end of file
@@ -0,0 +1,13 @@
+import rmt
+
+mt4 = rmt.exchanges.MetaTrader4()
+
+# Filled and pending orders on US100, retrieved in a single request.
+for ticket, order in mt4.get_orders(symbol='US100').items():
+    print(ticket, order)
+
+# Orders closed, canceled, or expired with magic number 42.
+print(mt4.get_orders(magic_number=42, history=True).keys())
+
+# Orders are now tracked and served without further requests.
+print(mt4.orders().keys())
\ No newline at end of file
@@ -0,0 +1,23 @@
+import datetime
+import logging
+import rmt
+from time import sleep
+
+class MyStrategy(rmt.Strategy):
+    def on_tick(self, symbol: str, server_time: datetime, bid: float, ask: float):
+        print('on_tick:', symbol, server_time, bid, ask)
+
+if __name__ == '__main__':
+    logging.basicConfig()
+    logging.getLogger().setLevel(logging.INFO)
+
+    runner = rmt.StrategyRunner(rmt.exchanges.MetaTrader4())
+    runner.add_strategy(MyStrategy, ['US100'])
+    runner.add_strategy(MyStrategy, ['EURUSD'])
+    runner.start()
+
+    for i in range(500):
+        runner.process_events()
+        sleep(0.01)
+
+    runner.close()
\ No newline at end of file
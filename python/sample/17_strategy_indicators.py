@@ -0,0 +1,31 @@
+import logging
+import rmt
+from rmt.indicators import SMA, RSI
+from time           import sleep
+
+class MyStrategy(rmt.Strategy):
+    def __init__(self, exchange: rmt.Exchange):
+        super().__init__(exchange, symbols=['US100'])
+
+        history = exchange.get_history_bars('US100')
+
+        self.sma = self.add_indicator('US100', SMA(20))
+        self.rsi = self.add_indicator('US100', RSI(14))
+
+        self.sma.seed(history)
+        self.rsi.seed(history)
+
+    def on_bar_closed(self, symbol: str, bar: rmt.Bar):
+        print('on_bar_closed:', symbol, bar, 'SMA:', self.sma.value, 'RSI:', self.rsi.value)
+
+logging.basicConfig()
+logging.getLogger().setLevel(logging.INFO)
+
+exchange = rmt.exchanges.MetaTrader4()
+exchange.subscribe('US100')
+
+strategy = MyStrategy(exchange)
+
+for i in range(300):
+    exchange.process_events()
+    sleep(1)
\ No newline at end of file
@@ -0,0 +1,47 @@
+import rmt
+from rmt.backtest   import Metrics
+from rmt.indicators import SMA
+
+class MovingAverageCross(rmt.Strategy):
+    def __init__(self, exchange: rmt.Exchange, symbols, fast: int = 10, slow: int = 30):
+        super().__init__(exchange, symbols)
+
+        self.fast   = {symbol: self.add_indicator(symbol, SMA(fast)) for symbol in symbols}
+        self.slow   = {symbol: self.add_indicator(symbol, SMA(slow)) for symbol in symbols}
+        self.ticket = {}
+
+    def on_bar_closed(self, symbol: str, bar: rmt.Bar):
+        fast = self.fast[symbol].value
+        slow = self.slow[symbol].value
+
+        if fast is None or slow is None:
+            return
+
+        side   = rmt.Side.BUY if fast > slow else rmt.Side.SELL
+        ticket = self.ticket.get(symbol)
+
+        if ticket is not None:
+            if self.exchange.get_order(ticket).side() == side:
+                return
+
+            self.exchange.close_order(ticket)
+
+        self.ticket[symbol] = self.exchange.place_order(symbol, side, rmt.OrderType.MARKET_ORDER, 0.1)
+
+def losing_too_much(metrics: Metrics) -> bool:
+    return metrics['max_drawdown'] > 500
+
+if __name__ == '__main__':
+    exchange = rmt.exchanges.MetaTrader4()
+    bars     = {'EURUSD': rmt.BarArray.from_bars(exchange.get_history_bars('EURUSD'))}
+
+    optimizer = rmt.Optimizer(MovingAverageCross, bars, spread=0.0001, contract_size=100000)
+
+    try:
+        params  = rmt.Optimizer.grid({'fast': [5, 10, 20], 'slow': [30, 50, 100]})
+        results = optimizer.run(params, early_stop=losing_too_much)
+    finally:
+        optimizer.close()
+
+    for result in sorted(results, key=lambda result: result.metrics['net_profit'], reverse=True):
+        print(result.params, result.metrics, '(stopped early)' if result.stopped else '')
\ No newline at end of file
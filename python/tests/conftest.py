@@ -0,0 +1,88 @@
+import socket
+import pytest
+from time              import monotonic, sleep
+from typing            import Callable
+from rmt.exchanges.mt4 import StubServer, MetaTrader4
+
+INSTRUMENT = {
+    'desc':       'Euro vs US Dollar',
+    'bcurrency':  'EUR',
+    'pcurrency':  'USD',
+    'mcurrency':  'EUR',
+    'ndecimals':  5,
+    'point':      0.00001,
+    'ticksz':     0.00001,
+    'contractsz': 100000.0,
+    'lotstep':    0.01,
+    'minlot':     0.01,
+    'maxlot':     100.0,
+    'minstop':    10,
+    'freezelvl':  0,
+    'spread':     2
+}
+"""Instrument object in the format of a `getInstrument` response."""
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+def process_until(client: MetaTrader4, condition: Callable[[], bool], timeout: float = 2.0):
+    """Processes events of `client` until `condition()` holds, failing after `timeout` seconds."""
+
+    deadline = monotonic() + timeout
+
+    while not condition():
+        if monotonic() > deadline:
+            raise AssertionError('condition not met within %s seconds' % timeout)
+
+        client.process_events()
+        sleep(0.01)
+
+@pytest.fixture
+def ports():
+    """Free ports for the REP and PUB sockets of a `StubServer`."""
+
+    return free_port(), free_port()
+
+@pytest.fixture
+def server(ports):
+    """A started `StubServer`, bound to `ports`."""
+
+    server = StubServer(host='127.0.0.1', rep_port=ports[0], pub_port=ports[1])
+    server.set_response('watchSymbol')
+    server.start()
+
+    yield server
+
+    server.close()
+
+@pytest.fixture
+def make_client(server, ports):
+    """Factory of `MetaTrader4` clients connected to `server`, which are disconnected after the test."""
+
+    clients = []
+
+    def make(**kwargs) -> MetaTrader4:
+        client = MetaTrader4(
+            host     = '127.0.0.1',
+            req_port = ports[0],
+            sub_port = ports[1],
+            **kwargs
+        )
+        clients.append(client)
+
+        # Give the SUB socket time to connect, so that events published right
+        # away aren't lost.
+        sleep(0.2)
+
+        return client
+
+    yield make
+
+    for client in clients:
+        client.disconnect()
+
+@pytest.fixture
+def client(make_client) -> MetaTrader4:
+    return make_client()
@@ -0,0 +1,156 @@
+import numpy as np
+import pytest
+from datetime import datetime, timedelta, timezone
+from rmt      import BacktestExchange, BarArray, OrderStatus, OrderType, Side, Timeframe
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+def flat_bars(opens) -> BarArray:
+    opens = np.array(opens, dtype=np.float64)
+
+    return BarArray(
+        time  = (int(START.timestamp()) + 60 * np.arange(len(opens))).astype('datetime64[s]'),
+        open  = opens,
+        high  = opens,
+        low   = opens,
+        close = opens
+    )
+
+def run_with(exchange: BacktestExchange, actions):
+    """Replays bars of EURUSD, calling `actions[i](exchange)` on the tick of the i-th bar."""
+
+    index = [0]
+
+    def on_tick(symbol, tick):
+        action = actions.get(index[0])
+        index[0] += 1
+
+        if action is not None:
+            action(exchange)
+
+    exchange.subscribe('EURUSD')
+    exchange.tick_received.connect(on_tick)
+    exchange.run()
+
+def test_market_order_fills_at_ask_and_closes_at_bid():
+    exchange = BacktestExchange({'EURUSD': flat_bars([1.0, 1.1, 1.2])}, spread=0.01, contract_size=100)
+    tickets  = []
+
+    run_with(exchange, {
+        0: lambda e: tickets.append(e.place_order('EURUSD', Side.BUY, OrderType.MARKET_ORDER, 2)),
+        2: lambda e: e.close_order(tickets[0])
+    })
+
+    order = exchange.get_order(tickets[0])
+
+    assert order.status()      == OrderStatus.CLOSED
+    assert order.open_price()  == pytest.approx(1.01)
+    assert order.close_price() == pytest.approx(1.2)
+    assert order.profit()      == pytest.approx(0.19 * 2 * 100)
+    assert exchange.metrics()['net_profit'] == pytest.approx(38)
+
+def test_limit_order_fills_once_market_reaches_its_price():
+    exchange = BacktestExchange({'EURUSD': flat_bars([1.3, 1.2, 1.1, 1.0])})
+    tickets  = []
+    states   = []
+
+    run_with(exchange, {
+        0: lambda e: tickets.append(e.place_order('EURUSD', Side.BUY, OrderType.LIMIT_ORDER, 1, price=1.15)),
+        1: lambda e: states.append(e.get_order(tickets[0]).status()),
+        3: lambda e: states.append(e.get_order(tickets[0]).status())
+    })
+
+    order = exchange.get_order(tickets[0])
+
+    assert states == [OrderStatus.PENDING, OrderStatus.FILLED]
+    assert order.open_price() == pytest.approx(1.1)
+    assert order.open_time()  == START + timedelta(minutes=2)
+
+def test_take_profit_and_stop_loss_close_filled_orders():
+    exchange = BacktestExchange({'EURUSD': flat_bars([1.0, 1.1, 1.2, 1.3, 1.4])})
+    tickets  = []
+
+    run_with(exchange, {
+        0: lambda e: tickets.extend([
+            e.place_order('EURUSD', Side.BUY,  OrderType.MARKET_ORDER, 1, take_profit=1.25),
+            e.place_order('EURUSD', Side.SELL, OrderType.MARKET_ORDER, 1, stop_loss=1.15)
+        ])
+    })
+
+    take_profit = exchange.get_order(tickets[0])
+    stop_loss   = exchange.get_order(tickets[1])
+
+    assert take_profit.status()      == OrderStatus.CLOSED
+    assert take_profit.close_price() == pytest.approx(1.3)
+    assert take_profit.profit()      == pytest.approx(0.3)
+    assert stop_loss.close_price()   == pytest.approx(1.2)
+    assert stop_loss.profit()        == pytest.approx(-0.2)
+
+    metrics = exchange.metrics()
+
+    assert metrics['trades']   == 2
+    assert metrics['win_rate'] == 0.5
+
+def test_pending_order_expires():
+    exchange   = BacktestExchange({'EURUSD': flat_bars([1.0, 1.0, 1.0, 1.0])})
+    expiration = START + timedelta(minutes=2)
+    tickets    = []
+
+    run_with(exchange, {
+        0: lambda e: tickets.append(
+            e.place_order('EURUSD', Side.BUY, OrderType.LIMIT_ORDER, 1, price=0.5, expiration=expiration)
+        )
+    })
+
+    order = exchange.get_order(tickets[0])
+
+    assert order.status()     == OrderStatus.EXPIRED
+    assert order.close_time() == expiration
+
+def test_partial_close_leaves_remaining_lots_in_new_order():
+    exchange = BacktestExchange({'EURUSD': flat_bars([1.0, 1.1])})
+    tickets  = []
+
+    run_with(exchange, {
+        0: lambda e: tickets.append(e.place_order('EURUSD', Side.BUY, OrderType.MARKET_ORDER, 3)),
+        1: lambda e: tickets.append(e.close_order(tickets[0], lots=1))
+    })
+
+    closed    = exchange.get_order(tickets[0])
+    remaining = exchange.get_order(tickets[1])
+
+    assert tickets[1]         != tickets[0]
+    assert closed.status()    == OrderStatus.CLOSED
+    assert closed.lots()      == 1
+    assert remaining.status() == OrderStatus.FILLED
+    assert remaining.lots()   == 2
+
+def test_history_bars_exclude_bar_being_replayed():
+    exchange = BacktestExchange({'EURUSD': flat_bars([1.0, 1.1, 1.2, 1.3])})
+    counts   = []
+
+    run_with(exchange, {i: lambda e: counts.append(len(e.get_history_bars('EURUSD'))) for i in range(4)})
+
+    assert counts == [0, 1, 2, 3]
+
+def test_bars_of_coarser_timeframes_are_resampled():
+    exchange = BacktestExchange({'EURUSD': flat_bars([1.0, 1.1, 1.2, 1.3, 1.4, 1.5, 1.6])})
+    bars     = []
+
+    run_with(exchange, {6: lambda e: bars.extend(e.get_history_bars('EURUSD', timeframe=Timeframe.M5))})
+
+    assert len(bars) == 2
+    assert (bars[0].open, bars[0].high, bars[0].close) == pytest.approx((1.0, 1.4, 1.4))
+    assert exchange.get_current_bar('EURUSD', Timeframe.M5).open == pytest.approx(1.5)
+
+def test_finer_timeframes_than_bars_are_rejected():
+    exchange = BacktestExchange({'EURUSD': flat_bars([1.0])}, timeframe=Timeframe.M5)
+
+    exchange.subscribe('EURUSD')
+    exchange.run()
+
+    with pytest.raises(ValueError):
+        exchange.get_history_bars('EURUSD', timeframe=Timeframe.M1)
+
+    with pytest.raises(ValueError):
+        exchange.get_current_bar('EURUSD', Timeframe.M1)
\ No newline at end of file
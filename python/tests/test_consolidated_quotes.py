@@ -0,0 +1,61 @@
+from datetime import datetime, timezone
+from rmt      import ConsolidatedQuotes, Side, Tick
+
+def tick(bid: float, ask: float, second: int = 0) -> Tick:
+    return Tick(datetime(2024, 1, 1, 0, 0, second, tzinfo=timezone.utc), bid, ask)
+
+def test_best_bid_and_ask_come_from_different_sources():
+    quotes = ConsolidatedQuotes()
+    quotes.update('A', 'EURUSD', tick(1.10, 1.13, 1))
+    quotes.update('B', 'EURUSD', tick(1.09, 1.12, 2))
+
+    assert quotes.best_bid('EURUSD') == ('A', 1.10)
+    assert quotes.best_ask('EURUSD') == ('B', 1.12)
+    assert quotes.best_source('EURUSD', Side.BUY)  == 'B'
+    assert quotes.best_source('EURUSD', Side.SELL) == 'A'
+
+    best = quotes.get_best_tick('EURUSD')
+
+    assert (best.bid, best.ask, best.server_time.second) == (1.10, 1.12, 2)
+
+def test_improving_quote_takes_over():
+    quotes = ConsolidatedQuotes()
+    quotes.update('A', 'EURUSD', tick(1.10, 1.11))
+    quotes.update('B', 'EURUSD', tick(1.11, 1.10))
+
+    assert quotes.best_bid('EURUSD') == ('B', 1.11)
+    assert quotes.best_ask('EURUSD') == ('B', 1.10)
+
+def test_worsening_best_quote_gives_way_to_other_source():
+    quotes = ConsolidatedQuotes()
+    quotes.update('A', 'EURUSD', tick(1.10, 1.11))
+    quotes.update('B', 'EURUSD', tick(1.09, 1.12))
+    quotes.update('A', 'EURUSD', tick(1.00, 1.20))
+
+    assert quotes.best_bid('EURUSD') == ('B', 1.09)
+    assert quotes.best_ask('EURUSD') == ('B', 1.12)
+
+def test_stale_sources_are_ignored():
+    now    = [0.0]
+    quotes = ConsolidatedQuotes(max_age=1.0, clock=lambda: now[0])
+
+    quotes.update('A', 'EURUSD', tick(1.10, 1.11))
+    now[0] = 0.5
+    quotes.update('B', 'EURUSD', tick(1.09, 1.12))
+    now[0] = 1.2
+
+    assert quotes.is_stale('A', 'EURUSD')
+    assert quotes.best_bid('EURUSD') == ('B', 1.09)
+    assert quotes.best_ask('EURUSD') == ('B', 1.12)
+
+    now[0] = 2.0
+
+    assert quotes.get_best_tick('EURUSD') is None
+    assert sorted(quotes.quotes('EURUSD')) == ['A', 'B']
+
+def test_unknown_symbol_has_no_quotes():
+    quotes = ConsolidatedQuotes()
+
+    assert quotes.best_bid('EURUSD') is None
+    assert quotes.get_best_tick('EURUSD') is None
+    assert quotes.quotes('EURUSD') == {}
@@ -0,0 +1,80 @@
+import pytest
+from rmt       import Bar, Timeframe
+from .conftest import process_until
+
+# 2024-01-01 00:00 UTC, the open time of the bar served by `getCurrentBar`.
+BAR_TIME = 1704067200
+
+@pytest.fixture
+def ticks(server, client):
+    """Bids of the ticks received by `client`, once subscribed to EURUSD."""
+
+    received = []
+
+    client.tick_received.connect(lambda symbol, tick: received.append(tick.bid))
+    client.subscribe('EURUSD')
+
+    # The subscription takes a moment to reach the PUB socket, so publish until a
+    # tick arrives. No bar is cached yet, so these ticks don't change any.
+    def received_tick() -> bool:
+        server.publish_tick('EURUSD', BAR_TIME, 1.0, 1.1)
+        return len(received) > 0
+
+    process_until(client, received_tick)
+    client.process_events()
+    received.clear()
+
+    server.set_response('getCurrentBar', [BAR_TIME, 1.0, 1.2, 0.9, 1.1, 10])
+
+    return received
+
+def publish_tick(server, client, ticks, timestamp: int, bid: float):
+    count = len(ticks)
+
+    server.publish_tick('EURUSD', timestamp, bid, bid + 0.1)
+    process_until(client, lambda: len(ticks) > count)
+
+def fields(bar: Bar) -> tuple:
+    return int(bar.time.timestamp()), bar.open, bar.high, bar.low, bar.close, bar.volume
+
+def bar_requests(server):
+    return [command for command, _ in server.requests()].count('getCurrentBar')
+
+def test_current_bar_is_updated_by_ticks_of_the_same_bar(server, client, ticks):
+    client.get_current_bar('EURUSD', Timeframe.M1)
+
+    publish_tick(server, client, ticks, BAR_TIME + 10, 1.3)
+    publish_tick(server, client, ticks, BAR_TIME + 20, 0.8)
+
+    bar = client.get_current_bar('EURUSD', Timeframe.M1)
+
+    assert fields(bar) == (BAR_TIME, 1.0, 1.3, 0.8, 0.8, 12)
+    assert bar_requests(server) == 1
+
+def test_current_bar_rolls_over_to_a_new_bar(server, client, ticks):
+    client.get_current_bar('EURUSD', Timeframe.M1)
+
+    publish_tick(server, client, ticks, BAR_TIME + 65, 1.4)
+
+    bar = client.get_current_bar('EURUSD', Timeframe.M1)
+
+    assert fields(bar) == (BAR_TIME + 60, 1.4, 1.4, 1.4, 1.4, 1)
+    assert bar_requests(server) == 1
+
+def test_late_ticks_of_a_previous_bar_are_ignored(server, client, ticks):
+    client.get_current_bar('EURUSD', Timeframe.M1)
+
+    publish_tick(server, client, ticks, BAR_TIME + 65, 1.4)
+    publish_tick(server, client, ticks, BAR_TIME + 30, 2.0)
+
+    bar = client.get_current_bar('EURUSD', Timeframe.M1)
+
+    assert fields(bar) == (BAR_TIME + 60, 1.4, 1.4, 1.4, 1.4, 1)
+
+def test_bars_are_only_cached_for_subscribed_symbols(server, client):
+    server.set_response('getCurrentBar', [BAR_TIME, 1.0, 1.2, 0.9, 1.1, 10])
+
+    client.get_current_bar('GBPUSD', Timeframe.M1)
+    client.get_current_bar('GBPUSD', Timeframe.M1)
+
+    assert bar_requests(server) == 2
\ No newline at end of file
@@ -0,0 +1,26 @@
+import pytest
+from datetime                    import datetime, timezone
+from rmt                         import OrderStatus
+from rmt.exchanges.mt4.responses import GetOrdersResponse
+from .test_order_events          import PENDING_ORDER
+
+def test_get_orders_tracks_returned_orders(server, client):
+    server.set_response('getOrders', [dict(PENDING_ORDER, ticket=5), dict(PENDING_ORDER, ticket=6, symbol='GBPUSD')])
+
+    orders = client.get_orders(symbol='EURUSD', magic_number=3, start_time=datetime(2024, 1, 1, tzinfo=timezone.utc))
+
+    assert sorted(orders) == [5, 6]
+    assert orders[6].symbol() == 'GBPUSD'
+    assert set(client.find_orders(status=OrderStatus.PENDING)) == {5, 6}
+    assert server.requests()[-1] == ('getOrders', {'symbol': 'EURUSD', 'magic': 3, 'start_time': 1704067200})
+
+def test_get_orders_without_matches_returns_no_orders(server, client):
+    # The Expert sends no content at all if no orders match.
+    server.set_response('getOrders', None)
+
+    assert client.get_orders(history=True) == {}
+    assert server.requests()[-1] == ('getOrders', {'history': True})
+
+def test_orders_response_of_invalid_type_raises_value_error():
+    with pytest.raises(ValueError):
+        GetOrdersResponse({'ticket': 5})
\ No newline at end of file
@@ -0,0 +1,90 @@
+import pytest
+from datetime          import datetime, timedelta, timezone
+from rmt               import Timeframe, error
+from rmt.exchanges.mt4 import CommandResultCode
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+def serve_history(server, bar_count: int, failing_starts=()):
+    """Answers `getHistoryBars` with M1 bars from `START` on, within the requested range.
+
+    Requests starting at a time in `failing_starts` fail with the paired result code.
+    """
+
+    failures = dict(failing_starts)
+
+    def get_history_bars(content):
+        start = content.get('start_time', 0)
+        end   = content.get('end_time',   2 ** 40)
+
+        if start in failures:
+            return failures[start], None
+
+        bars = []
+
+        for i in range(bar_count):
+            t = int((START + timedelta(minutes=i)).timestamp())
+
+            if start <= t <= end:
+                bars.append([t, 1.0 + i, 2.0 + i, 0.5 + i, 1.5 + i, 1])
+
+        return CommandResultCode.SUCCESS, bars
+
+    server.set_handler('getHistoryBars', get_history_bars)
+
+def history_requests(server):
+    return [content for command, content in server.requests() if command == 'getHistoryBars']
+
+def test_long_ranges_are_split_into_chunks(server, make_client):
+    serve_history(server, 100)
+    client = make_client(history_chunk_bars=30)
+
+    bars = client.get_history_bars('EURUSD', START, START + timedelta(minutes=99), Timeframe.M1)
+
+    assert [bar.time for bar in bars] == [START + timedelta(minutes=i) for i in range(100)]
+    assert bars[42].open == 43.0
+    assert len(history_requests(server)) == 4
+
+def test_short_ranges_are_requested_at_once(server, make_client):
+    serve_history(server, 100)
+    client = make_client(history_chunk_bars=30)
+
+    bars = client.get_history_bars('EURUSD', START, START + timedelta(minutes=20), Timeframe.M1)
+
+    assert len(bars) == 21
+    assert len(history_requests(server)) == 1
+
+def test_chunking_may_be_disabled(server, make_client):
+    serve_history(server, 100)
+    client = make_client(history_chunk_bars=None)
+
+    assert len(client.get_history_bars('EURUSD', START, START + timedelta(minutes=99))) == 100
+    assert len(history_requests(server)) == 1
+
+
+def chunk_start(minutes: int) -> int:
+    """Returns the start time of the chunk requested at `minutes` past `START`, whose end is a second earlier."""
+
+    return int((START + timedelta(minutes=minutes)).timestamp()) + 1
+
+def test_chunks_without_history_data_are_skipped(server, make_client):
+    serve_history(server, 100, [(chunk_start(30), CommandResultCode.NO_HISTORY_DATA)])
+    client = make_client(history_chunk_bars=30)
+
+    bars = client.get_history_bars('EURUSD', START, START + timedelta(minutes=99), Timeframe.M1)
+
+    assert len(history_requests(server)) == 4
+    assert [bar.time for bar in bars] == (
+        [START + timedelta(minutes=i) for i in range(31)] +
+        [START + timedelta(minutes=i) for i in range(61, 100)]
+    )
+
+def test_other_chunk_failures_are_raised(server, make_client):
+    serve_history(server, 100, [(chunk_start(30), CommandResultCode.HISTORY_WILL_UPDATED)])
+    client = make_client(history_chunk_bars=30)
+
+    with pytest.raises(error.ExecutionError) as exc_info:
+        client.get_history_bars('EURUSD', START, START + timedelta(minutes=99), Timeframe.M1)
+
+    assert exc_info.value.code == CommandResultCode.HISTORY_WILL_UPDATED
+    assert len(history_requests(server)) == 2
\ No newline at end of file
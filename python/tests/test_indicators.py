@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+from datetime       import datetime, timedelta, timezone
+from rmt            import Bar
+from rmt.indicators import (SMA, EMA, WMA, RollingMin, RollingMax, RSI, ATR,
+                            BollingerBands, MACD, vectorized)
+
+def random_bars(count: int, seed: int = 1):
+    rng   = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 1, count))
+    open  = np.concatenate([[100.0], close[:-1]])
+    high  = np.maximum(open, close) + rng.uniform(0, 1, count)
+    low   = np.minimum(open, close) - rng.uniform(0, 1, count)
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    return [
+        Bar(start + timedelta(minutes=i), float(open[i]), float(high[i]), float(low[i]), float(close[i]), 1)
+        for i in range(count)
+    ]
+
+def streamed(indicator, bars):
+    return [indicator.update_bar(bar) for bar in bars]
+
+def assert_matches(streaming_values, vectorized_values):
+    for i, (expected, actual) in enumerate(zip(streaming_values, vectorized_values)):
+        if expected is None:
+            assert np.all(np.isnan(actual)), 'position %d' % i
+        else:
+            assert np.allclose(expected, actual, rtol=1e-9, atol=1e-9), 'position %d' % i
+
+BARS  = random_bars(500)
+CLOSE = np.array([bar.close for bar in BARS])
+HIGH  = np.array([bar.high  for bar in BARS])
+LOW   = np.array([bar.low   for bar in BARS])
+
+def windows(values: np.ndarray, period: int):
+    return [values[i - period + 1:i + 1] for i in range(period - 1, len(values))]
+
+@pytest.mark.parametrize('indicator, values, reference', [
+    (SMA(10),        CLOSE, np.mean),
+    (WMA(10),        CLOSE, lambda w: np.dot(w, np.arange(1, 11)) / 55),
+    (RollingMin(10), LOW,   np.min),
+    (RollingMax(10), HIGH,  np.max)
+])
+def test_streaming_indicators_match_window_references(indicator, values, reference):
+    result = streamed(indicator, BARS)
+
+    assert result[:9] == [None] * 9
+    assert np.allclose(result[9:], [reference(w) for w in windows(values, 10)])
+
+@pytest.mark.parametrize('indicator, function', [
+    (SMA(10),        lambda: vectorized.sma(CLOSE, 10)),
+    (EMA(10),        lambda: vectorized.ema(CLOSE, 10)),
+    (WMA(10),        lambda: vectorized.wma(CLOSE, 10)),
+    (RollingMin(10), lambda: vectorized.rolling_min(LOW,  10)),
+    (RollingMax(10), lambda: vectorized.rolling_max(HIGH, 10)),
+    (RSI(14),        lambda: vectorized.rsi(CLOSE, 14)),
+    (ATR(14),        lambda: vectorized.atr(HIGH, LOW, CLOSE, 14))
+])
+def test_streaming_and_vectorized_indicators_agree(indicator, function):
+    assert_matches(streamed(indicator, BARS), function())
+
+def test_bollinger_bands_agree():
+    bands = vectorized.bollinger_bands(CLOSE, 20, 2)
+
+    assert_matches(streamed(BollingerBands(20, 2), BARS), np.column_stack([bands.middle, bands.upper, bands.lower]))
+
+def test_macd_agrees():
+    value = vectorized.macd(CLOSE, 12, 26, 9)
+
+    assert_matches(streamed(MACD(12, 26, 9), BARS), np.column_stack([value.macd, value.signal, value.histogram]))
+
+def test_seed_matches_updates():
+    seeded = SMA(5)
+    seeded.seed(BARS[:50])
+
+    assert seeded.value == pytest.approx(CLOSE[45:50].mean())
\ No newline at end of file
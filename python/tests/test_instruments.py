@@ -0,0 +1,83 @@
+import pytest
+from time      import sleep
+from .conftest import INSTRUMENT
+
+@pytest.fixture
+def instruments(server):
+    instruments = {
+        'EURUSD': INSTRUMENT,
+        'GBPUSD': dict(INSTRUMENT, desc='Pound Sterling vs US Dollar', bcurrency='GBP')
+    }
+
+    server.set_instruments(instruments)
+
+    return instruments
+
+def commands(server):
+    return [command for command, _ in server.requests()]
+
+def test_get_instruments_requests_only_missing_symbols(server, client, instruments):
+    client.get_instrument('EURUSD')
+
+    result = client.get_instruments(['EURUSD', 'GBPUSD', 'XXXYYY'])
+
+    assert sorted(result) == ['EURUSD', 'GBPUSD']
+    assert result['GBPUSD'].base_currency == 'GBP'
+    assert server.requests()[-1] == ('getInstruments', {'symbols': ['GBPUSD', 'XXXYYY']})
+
+    # Both are cached now.
+    client.get_instruments(['EURUSD', 'GBPUSD'])
+    client.get_instrument('GBPUSD')
+
+    assert commands(server).count('getInstruments') == 1
+
+def test_get_all_instruments_replaces_cache(server, client, instruments):
+    result = client.get_instruments('*')
+
+    assert sorted(result) == ['EURUSD', 'GBPUSD']
+    assert client.get_instrument('EURUSD').description == INSTRUMENT['desc']
+    assert 'getInstrument' not in commands(server)
+
+def test_snapshot_round_trip(server, make_client, instruments, tmp_path):
+    path = str(tmp_path / 'instruments.json')
+
+    first = make_client()
+    first.get_instruments('*')
+    first.save_instruments(path)
+
+    second = make_client()
+    loaded = second.load_instruments(path)
+
+    assert sorted(loaded) == ['EURUSD', 'GBPUSD']
+
+    for symbol, instrument in first.get_instruments(['EURUSD', 'GBPUSD']).items():
+        assert vars(loaded[symbol]) == vars(instrument)
+
+    request_count = len(server.requests())
+    second.get_instrument('GBPUSD')
+
+    assert len(server.requests()) == request_count
+
+def test_invalid_snapshot_raises_value_error(client, tmp_path):
+    path = tmp_path / 'instruments.json'
+    path.write_text('{"EURUSD": {"desc": 1}}')
+
+    with pytest.raises(ValueError):
+        client.load_instruments(str(path))
+
+
+def test_invalid_levels_response_does_not_escape_process_events(server, make_client, instruments):
+    client = make_client(instrument_ttl=0.05)
+    client.get_instrument('EURUSD')
+
+    server.set_response('getInstrumentLevels', {'EURUSD': {'minstop': 'x'}})
+    sleep(0.1)
+
+    client.process_events()
+
+    assert commands(server).count('getInstrumentLevels') == 1
+
+    # Failed refreshes are not retried before `instrument_ttl` elapses again.
+    client.process_events()
+
+    assert commands(server).count('getInstrumentLevels') == 1
\ No newline at end of file
@@ -0,0 +1,90 @@
+import pytest
+import threading
+from rmt.metrics import Registry
+
+def test_exposition_is_in_openmetrics_text_format():
+    registry = Registry()
+    requests = registry.counter('rmt_requests', 'Requests, by "command".', ['command', 'code'])
+    backlog  = registry.gauge('rmt_backlog', 'Events\nwaiting.')
+    duration = registry.histogram('rmt_duration_seconds', 'Durations.')
+
+    registry.gauge('rmt_cache_size', 'Cached ticks, by symbol.', ['symbol'], function=lambda: {('EURUSD',): 3})
+
+    requests.labels('getTick', 0).inc()
+    requests.labels('getTick', 0).inc(2)
+    backlog.set(1.5)
+    duration.observe(0.5)
+
+    lines = registry.exposition().split('\n')
+
+    assert lines[:9] == [
+        '# HELP rmt_requests Requests, by \\"command\\".',
+        '# TYPE rmt_requests counter',
+        'rmt_requests_total{command="getTick",code="0"} 3',
+        '# HELP rmt_backlog Events\\nwaiting.',
+        '# TYPE rmt_backlog gauge',
+        'rmt_backlog 1.5',
+        '# HELP rmt_duration_seconds Durations.',
+        '# TYPE rmt_duration_seconds histogram',
+        'rmt_duration_seconds_bucket{le="9.5367431640625e-07"} 0'
+    ]
+    assert 'rmt_duration_seconds_bucket{le="1.0"} 1' in lines
+    assert 'rmt_duration_seconds_bucket{le="+Inf"} 1' in lines
+    assert lines[-7:] == [
+        'rmt_duration_seconds_count 1',
+        'rmt_duration_seconds_sum 0.5',
+        '# HELP rmt_cache_size Cached ticks, by symbol.',
+        '# TYPE rmt_cache_size gauge',
+        'rmt_cache_size{symbol="EURUSD"} 3',
+        '# EOF',
+        ''
+    ]
+
+def test_label_values_are_normalized_to_strings():
+    registry = Registry()
+    requests = registry.counter('rmt_requests', 'Requests, by code.', ['code'])
+
+    requests.labels(0).inc()
+    requests.labels('0').inc()
+
+    assert requests.labels(0) is requests.labels('0')
+    assert requests.samples() == [('', {'code': '0'}, 2)]
+
+def test_counters_increased_by_many_threads_count_every_increment():
+    registry = Registry()
+    ticks    = registry.counter('rmt_ticks', 'Ticks.')
+
+    def count():
+        for _ in range(10000):
+            ticks.inc()
+
+    threads = [threading.Thread(target=count) for _ in range(4)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert ticks.samples() == [('', {}, 40000)]
+
+def test_invalid_updates_and_registrations_raise_value_error():
+    registry = Registry()
+    requests = registry.counter('rmt_requests', 'Requests, by code.', ['code'])
+
+    with pytest.raises(ValueError):
+        requests.labels()
+
+    with pytest.raises(ValueError):
+        requests.labels('0').inc(-1)
+
+    with pytest.raises(ValueError):
+        registry.gauge('rmt_requests', 'Duplicate.')
+
+    with pytest.raises(ValueError):
+        registry.gauge('rmt requests', 'Invalid name.')
+
+def test_client_exports_batch_size_of_process_events(server, client):
+    client.process_events()
+
+    assert 'rmt_process_events_batch_size 0' in client.metrics.exposition().split('\n')
\ No newline at end of file
@@ -0,0 +1,65 @@
+import threading
+import numpy as np
+import pytest
+from rmt import BacktestExchange, BarArray, MultiExchange, OrderType, Side
+
+class RecordingExchange(BacktestExchange):
+    """Backtest exchange which records the threads calling its methods."""
+
+    def __init__(self, symbol: str):
+        opens = np.array([1.0, 1.1])
+
+        super().__init__({symbol: BarArray(np.array([0, 60], dtype='datetime64[s]'), opens, opens, opens, opens)})
+
+        self.threads = set()
+
+    def subscriptions(self):
+        self.threads.add(threading.current_thread())
+        return super().subscriptions()
+
+    def orders(self):
+        self.threads.add(threading.current_thread())
+        return super().orders()
+
+    def find_orders(self, *args, **kwargs):
+        self.threads.add(threading.current_thread())
+        return super().find_orders(*args, **kwargs)
+
+@pytest.fixture
+def exchanges():
+    exchanges = {'a': RecordingExchange('EURUSD'), 'b': RecordingExchange('US100')}
+
+    for symbol, exchange in zip(['EURUSD', 'US100'], exchanges.values()):
+        exchange.subscribe(symbol)
+        exchange.run()
+
+    return exchanges
+
+@pytest.fixture
+def multi(exchanges):
+    multi = MultiExchange(exchanges, routes={'EURUSD': 'a', 'US100': 'b'})
+
+    yield multi
+
+    multi.shutdown()
+
+def test_wrapped_exchanges_are_only_called_from_their_threads(exchanges, multi):
+    assert multi.subscriptions() == {'EURUSD', 'US100'}
+
+    multi.orders()
+    multi.find_orders()
+    multi.find_orders('US100')
+
+    for exchange in exchanges.values():
+        assert len(exchange.threads) == 1
+        assert threading.current_thread() not in exchange.threads
+
+    assert exchanges['a'].threads != exchanges['b'].threads
+
+def test_orders_placed_on_wrapped_exchanges_are_routed_to_them(exchanges, multi):
+    ticket = exchanges['b'].place_order('US100', Side.BUY, OrderType.MARKET_ORDER, 1)
+
+    multi.close_order(ticket)
+
+    assert exchanges['b'].metrics()['trades'] == 1
+    assert threading.current_thread() not in exchanges['b'].threads
\ No newline at end of file
@@ -0,0 +1,83 @@
+import pytest
+from rmt            import Optimizer, OrderType, Side, Strategy
+from rmt.backtest   import Metrics
+from .test_backtest import flat_bars
+
+class HoldFor(Strategy):
+    """Buys `lots` on the first tick and closes the order after `hold` more ticks."""
+
+    def __init__(self, exchange, symbols, lots: float = 1, hold: int = 1):
+        super().__init__(exchange, symbols)
+
+        self._lots   = lots
+        self._hold   = hold
+        self._ticks  = 0
+        self._ticket = None
+
+    def on_tick(self, symbol, server_time, bid, ask):
+        if self._ticks == 0:
+            self._ticket = self.exchange.place_order(symbol, Side.BUY, OrderType.MARKET_ORDER, self._lots)
+        elif self._ticks == self._hold:
+            self.exchange.close_order(self._ticket)
+
+        self._ticks += 1
+
+class Fail(Strategy):
+    def __init__(self, exchange, symbols):
+        raise RuntimeError('bad strategy')
+
+def losing(metrics: Metrics) -> bool:
+    return metrics['equity'] < 0
+
+@pytest.fixture
+def make_optimizer():
+    optimizers = []
+
+    def make(strategy_class, opens) -> Optimizer:
+        optimizer = Optimizer(strategy_class, {'EURUSD': flat_bars(opens)}, max_workers=2)
+        optimizers.append(optimizer)
+
+        return optimizer
+
+    yield make
+
+    for optimizer in optimizers:
+        optimizer.close()
+
+def test_grid_and_random_sample_make_sets_of_parameters():
+    assert Optimizer.grid({'lots': [1, 2], 'hold': [3]}) == [{'lots': 1, 'hold': 3}, {'lots': 2, 'hold': 3}]
+
+    sample = Optimizer.random_sample({'lots': [1, 2], 'hold': lambda r: r.randint(1, 3)}, 5, seed=1)
+
+    assert sample == Optimizer.random_sample({'lots': [1, 2], 'hold': lambda r: r.randint(1, 3)}, 5, seed=1)
+    assert all(params['lots'] in (1, 2) and 1 <= params['hold'] <= 3 for params in sample)
+
+def test_run_returns_results_in_order_of_parameters(make_optimizer):
+    optimizer = make_optimizer(HoldFor, [1.0, 1.1, 1.2, 1.3])
+    params    = Optimizer.grid({'lots': [1, 2], 'hold': [1, 3]})
+    results   = optimizer.run(params)
+
+    assert [result.params for result in results] == params
+    assert [result.metrics['net_profit'] for result in results] == pytest.approx([0.1, 0.3, 0.2, 0.6])
+    assert not any(result.stopped for result in results)
+    assert all(result.metrics['bars'] == 4 for result in results)
+
+def test_early_stop_stops_bad_runs(make_optimizer):
+    optimizer = make_optimizer(HoldFor, [1.0, 0.9, 0.8, 1.5, 1.6])
+    results   = optimizer.run([{'hold': 1}, {'hold': 4}], early_stop=losing, check_every=2)
+
+    # The first run closes its order at a loss before the first check, the second
+    # one is checked while its order is losing.
+    assert [result.stopped for result in results] == [True, True]
+    assert [result.metrics['bars'] for result in results] == [2, 2]
+
+    results = optimizer.run([{'hold': 4}], early_stop=losing, check_every=4)
+
+    assert results[0].stopped is False
+    assert results[0].metrics['net_profit'] == pytest.approx(0.6)
+
+def test_run_raises_exceptions_of_runs(make_optimizer):
+    optimizer = make_optimizer(Fail, [1.0])
+
+    with pytest.raises(RuntimeError, match='bad strategy'):
+        optimizer.run([{}])
\ No newline at end of file
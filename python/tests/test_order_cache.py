@@ -0,0 +1,87 @@
+import time
+import pytest
+from datetime import datetime, timezone
+from rmt      import Order, OrderCache, OrderStatus, OrderType, Side
+
+def make_order(symbol: str = 'EURUSD',
+               side:   Side = Side.BUY,
+               status: OrderStatus = OrderStatus.FILLED,
+               magic:  int = 0
+) -> Order:
+    return Order(
+        symbol       = symbol,
+        side         = side,
+        type         = OrderType.MARKET_ORDER,
+        lots         = 1.0,
+        status       = status,
+        open_price   = 1.1,
+        open_time    = datetime(2024, 1, 1, tzinfo=timezone.utc),
+        magic_number = magic
+    )
+
+def test_find_uses_all_filters():
+    cache = OrderCache()
+    cache.set(1, make_order('EURUSD', Side.BUY,  OrderStatus.FILLED,  magic=1))
+    cache.set(2, make_order('EURUSD', Side.SELL, OrderStatus.FILLED,  magic=1))
+    cache.set(3, make_order('GBPUSD', Side.BUY,  OrderStatus.PENDING, magic=2))
+    cache.set(4, make_order('EURUSD', Side.BUY,  OrderStatus.CLOSED,  magic=1))
+
+    assert set(cache.find()) == {1, 2, 3, 4}
+    assert set(cache.find(symbol='EURUSD')) == {1, 2, 4}
+    assert set(cache.find(symbol='EURUSD', side=Side.BUY)) == {1, 4}
+    assert set(cache.find(magic_number=1, status=OrderStatus.FILLED)) == {1, 2}
+    assert set(cache.find(status=[OrderStatus.PENDING, OrderStatus.CLOSED])) == {3, 4}
+    assert cache.find(symbol='USDJPY') == {}
+
+def test_indexes_follow_replaced_and_removed_orders():
+    cache = OrderCache()
+    cache.set(1, make_order(status=OrderStatus.PENDING))
+    cache.set(1, make_order(status=OrderStatus.FILLED, side=Side.SELL))
+
+    assert cache.find(status=OrderStatus.PENDING) == {}
+    assert cache.find(side=Side.BUY) == {}
+    assert set(cache.find(side=Side.SELL, status=OrderStatus.FILLED)) == {1}
+
+    assert cache.remove(1) is not None
+    assert 1 not in cache
+    assert cache.find(symbol='EURUSD') == {}
+
+def test_evicts_least_recently_used_final_orders():
+    cache = OrderCache(max_final_orders=2)
+    cache.set(1, make_order(status=OrderStatus.CLOSED))
+    cache.set(2, make_order(status=OrderStatus.CLOSED))
+    cache.get(1)
+    cache.set(3, make_order(status=OrderStatus.CLOSED))
+
+    # Active orders are never evicted.
+    cache.set(4, make_order(status=OrderStatus.FILLED))
+
+    assert set(cache) == {1, 3, 4}
+    assert set(cache.find(status=OrderStatus.CLOSED)) == {1, 3}
+
+def test_evicts_final_orders_by_age():
+    cache = OrderCache(max_final_age=0.05)
+    cache.set(1, make_order(status=OrderStatus.CANCELED))
+    cache.set(2, make_order(status=OrderStatus.FILLED))
+
+    time.sleep(0.1)
+    cache.evict()
+
+    assert set(cache) == {2}
+
+def test_restores_evicted_orders_from_archive(tmp_path):
+    cache = OrderCache(max_final_orders=1, archive_path=str(tmp_path / 'orders'))
+
+    try:
+        cache.set(1, make_order(status=OrderStatus.CLOSED))
+        cache.set(2, make_order(status=OrderStatus.CLOSED))
+
+        assert 1 not in cache
+
+        order = cache.restore(1)
+
+        assert order is not None and order.status() == OrderStatus.CLOSED
+        assert 1 in cache and 2 not in cache
+        assert cache.restore(3) is None
+    finally:
+        cache.close()
@@ -0,0 +1,86 @@
+from rmt       import OrderStatus, OrderType, Side
+from .conftest import process_until
+
+PENDING_ORDER = {
+    'opcode':     2,
+    'status':     'pending',
+    'symbol':     'EURUSD',
+    'lots':       1.0,
+    'op':         1.1,
+    'ot':         1000,
+    'commission': 0.0,
+    'profit':     0.0,
+    'swap':       0.0
+}
+"""Buy limit order in the format of a `getOrder` response."""
+
+def connect_signals(client):
+    emitted = []
+
+    for name in ['order_placed', 'order_filled', 'order_closed', 'order_canceled', 'order_expired']:
+        getattr(client, name).connect(lambda order, name=name: emitted.append((name, order)))
+
+    return emitted
+
+def test_order_events_update_cache_and_emit_signals(server, client):
+    emitted = connect_signals(client)
+
+    server.publish_order(9, PENDING_ORDER)
+    process_until(client, lambda: len(emitted) == 1)
+
+    assert client.get_order(9).status() == OrderStatus.PENDING
+
+    server.publish_order(9, dict(PENDING_ORDER, opcode=0, status='filled'))
+    process_until(client, lambda: len(emitted) == 2)
+
+    order = client.get_order(9)
+
+    assert order.type() == OrderType.MARKET_ORDER
+    assert order.side() == Side.BUY
+    assert [name for name, _ in emitted] == ['order_placed', 'order_filled']
+
+    # Order requests are answered from the cache.
+    assert not any(command == 'getOrder' for command, _ in server.requests())
+
+def test_events_which_keep_status_update_order_without_signal(server, client):
+    emitted = connect_signals(client)
+
+    server.publish_order(9, dict(PENDING_ORDER, opcode=0, status='filled'))
+    server.publish_order(9, dict(PENDING_ORDER, opcode=0, status='filled', sl=1.0))
+    process_until(client, lambda: len(emitted) == 1 and client.get_order(9).stop_loss() == 1.0)
+
+    assert [name for name, _ in emitted] == ['order_filled']
+
+def test_place_and_close_order_track_orders(server, client):
+    server.set_response('placeOrder', {
+        'ticket':     7,
+        'lots':       1.0,
+        'op':         1.1,
+        'ot':         1000,
+        'commission': 0.0,
+        'profit':     0.0,
+        'swap':       0.0
+    })
+    server.set_response('closeOrder', {
+        'cp':         1.2,
+        'ct':         2000,
+        'lots':       0.4,
+        'comment':    '',
+        'commission': 0.0,
+        'profit':     4.0,
+        'swap':       0.0,
+        'new_order':  {'ticket': 8, 'lots': 0.6}
+    })
+
+    emitted = connect_signals(client)
+    ticket  = client.place_order('EURUSD', Side.BUY, OrderType.MARKET_ORDER, 1.0)
+
+    assert ticket == 7
+    assert client.get_order(7).status() == OrderStatus.FILLED
+
+    assert client.close_order(7, lots=0.4) == 8
+    assert client.get_order(7).status() == OrderStatus.CLOSED
+    assert client.get_order(7).lots() == 0.4
+    assert client.get_order(8).lots() == 0.6
+    assert [name for name, _ in emitted] == ['order_filled', 'order_closed']
+    assert set(client.find_orders(status=OrderStatus.FILLED)) == {8}
\ No newline at end of file
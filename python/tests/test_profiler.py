@@ -0,0 +1,109 @@
+import logging
+import pytest
+import threading
+from time import sleep
+from rmt  import Profiler, Signal, profiler as profiling
+
+class Emitter:
+    ticked = Signal(str)
+
+class Owner:
+    pass
+
+@pytest.fixture
+def warnings(caplog):
+    """Messages of warnings logged by profilers."""
+
+    caplog.set_level(logging.WARNING, logger=Profiler.__name__)
+
+    return lambda: [record.getMessage() for record in caplog.records if record.name == Profiler.__name__]
+
+@pytest.fixture
+def enabled():
+    """Enables profilers, and disables and closes them after the test."""
+
+    profilers = []
+
+    def enable(profiler: Profiler) -> Profiler:
+        profilers.append(profiler)
+        return profiling.enable(profiler)
+
+    yield enable
+
+    for profiler in profilers:
+        profiler.close()
+
+def test_calls_exceeding_budget_are_reported(warnings):
+    profiler = Profiler(budget=0.01)
+    owner    = Owner()
+
+    profiler.call(owner, 'on_tick', 'EURUSD', sleep, 0.02)
+    profiler.call(owner, 'on_tick', 'EURUSD', sleep, 0)
+
+    assert len(warnings()) == 1
+    assert 'Owner#1 on_tick (EURUSD) took' in warnings()[0]
+    assert profiler.histograms()[('Owner#1', 'on_tick', 'EURUSD')].count == 2
+
+def test_only_nested_calls_exceeding_budget_are_reported(warnings):
+    profiler = Profiler(budget=0.01)
+
+    def outer():
+        profiler.call(Owner(), 'on_tick', 'EURUSD', sleep, 0.02)
+
+    profiler.call(outer, 'tick_received', 'EURUSD', outer)
+
+    assert len(warnings()) == 1
+    assert warnings()[0].startswith('Owner#1 on_tick')
+
+def test_watchdog_reports_running_calls_with_their_stack(warnings, enabled):
+    profiler = enabled(Profiler(budget=0.02, stack_samples=True))
+
+    def stuck_slot():
+        sleep(0.2)
+
+    profiler.call(stuck_slot, 'tick_received', 'EURUSD', stuck_slot)
+
+    # The call was reported while it was running, so it isn't reported again once it returns.
+    assert len(warnings()) == 1
+    assert 'stuck_slot tick_received (EURUSD) has been running for' in warnings()[0]
+    assert 'stuck_slot' in warnings()[0]
+
+def test_watchdog_runs_only_while_profiler_is_enabled(enabled):
+    profiler = enabled(Profiler(budget=0.02, stack_samples=True))
+
+    assert any(thread.name == 'rmt-profiler-watchdog' for thread in threading.enumerate())
+
+    profiling.disable()
+
+    assert not any(thread.name == 'rmt-profiler-watchdog' for thread in threading.enumerate())
+
+def test_running_calls_of_finished_threads_are_not_kept():
+    profiler = Profiler()
+    owner    = Owner()
+    threads  = [threading.Thread(target=profiler.call, args=(owner, 'on_tick', '', sleep, 0)) for _ in range(3)]
+
+    for thread in threads:
+        thread.start()
+        thread.join()
+
+    assert profiler._running == {}
+    assert profiler.histograms()[('Owner#1', 'on_tick', '')].count == 3
+
+def test_signal_slots_are_timed_only_while_profiler_is_enabled(enabled):
+    emitter = Emitter()
+    symbols = []
+
+    emitter.ticked.connect(symbols.append)
+    emitter.ticked.emit('EURUSD')
+
+    profiler = enabled(Profiler())
+    emitter.ticked.emit('GBPUSD')
+
+    profiling.disable()
+    emitter.ticked.emit('USDJPY')
+
+    assert symbols == ['EURUSD', 'GBPUSD', 'USDJPY']
+    assert [(key.callback, key.symbol, histogram.count) for key, histogram in profiler.histograms().items()] == [
+        ('ticked', 'GBPUSD', 1)
+    ]
+    assert profiling.enabled is False
\ No newline at end of file
@@ -0,0 +1,99 @@
+import threading
+import pytest
+from time                    import sleep
+from rmt.exchanges.mt4       import MetaTrader4
+from rmt.exchanges.mt4.proxy import Proxy
+from .conftest               import free_port, process_until
+
+@pytest.fixture
+def proxy_ports():
+    """Free ports for the ROUTER and XPUB sockets of a `Proxy`."""
+
+    return free_port(), free_port()
+
+@pytest.fixture
+def proxy(server, ports, proxy_ports):
+    """A `Proxy` forwarding to `server`, running on a background thread."""
+
+    proxy = Proxy(
+        upstream_host     = '127.0.0.1',
+        upstream_req_port = ports[0],
+        upstream_sub_port = ports[1],
+        router_port       = proxy_ports[0],
+        xpub_port         = proxy_ports[1]
+    )
+    thread = threading.Thread(target=proxy.run, kwargs={'poll_timeout_ms': 10})
+    thread.start()
+
+    yield proxy
+
+    proxy.stop()
+    thread.join()
+    proxy.close()
+
+@pytest.fixture
+def make_proxy_client(proxy, proxy_ports):
+    """Factory of `MetaTrader4` clients connected to `proxy`."""
+
+    clients = []
+
+    def make() -> MetaTrader4:
+        client = MetaTrader4(host='127.0.0.1', req_port=proxy_ports[0], sub_port=proxy_ports[1])
+        clients.append(client)
+
+        return client
+
+    yield make
+
+    for client in clients:
+        client.disconnect()
+
+def receive_ticks(client):
+    ticks = []
+    client.tick_received.connect(lambda symbol, tick: ticks.append(tick.bid))
+
+    return ticks
+
+def publish_until(server, clients, bid: float):
+    """Publishes ticks of EURUSD at `bid` until every one of `clients` received one."""
+
+    def received() -> bool:
+        server.publish_tick('EURUSD', 1704067200, bid, bid + 0.1)
+        sleep(0.01)
+
+        for client, ticks in clients:
+            client.process_events()
+
+        return all(bid in ticks for _, ticks in clients)
+
+    process_until(clients[0][0], received)
+
+def watch_requests(server):
+    return [content for command, content in server.requests() if command == 'watchSymbol']
+
+def test_watch_symbol_is_forwarded_once_per_symbol(server, proxy, make_proxy_client):
+    first, second = make_proxy_client(), make_proxy_client()
+
+    first.subscribe('EURUSD')
+    second.subscribe('EURUSD')
+    second.subscribe('GBPUSD')
+
+    assert watch_requests(server) == [{'symbol': 'EURUSD'}, {'symbol': 'GBPUSD'}]
+    assert proxy.watched_symbols() == {'EURUSD', 'GBPUSD'}
+    assert proxy.watch_requests_saved() == 1
+
+def test_events_reach_clients_while_any_is_subscribed(server, proxy, make_proxy_client):
+    first, second = make_proxy_client(), make_proxy_client()
+    first_ticks, second_ticks = receive_ticks(first), receive_ticks(second)
+
+    first.subscribe('EURUSD')
+    second.subscribe('EURUSD')
+    publish_until(server, [(first, first_ticks), (second, second_ticks)], 1.0)
+
+    # The proxy stays subscribed upstream as long as one client is.
+    first.unsubscribe('EURUSD')
+    publish_until(server, [(second, second_ticks)], 2.0)
+
+    first.process_events()
+
+    assert 2.0 not in first_ticks
\ No newline at end of file
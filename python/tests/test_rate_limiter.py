@@ -0,0 +1,98 @@
+import pytest
+from rmt               import RateLimiter, TokenBucket, error
+from rmt.exchanges.mt4 import CommandResultCode
+
+class FakeClock:
+    def __init__(self):
+        self.now    = 0.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+def test_token_bucket_allows_bursts_then_sustained_rate():
+    clock  = FakeClock()
+    bucket = TokenBucket(rate=2, capacity=2, clock=clock)
+
+    assert bucket.try_acquire() == 0
+    assert bucket.try_acquire() == 0
+    assert bucket.try_acquire() == pytest.approx(0.5)
+
+    clock.now = 0.25
+
+    assert bucket.try_acquire() == pytest.approx(0.25)
+
+    clock.now = 0.5
+
+    assert bucket.try_acquire() == 0
+
+def test_backoff_grows_up_to_maximum_and_decays_on_success():
+    clock   = FakeClock()
+    limiter = RateLimiter(min_backoff=1, max_backoff=3, backoff_factor=2, clock=clock, sleep=clock.sleep)
+
+    limiter.throttled()
+    assert limiter.backoff == 1
+
+    limiter.throttled()
+    assert limiter.backoff == 2
+
+    limiter.throttled()
+    assert limiter.backoff == 3
+
+    # Requests are paused until the last backoff elapses.
+    limiter.acquire()
+    assert clock.sleeps == [3]
+
+    limiter.succeeded()
+    assert limiter.backoff == 1.5
+
+    limiter.succeeded()
+    assert limiter.backoff == 0
+
+def test_rate_limited_acquire_waits_for_tokens():
+    clock   = FakeClock()
+    limiter = RateLimiter(rate=10, burst=1, clock=clock, sleep=clock.sleep)
+
+    limiter.acquire()
+    limiter.acquire()
+
+    assert clock.sleeps == [pytest.approx(0.1)]
+
+def throttle_first(count: int, content=None):
+    """Returns a handler which reports being busy `count` times, then succeeds with `content`."""
+
+    calls = [0]
+
+    def handler(request_content):
+        calls[0] += 1
+
+        if calls[0] <= count:
+            return CommandResultCode.TRADE_CONTEXT_BUSY, None
+
+        return CommandResultCode.SUCCESS, content
+
+    return handler
+
+def command_count(server, command: str) -> int:
+    return [c for c, _ in server.requests()].count(command)
+
+def test_idempotent_requests_are_retried_when_throttled(server, make_client):
+    server.set_handler('getTick', throttle_first(2, {'time': 1704067200, 'bid': 1.0, 'ask': 1.1}))
+    client = make_client(max_retries=2, data_limiter=RateLimiter(min_backoff=0.001))
+
+    assert client.get_tick('EURUSD').bid == 1.0
+    assert command_count(server, 'getTick') == 3
+
+def test_trade_operations_are_not_retried_when_throttled(server, make_client):
+    server.set_handler('modifyOrder', throttle_first(1))
+    client = make_client(max_retries=2, trading_limiter=RateLimiter(min_backoff=0.001))
+
+    with pytest.raises(error.ExecutionError) as exc_info:
+        client.modify_order(1, stop_loss=1.0)
+
+    assert exc_info.value.code == CommandResultCode.TRADE_CONTEXT_BUSY
+    assert command_count(server, 'modifyOrder') == 1
\ No newline at end of file
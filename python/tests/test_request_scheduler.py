@@ -0,0 +1,52 @@
+import threading
+from time                       import monotonic, sleep
+from rmt.exchanges.mt4          import RequestScheduler
+from rmt.exchanges.mt4.requests import RequestPriority
+
+def wait_for(condition, timeout: float = 2.0):
+    deadline = monotonic() + timeout
+
+    while not condition():
+        assert monotonic() < deadline, 'condition not met within %s seconds' % timeout
+        sleep(0.001)
+
+def test_waiting_requests_go_by_priority_then_arrival():
+    scheduler = RequestScheduler()
+    order     = []
+    threads   = []
+
+    def send(name: str, priority: RequestPriority):
+        scheduler.acquire(priority)
+        order.append(name)
+        scheduler.release()
+
+    # Keep the scheduler busy while requests start waiting, one at a time.
+    scheduler.acquire(RequestPriority.QUERY)
+
+    for name, priority in [('history 1', RequestPriority.HISTORY),
+                           ('query',     RequestPriority.QUERY),
+                           ('history 2', RequestPriority.HISTORY),
+                           ('trading',   RequestPriority.TRADING)]:
+        thread = threading.Thread(target=send, args=(name, priority))
+        thread.start()
+        threads.append(thread)
+
+        wait_for(lambda: scheduler.waiting() == len(threads))
+
+    scheduler.release()
+
+    for thread in threads:
+        thread.join()
+
+    assert order == ['trading', 'query', 'history 1', 'history 2']
+    assert scheduler.waiting() == 0
+
+def test_request_is_sent_at_once_when_scheduler_is_free():
+    scheduler = RequestScheduler()
+
+    scheduler.acquire(RequestPriority.HISTORY)
+    scheduler.release()
+    scheduler.acquire(RequestPriority.TRADING)
+    scheduler.release()
+
+    assert scheduler.waiting() == 0
\ No newline at end of file
@@ -0,0 +1,99 @@
+import numpy as np
+from rmt                 import BarArray, Timeframe
+from rmt.resampler       import Resampler, resample
+from rmt.tick_aggregator import TICK_DTYPE, TickAggregator, TickPrice, aggregate_ticks
+
+START = 1704067200 # 2024-01-01 00:00:00 UTC
+
+def random_m1_bars(count: int, seed: int = 1) -> BarArray:
+    rng   = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 1, count))
+    open  = np.concatenate([[100.0], close[:-1]])
+
+    return BarArray(
+        time   = (START + 60 * np.arange(count)).astype('datetime64[s]'),
+        open   = open,
+        high   = np.maximum(open, close) + rng.uniform(0, 1, count),
+        low    = np.minimum(open, close) - rng.uniform(0, 1, count),
+        close  = close,
+        volume = rng.integers(1, 100, count)
+    )
+
+def random_ticks(count: int, seed: int = 1) -> np.ndarray:
+    rng   = np.random.default_rng(seed)
+    ticks = np.empty(count, dtype=TICK_DTYPE)
+
+    ticks['time'] = START + np.cumsum(rng.uniform(0, 5, count))
+    ticks['bid']  = 100 + np.cumsum(rng.normal(0, 0.1, count))
+    ticks['ask']  = ticks['bid'] + 0.02
+
+    return ticks
+
+def assert_same_bars(expected: BarArray, actual: BarArray):
+    assert len(expected) == len(actual)
+
+    for name in ('time', 'open', 'high', 'low', 'close', 'volume'):
+        assert np.array_equal(getattr(expected, name), getattr(actual, name)), name
+
+def test_resample_merges_bars_into_timeframe():
+    bars   = random_m1_bars(120)
+    hourly = resample(bars, Timeframe.H1)
+
+    assert len(hourly) == 2
+    assert hourly.time[1] == np.datetime64(START + 3600, 's')
+    assert hourly.open[0]   == bars.open[0]
+    assert hourly.close[0]  == bars.close[59]
+    assert hourly.high[1]   == bars.high[60:].max()
+    assert hourly.low[1]    == bars.low[60:].min()
+    assert hourly.volume[0] == bars.volume[:60].sum()
+
+def test_resampler_chunks_match_whole_array():
+    bars      = random_m1_bars(1000)
+    resampler = Resampler([Timeframe.M5, Timeframe.H1])
+    closed    = {Timeframe.M5: [], Timeframe.H1: []}
+
+    for start in range(0, len(bars), 37):
+        for tf, tf_bars in resampler.update_array(bars[start:start + 37]).items():
+            closed[tf].append(tf_bars)
+
+    for tf in (Timeframe.M5, Timeframe.H1):
+        expected = resample(bars, tf)
+
+        assert_same_bars(expected[:-1], BarArray.concatenate(closed[tf]))
+        assert_same_bars(expected[-1:], BarArray.from_bars([resampler.current_bar(tf)]))
+
+def test_resampler_updates_match_update_array():
+    bars      = random_m1_bars(200)
+    resampler = Resampler([Timeframe.M15])
+    closed    = []
+
+    for i in range(len(bars)):
+        closed.extend(resampler.update(bars[i]).values())
+
+    assert_same_bars(resample(bars, Timeframe.M15)[:-1], BarArray.from_bars(closed))
+
+def test_aggregate_ticks_in_chunks_matches_single_chunk():
+    ticks = random_ticks(5000)
+
+    for price in TickPrice:
+        whole = aggregate_ticks(ticks, Timeframe.M1, price)
+
+        assert_same_bars(whole, aggregate_ticks(ticks, Timeframe.M1, price, chunk_size=7))
+        assert whole.volume.sum() == len(ticks)
+
+def test_tick_aggregator_keeps_current_bar_until_flushed():
+    aggregator = TickAggregator(Timeframe.M1)
+
+    assert len(aggregator.update([START + 1, START + 30], [1.0, 2.0], [1.1, 2.1])) == 0
+    assert aggregator.current_bar().high == 2.0
+
+    closed = aggregator.update([START + 61], [3.0], [3.1])
+
+    assert len(closed) == 1
+    assert closed.close[0]  == 2.0
+    assert closed.volume[0] == 2
+
+    flushed = aggregator.flush()
+
+    assert flushed.open[0] == 3.0
+    assert aggregator.current_bar() is None
\ No newline at end of file
@@ -0,0 +1,29 @@
+import pytest
+from datetime import datetime, timezone
+from rmt      import BacktestExchange, Strategy, StrategyRunner, Tick, TickRing
+
+LONG_SYMBOL = 'X' * (TickRing.MAX_SYMBOL_LEN + 1)
+
+@pytest.fixture
+def runner():
+    runner = StrategyRunner(BacktestExchange({}), ring_capacity=16)
+
+    yield runner
+
+    runner.close()
+
+def test_add_strategy_rejects_symbols_too_long_for_ring(runner):
+    with pytest.raises(ValueError):
+        runner.add_strategy(Strategy, ['EURUSD', LONG_SYMBOL])
+
+def test_ticks_of_symbols_too_long_for_ring_are_skipped(runner):
+    reader = TickRing(runner._ring.name)
+    tick   = Tick(datetime(2024, 1, 1, tzinfo=timezone.utc), 1.0, 1.1)
+
+    try:
+        runner.exchange.tick_received.emit(LONG_SYMBOL, tick)
+        runner.exchange.tick_received.emit('EURUSD', tick)
+
+        assert [symbol for symbol, _ in reader.read()] == ['EURUSD']
+    finally:
+        reader.close()
\ No newline at end of file
@@ -0,0 +1,67 @@
+import pytest
+from rmt import Signal
+
+class Emitter:
+    fired = Signal(str, int)
+
+def test_slots_are_called_in_connection_order():
+    emitter = Emitter()
+    calls   = []
+
+    emitter.fired.connect(lambda s, n: calls.append(('a', s, n)))
+    emitter.fired.connect(lambda s, n: calls.append(('b', s, n)))
+    emitter.fired.emit('x', 1)
+
+    assert calls == [('a', 'x', 1), ('b', 'x', 1)]
+    assert emitter.fired.name == 'fired'
+    assert emitter.fired.types == (str, int)
+
+def test_signals_are_bound_to_each_object():
+    first, second = Emitter(), Emitter()
+    calls = []
+
+    first.fired.connect(lambda s, n: calls.append(n))
+    second.fired.emit('x', 2)
+
+    assert calls == []
+    assert first.fired is first.fired
+    assert isinstance(Emitter.fired, Signal)
+
+def test_disconnect_removes_last_connection_of_slot():
+    emitter = Emitter()
+    calls   = []
+    slot    = lambda s, n: calls.append(n)
+
+    emitter.fired.connect(slot)
+    emitter.fired.connect(slot)
+    emitter.fired.disconnect(slot)
+    emitter.fired.emit('x', 1)
+
+    assert calls == [1]
+
+    emitter.fired.disconnect()
+
+    assert emitter.fired.receivers() == 0
+
+    with pytest.raises(TypeError):
+        emitter.fired.disconnect(slot)
+
+def test_disconnecting_during_emit_affects_next_emission_only():
+    emitter = Emitter()
+    calls   = []
+
+    def first(s, n):
+        calls.append(('first', n))
+
+        if n == 1:
+            emitter.fired.disconnect(second)
+
+    def second(s, n):
+        calls.append(('second', n))
+
+    emitter.fired.connect(first)
+    emitter.fired.connect(second)
+    emitter.fired.emit('x', 1)
+    emitter.fired.emit('x', 2)
+
+    assert calls == [('first', 1), ('second', 1), ('first', 2)]
\ No newline at end of file
@@ -0,0 +1,54 @@
+import threading
+import pytest
+from time              import monotonic, sleep
+from rmt.exchanges.mt4 import SingleFlight
+
+def test_concurrent_calls_share_one_execution():
+    flight  = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls   = []
+    results = []
+
+    def fn():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return 42
+
+    def call():
+        results.append(flight.do('key', fn))
+
+    threads = [threading.Thread(target=call) for _ in range(5)]
+    threads[0].start()
+    started.wait(5)
+
+    for thread in threads[1:]:
+        thread.start()
+
+    # Wait until all followers are waiting on the leader's call.
+    deadline = monotonic() + 5
+
+    while flight.calls_saved() < 4 and monotonic() < deadline:
+        sleep(0.001)
+
+    release.set()
+
+    for thread in threads:
+        thread.join(5)
+
+    assert calls == [1]
+    assert results == [42] * 5
+    assert flight.in_flight() == 0
+
+def test_exceptions_are_shared_and_calls_are_not_cached():
+    flight = SingleFlight()
+
+    def fail():
+        raise ValueError('boom')
+
+    with pytest.raises(ValueError):
+        flight.do('key', fail)
+
+    assert flight.do('key', lambda: 1) == 1
+    assert flight.do('key', lambda: 2) == 2
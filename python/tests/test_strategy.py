@@ -0,0 +1,30 @@
+import numpy as np
+from collections import Counter
+from rmt         import BacktestExchange, BarArray, Strategy
+
+def m1_bars(count: int, price: float) -> BarArray:
+    prices = np.full(count, price)
+
+    return BarArray((1704067200 + 60 * np.arange(count)).astype('datetime64[s]'), prices, prices, prices, prices)
+
+class CountingStrategy(Strategy):
+    def __init__(self, exchange, symbols=None):
+        super().__init__(exchange, symbols)
+
+        self.closed_bars       = Counter()
+        self.closed_bar_prices = set()
+
+    def on_bar_closed(self, symbol, bar):
+        self.closed_bars[symbol] += 1
+        self.closed_bar_prices.add((symbol, bar.close))
+
+def test_bars_close_for_each_symbol():
+    exchange = BacktestExchange({'A': m1_bars(600, 1.0), 'B': m1_bars(600, 2.0)})
+    strategy = CountingStrategy(exchange)
+
+    exchange.subscribe('A')
+    exchange.subscribe('B')
+    exchange.run()
+
+    assert strategy.closed_bars == {'A': 599, 'B': 599}
+    assert strategy.closed_bar_prices == {('A', 1.0), ('B', 2.0)}
\ No newline at end of file
@@ -0,0 +1,50 @@
+import pytest
+from datetime import datetime, timezone
+from rmt      import BacktestExchange, Tick, TickRouter
+
+TICK = Tick(datetime(2024, 1, 1, tzinfo=timezone.utc), 1.0, 1.1)
+
+def recorder(calls, name):
+    return lambda symbol, tick: calls.append((name, symbol))
+
+def test_ticks_are_routed_to_handlers_of_their_symbol_and_global_handlers():
+    router = TickRouter()
+    calls  = []
+
+    router.add_handler(recorder(calls, 'eurusd'), 'EURUSD')
+    router.add_handler(recorder(calls, 'gbpusd'), 'GBPUSD')
+    router.add_handler(recorder(calls, 'all'))
+
+    router.route('EURUSD', TICK)
+    router.route('USDJPY', TICK)
+
+    assert calls == [('eurusd', 'EURUSD'), ('all', 'EURUSD'), ('all', 'USDJPY')]
+    assert router.symbols() == {'EURUSD', 'GBPUSD'}
+
+def test_removed_handlers_are_no_longer_called():
+    router  = TickRouter()
+    calls   = []
+    handler = recorder(calls, 'eurusd')
+
+    router.add_handler(handler, 'EURUSD')
+    router.remove_handler(handler, 'EURUSD')
+    router.route('EURUSD', TICK)
+
+    assert calls == []
+    assert router.symbols() == set()
+
+    with pytest.raises(ValueError):
+        router.remove_handler(handler, 'EURUSD')
+
+    with pytest.raises(ValueError):
+        router.remove_handler(handler)
+
+def test_exchange_routes_received_ticks():
+    exchange = BacktestExchange({})
+    calls    = []
+
+    exchange.tick_router.add_handler(recorder(calls, 'eurusd'), 'EURUSD')
+    exchange.tick_received.emit('GBPUSD', TICK)
+    exchange.tick_received.emit('EURUSD', TICK)
+
+    assert calls == [('eurusd', 'EURUSD')]
\ No newline at end of file
@@ -0,0 +1,36 @@
+import pytest
+from .conftest import process_until
+
+@pytest.fixture
+def serve_tick(server):
+    server.set_response('getTick', {'time': 1704067200, 'bid': 1.0, 'ask': 1.1})
+
+def tick_requests(server):
+    return [command for command, _ in server.requests()].count('getTick')
+
+def publish_tick(server, client):
+    received = []
+
+    client.tick_received.connect(lambda symbol, tick: received.append(tick))
+    client.subscribe('EURUSD')
+
+    # The subscription takes a moment to reach the PUB socket, so publish until the tick arrives.
+    def received_tick() -> bool:
+        server.publish_tick('EURUSD', 1704067260, 1.2, 1.3)
+        return len(received) > 0
+
+    process_until(client, received_tick)
+
+def test_ticks_are_requested_by_default(server, client, serve_tick):
+    publish_tick(server, client)
+
+    assert client.get_tick('EURUSD').bid == 1.0
+    assert client.get_tick('EURUSD').bid == 1.0
+    assert tick_requests(server) == 2
+
+def test_recent_ticks_are_returned_with_tick_max_age(server, make_client, serve_tick):
+    client = make_client(tick_max_age=60)
+    publish_tick(server, client)
+
+    assert client.get_tick('EURUSD').bid == 1.2
+    assert tick_requests(server) == 0
\ No newline at end of file